@@ -1,4 +1,4 @@
-"""Gemini client factory with LRU-cache for reuse across Streamlit reruns."""
+"""Gemini client factory and response cache, reused across Streamlit reruns."""
 
 from __future__ import annotations
 
@@ -6,6 +6,7 @@ from functools import lru_cache
 
 from google import genai
 
+from .response_cache import ResponseCache
 from .settings import Settings
 
 
@@ -23,3 +24,17 @@ def _cached_client(api_key: str) -> genai.Client:
 def get_client(settings: Settings) -> genai.Client:
     """Return a cached Gemini client for the given settings."""
     return _cached_client(settings.gemini_api_key)
+
+
+@lru_cache(maxsize=8)
+def _cached_response_cache(directory: str, ttl: float, max_bytes: int) -> ResponseCache:
+    return ResponseCache(directory, ttl, max_bytes)
+
+
+def get_response_cache(settings: Settings) -> ResponseCache:
+    """Return the on-disk Gemini response cache configured by settings."""
+    return _cached_response_cache(
+        settings.cache_dir,
+        settings.cache_ttl_hours * 3600,
+        int(settings.cache_max_mb * 1024 * 1024),
+    )
@@ -0,0 +1,146 @@
+"""Content-addressed on-disk cache for Gemini response text.
+
+Keys hash everything that decides a response: the model, the prompt/system
+instruction and the raw input bytes. One file per key lives under the cache
+directory, shared by the CLI and the Streamlit app. Entries expire after a
+TTL, and the least recently used ones are evicted once the directory exceeds
+its size budget.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+CACHE_VERSION = "1"
+"""Part of every key; bump it to invalidate all cached responses."""
+
+
+def response_key(model: str, *parts: str | bytes) -> str:
+    """Hash a model name and the ordered request parts into a cache key."""
+    digest = hashlib.sha256(f"{CACHE_VERSION}\0{model}".encode())
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        # Length-prefixed so part boundaries are part of the key.
+        digest.update(b"\0%d\0" % len(data))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Response text by key, with TTL and size eviction. Thread-safe.
+
+    Best-effort: filesystem errors count as misses or skipped writes, so an
+    unwritable or full cache directory never fails a Gemini call.
+    """
+
+    EVICT_EVERY = 64
+    """Writes between full directory scans while under the size budget."""
+
+    def __init__(self, directory: str | os.PathLike, ttl: float, max_bytes: int):
+        """ttl is in seconds; a ttl or max_bytes of 0 disables the cache."""
+        self.directory = Path(directory).expanduser()
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Estimated directory size; None until the first scan.
+        self._bytes: int | None = None
+        self._writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_bytes > 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> str | None:
+        """Return the cached text for key, or None if missing or expired."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            mtime = path.stat().st_mtime
+            if time.time() - mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            text = path.read_text(encoding="utf-8")
+            # Access time drives eviction; mtime stays the write time for the TTL.
+            os.utime(path, (time.time(), mtime))
+        except OSError:
+            return None
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Store text under key, evicting down to the size budget when needed."""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        tmp = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                replaced = path.stat().st_size
+            except OSError:
+                replaced = 0
+            # Written to a temporary file first so readers never see partial text.
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
+            os.replace(tmp, path)
+            tmp = None
+            with self._lock:
+                self._writes += 1
+                if self._bytes is not None:
+                    self._bytes += len(text.encode("utf-8")) - replaced
+                scan = (
+                    self._bytes is None
+                    or self._bytes > self.max_bytes
+                    or self._writes % self.EVICT_EVERY == 0
+                )
+            if scan:
+                self._evict()
+        except OSError:
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp)
+
+    def discard(self, key: str) -> None:
+        """Drop the entry for key, e.g. when its text turns out to be corrupt."""
+        with contextlib.suppress(OSError):
+            self._path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        with self._lock:
+            now = time.time()
+            entries = []
+            for path in self.directory.glob("*/*.txt"):
+                try:
+                    stat = path.stat()
+                    if now - stat.st_mtime > self.ttl:
+                        path.unlink(missing_ok=True)
+                        continue
+                except OSError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                with contextlib.suppress(OSError):
+                    path.unlink(missing_ok=True)
+                total -= size
+            self._bytes = total
+
+    def clear(self) -> None:
+        """Delete every cached response."""
+        with self._lock:
+            for path in self.directory.glob("*/*.txt"):
+                with contextlib.suppress(OSError):
+                    path.unlink(missing_ok=True)
+            self._bytes = 0
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -22,6 +24,12 @@ class Settings(BaseSettings):
 
     gemini_api_key: str = Field(default="", alias="GEMINI_API_KEY")
     model_name: str = Field(default="gemini-3-flash-preview", alias="MODEL_NAME")
+    cache_dir: str = Field(
+        default=str(Path.home() / ".cache" / "jiit-creator" / "gemini"),
+        alias="GEMINI_CACHE_DIR",
+    )
+    cache_ttl_hours: float = Field(default=24 * 30, alias="GEMINI_CACHE_TTL_HOURS")
+    cache_max_mb: float = Field(default=200, alias="GEMINI_CACHE_MAX_MB")
 
     @property
     def has_api_key(self) -> bool:
@@ -6,6 +6,9 @@ import re
 from typing import BinaryIO
 
 import pandas as pd
+from pandas.io.parsers import TextParser
+
+from .models import SubjectConfig, TimetableConfig
 
 
 def clean_json_string(json_str: str) -> str:
@@ -27,11 +30,121 @@ def normalize_time_slot(time_str: str) -> str:
     return s
 
 
-def load_dataframe(file: BinaryIO, filename: str) -> pd.DataFrame:
-    """Read an xlsx/xls/csv upload into a headerless DataFrame."""
-    if filename.lower().endswith(".csv"):
-        return pd.read_csv(file, header=None)
-    return pd.read_excel(file, header=None)
+def load_dataframe(
+    file: BinaryIO,
+    filename: str,
+    max_row: int | None = None,
+    max_col: int | None = None,
+) -> pd.DataFrame:
+    """Read an xlsx/xls/csv upload into a headerless DataFrame.
+
+    With ``max_row``/``max_col`` (1-based, inclusive) only the top-left window
+    up to those bounds is returned, with the cells an unbounded load has
+    there: 1-based config indices still apply unchanged. For xlsx only the
+    window's cells are converted, streaming a read-only workbook; the rest of
+    the window's columns is just scanned for the value types that decide each
+    column's dtype. csv and xls are read whole and sliced. Rows are trimmed
+    as in an unbounded load; columns are padded to ``max_col``.
+    """
+    name = filename.lower()
+    if name.endswith((".xlsx", ".xlsm")) and (max_row or max_col):
+        return _read_xlsx_window(file, max_row, max_col)
+    if name.endswith(".csv"):
+        df = pd.read_csv(file, header=None)
+    else:
+        df = pd.read_excel(file, header=None)
+    return df.iloc[:max_row, :max_col]
+
+
+def config_bounds(config: TimetableConfig | SubjectConfig) -> tuple[int, int]:
+    """Return the 1-based (max_row, max_col) a parsing config reads up to."""
+    if isinstance(config, TimetableConfig):
+        rows = [config.header_row, *(r.end_row for r in config.day_ranges.values())]
+        return max(rows), config.end_col
+    return (
+        max(r.end_row for r in config.ranges),
+        max(c for r in config.ranges for c in r.cols),
+    )
+
+
+def _excel_value(cell):
+    """Convert an openpyxl cell the way pandas' openpyxl reader does."""
+    from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+
+    if cell.value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return float("nan")
+    if cell.data_type == TYPE_NUMERIC:
+        as_int = int(cell.value)
+        return as_int if as_int == cell.value else float(cell.value)
+    return cell.value
+
+
+def _read_xlsx_window(
+    file: BinaryIO, max_row: int | None, max_col: int | None
+) -> pd.DataFrame:
+    """Stream the first sheet's top-left window into a headerless DataFrame."""
+    from openpyxl import load_workbook
+
+    book = load_workbook(file, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = book.worksheets[0]
+        sheet.reset_dimensions()
+        rows: list[list] = []
+        last_with_data = -1
+        # Distinct values of each window column below max_row. pandas infers
+        # a column's dtype from all of it: 17 stays 17 above text, but reads
+        # as 17.0 in a column that is otherwise numbers and blanks.
+        below: list[set] = []
+        below_width = None
+        blank_gap = False
+        for row in sheet.iter_rows():
+            has_data = any(cell.value is not None for cell in row)
+            values = [_excel_value(cell) for cell in row[:max_col]]
+            while values and values[-1] == "":
+                values.pop()
+            if max_row is None or len(rows) < max_row:
+                if has_data:
+                    last_with_data = len(rows)
+                rows.append(values)
+            elif has_data:
+                below.extend(set() for _ in range(len(values) - len(below)))
+                for column, value in zip(below, values):
+                    column.add(value)
+                # Cells past the shortest row, and every cell of a blank row
+                # that data follows, are NaN in an unbounded load.
+                if blank_gap:
+                    below_width = 0
+                elif below_width is None or len(values) < below_width:
+                    below_width = len(values)
+                blank_gap = False
+            else:
+                blank_gap = True
+    finally:
+        book.close()
+
+    if below_width is not None:
+        # Data further down: blank window rows are not trailing after all.
+        last_with_data = len(rows) - 1
+    rows = rows[: last_with_data + 1]
+    if not rows:
+        return pd.DataFrame()
+    # Padded to max_col so columns blank within the window are still present.
+    width = max(max(len(row) for row in rows), max_col or 0, len(below))
+    rows = [row + [""] * (width - len(row)) for row in rows]
+    if below_width is not None:
+        below.extend(set() for _ in range(width - len(below)))
+        for column in below[below_width:]:
+            column.add("")
+        # One probe row per distinct value joins the dtype inference and is
+        # dropped again. A column with fewer values repeats its last one, so
+        # probes never add a type the column does not have.
+        probes = [sorted(column, key=repr) for column in below]
+        for depth in range(max(len(column) for column in probes)):
+            rows.append([column[min(depth, len(column) - 1)] for column in probes])
+    df = TextParser(rows, header=None, skip_blank_lines=False).read()
+    return df.iloc[: last_with_data + 1]
 
 
 def deduplicate_subjects(subjects: list[dict]) -> list[dict]:
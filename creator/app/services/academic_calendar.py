@@ -10,6 +10,8 @@ import tempfile
 from google import genai
 from google.genai import types
 
+from ..core.gemini import get_response_cache
+from ..core.response_cache import response_key
 from ..core.settings import Settings
 from ..core.utils import clean_json_string
 
@@ -226,38 +228,56 @@ def process_pdf(
 ) -> list[dict]:
     """Write PDF bytes to a temp file, send via Gemini, return parsed JSON events.
 
-    Cleans up the temp file in a finally block.
-    Raises ValueError on JSON parse failure.
+    Responses are cached by PDF bytes, model, system instruction and schema,
+    so an unchanged PDF is not sent again. Cleans up the temp file in a
+    finally block. Raises ValueError on JSON parse failure.
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(pdf_bytes)
-        tmp_path = tmp.name
-    try:
-        prompt = (
-            "Given the academic calendar content from the uploaded file, "
-            f"extract the events strictly following this JSON schema:\n{example_schema}"
-        )
-        response = client.models.generate_content(
-            model=settings.model_name,
-            contents=[
-                types.Part.from_bytes(
-                    data=pathlib.Path(tmp_path).read_bytes(),
-                    mime_type="application/pdf",
-                ),
-                prompt,
-            ],
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                system_instruction=system_instruction,
-            ),
-        )
-        cleaned = clean_json_string(response.text)
+    prompt = (
+        "Given the academic calendar content from the uploaded file, "
+        f"extract the events strictly following this JSON schema:\n{example_schema}"
+    )
+    cache = get_response_cache(settings)
+    key = response_key(settings.model_name, system_instruction, prompt, pdf_bytes)
+    text = cache.get(key)
+    if text is not None:
+        try:
+            json.loads(clean_json_string(text))
+        except json.JSONDecodeError:
+            # Corrupt or truncated entry: drop it and make the live call.
+            cache.discard(key)
+            text = None
+    live = text is None
+    if live:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
+            tmp.write(pdf_bytes)
+            tmp_path = tmp.name
         try:
-            return json.loads(cleaned)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"Could not parse Gemini response as JSON: {e}\n\nRaw:\n{response.text}"
-            ) from e
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+            response = client.models.generate_content(
+                model=settings.model_name,
+                contents=[
+                    types.Part.from_bytes(
+                        data=pathlib.Path(tmp_path).read_bytes(),
+                        mime_type="application/pdf",
+                    ),
+                    prompt,
+                ],
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    system_instruction=system_instruction,
+                ),
+            )
+            text = response.text
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    cleaned = clean_json_string(text)
+    try:
+        events = json.loads(cleaned)
+    except json.JSONDecodeError as e:
+        raise ValueError(
+            f"Could not parse Gemini response as JSON: {e}\n\nRaw:\n{text}"
+        ) from e
+    if live:
+        cache.put(key, text)
+    return events
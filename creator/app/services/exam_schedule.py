@@ -11,6 +11,8 @@ from concurrent.futures import ThreadPoolExecutor
 from google import genai
 from google.genai import types
 
+from ..core.gemini import get_response_cache
+from ..core.response_cache import response_key
 from ..core.settings import Settings
 
 EXTRACTION_PROMPT = """You are extracting exam schedule data from a notice board / printed sheet photo.
@@ -71,9 +73,27 @@ def process_images(
     """Upload images in parallel, extract schedule with one Gemini call, then delete.
 
     progress_callback(completed, total) is called after each upload finishes.
+    Responses are cached by image bytes, model and prompt; a cached image set
+    is neither uploaded nor sent again.
     Returns a list of exam entry dicts. Returns [] on complete failure.
     """
     total = len(image_data)
+    cache = get_response_cache(settings)
+    key = response_key(
+        settings.model_name, EXTRACTION_PROMPT, *(data for data, _ in image_data)
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        try:
+            entries = json.loads(cached)
+        except json.JSONDecodeError:
+            # Corrupt or truncated entry: drop it and make the live call.
+            cache.discard(key)
+        else:
+            if progress_callback:
+                progress_callback(total, total)
+            return entries if isinstance(entries, list) else []
+
     results: dict[str, object] = {}
     completed = 0
 
@@ -135,6 +155,9 @@ def process_images(
         print("=" * 60 + "\n")
 
         entries = json.loads(response.text)
+        # Only a response covering every image stands for the whole set.
+        if len(uploaded_files) == total:
+            cache.put(key, response.text)
         return entries if isinstance(entries, list) else []
 
     except json.JSONDecodeError as e:
@@ -8,9 +8,12 @@ import pandas as pd
 from google import genai
 from google.genai import types
 
+from ..core.gemini import get_response_cache
 from ..core.models import SubjectConfig
+from ..core.response_cache import response_key
 from ..core.settings import Settings
 from ..core.utils import clean_json_string, deduplicate_subjects
+from .subjects_manual import parse_subject_text
 
 SYSTEM_PROMPT = """### **ROLE DEFINITION**
 You are a precision data extraction engine specializing in academic systems parsing. Your sole function is to analyze raw text containing course codes and titles, then output a perfectly structured JSON object following strict algorithmic rules. You must not deviate from the specified logic, add commentary, or include explanatory text in your output.
@@ -228,25 +231,60 @@ def build_input_text(
 
 def extract_subjects_ai(
     input_text: str,
-    client: genai.Client,
+    client: genai.Client | None,
     settings: Settings,
 ) -> list[dict]:
-    """Send timetable text to Gemini and return a deduplicated subject list.
+    """Extract a deduplicated subject list from timetable text.
 
-    Raises ValueError on API failure or JSON parse error.
+    Lines the rule-based parser resolves are handled locally; only the rest
+    are sent to Gemini, and no request is made when nothing is left or the
+    same lines were already answered (see core.response_cache). The client
+    may be None if the text is expected to resolve offline or from the cache.
+
+    Raises ValueError on API failure, JSON parse error, or when lines need
+    Gemini but no client is given.
     """
-    response = client.models.generate_content(
-        model=settings.model_name,
-        contents=[input_text],
-        config=types.GenerateContentConfig(
-            response_mime_type="application/json",
-            system_instruction=SYSTEM_PROMPT,
-        ),
-    )
-    cleaned = clean_json_string(response.text)
+    subjects, unresolved = parse_subject_text(input_text)
+    if unresolved:
+        subjects += _extract_with_gemini("\n".join(unresolved), client, settings)
+    return deduplicate_subjects(subjects)
+
+
+def _extract_with_gemini(
+    input_text: str, client: genai.Client | None, settings: Settings
+) -> list[dict]:
+    cache = get_response_cache(settings)
+    key = response_key(settings.model_name, SYSTEM_PROMPT, input_text)
+    text = cache.get(key)
+    if text is not None:
+        try:
+            json.loads(clean_json_string(text))
+        except json.JSONDecodeError:
+            # Corrupt or truncated entry: drop it and make the live call.
+            cache.discard(key)
+            text = None
+    live = text is None
+    if live:
+        if client is None:
+            lines = input_text.splitlines()
+            raise ValueError(
+                f"{len(lines)} line(s) need Gemini but no API key is set, "
+                f"e.g. {lines[0]!r}."
+            )
+        response = client.models.generate_content(
+            model=settings.model_name,
+            contents=[input_text],
+            config=types.GenerateContentConfig(
+                response_mime_type="application/json",
+                system_instruction=SYSTEM_PROMPT,
+            ),
+        )
+        text = response.text
+    cleaned = clean_json_string(text)
     try:
         data = json.loads(cleaned)
     except json.JSONDecodeError as e:
         raise ValueError(f"Could not parse Gemini response as JSON: {e}") from e
-    subjects = data.get("subjects", [])
-    return deduplicate_subjects(subjects)
+    if live:
+        cache.put(key, text)
+    return data.get("subjects", [])
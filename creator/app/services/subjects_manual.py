@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 import pandas as pd
 
 from ..core.models import SubjectConfig
@@ -60,3 +62,98 @@ def _extract_3col(row: pd.Series, cols: list[int]) -> dict | None:
     if not (code and full_code and subject):
         return None
     return {"Code": code, "Full Code": full_code, "Subject": subject}
+
+
+# ── Rule-based subject lines ──────────────────────────────────────────────────
+# The deterministic part of subjects_ai.SYSTEM_PROMPT: codes are alphanumeric
+# tokens containing a digit, 8+ characters makes a full code, and tokens are
+# separated by whitespace, "/", "-" or ",". Lines that don't fit one of the
+# unambiguous shapes below are left for the model.
+
+_HEADER_RE = re.compile(r"\b(?:code|title)\b", re.IGNORECASE)
+_OR_RE = re.compile(r"\s+or\s+", re.IGNORECASE)
+_CODE_RE = re.compile(r"(?=[A-Za-z]*\d)[A-Za-z0-9]+(?=[\s/,\-]|$)")
+_SEPARATORS = " \t/,-"
+
+FULL_CODE_LENGTH = 8
+
+
+def _split_code(text: str) -> tuple[str, str] | None:
+    """Split a leading code token off text; return (code, rest) or None."""
+    match = _CODE_RE.match(text)
+    if not match:
+        return None
+    return match.group(), text[match.end():].lstrip(_SEPARATORS)
+
+
+def _subject(code: str, full_code: str, title: str) -> dict:
+    return {"Code": code, "Full Code": full_code, "Subject": title.strip()}
+
+
+def _own_full_code(code: str) -> str:
+    return code if len(code) >= FULL_CODE_LENGTH else ""
+
+
+def parse_subject_line(line: str) -> list[dict] | None:
+    """Parse one subject line without AI.
+
+    Returns the line's subjects (an empty list for blank and header lines), or
+    None when the line is ambiguous and should be left to the model.
+    """
+    line = line.strip()
+    if not line or _HEADER_RE.search(line):
+        return []
+
+    segments = _OR_RE.split(line)
+    if len(segments) > 1:
+        # "Code1 OR Code2 Subject1 [OR Subject2]"
+        if len(segments) > 3 or not _CODE_RE.fullmatch(segments[0]):
+            return None
+        second = _split_code(segments[1])
+        if second is None or not second[1] or _split_code(second[1]):
+            return None
+        code1, code2 = segments[0], second[0]
+        title1 = second[1]
+        title2 = segments[2].lstrip(_SEPARATORS) if len(segments) == 3 else title1
+        if not title2.strip():
+            return None
+        return [
+            _subject(code1, _own_full_code(code1), title1),
+            _subject(code2, _own_full_code(code2), title2),
+        ]
+
+    first = _split_code(line)
+    if first is None or not first[1]:
+        return None
+    code, rest = first
+    second = _split_code(rest)
+    if second is None:
+        # Scenario B: "Code Subject"
+        return [_subject(code, _own_full_code(code), rest)]
+    # Scenario A: "ShortCode FullCode Subject"
+    full_code, title = second
+    if (
+        len(code) >= FULL_CODE_LENGTH
+        or len(full_code) < FULL_CODE_LENGTH
+        or not title
+        or _split_code(title)
+    ):
+        return None
+    return [_subject(code, full_code, title)]
+
+
+def parse_subject_text(text: str) -> tuple[list[dict], list[str]]:
+    """Parse subject lines without AI.
+
+    Returns the subjects of every line the rules resolve, in line order, and
+    the lines they leave unresolved.
+    """
+    subjects: list[dict] = []
+    unresolved: list[str] = []
+    for line in text.splitlines():
+        parsed = parse_subject_line(line)
+        if parsed is None:
+            unresolved.append(line.strip())
+        else:
+            subjects.extend(parsed)
+    return subjects, unresolved
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from ..core.models import TimetableConfig, TimetableOutput
@@ -18,22 +19,28 @@ def build_timetable(df: pd.DataFrame, config: TimetableConfig) -> TimetableOutpu
     start_col_idx = config.start_col - 1
     end_col_idx = config.end_col  # slice end is exclusive
 
-    time_headers = df.iloc[header_idx, start_col_idx:end_col_idx].dropna()
-    if time_headers.empty:
+    # Only columns with a time header are read, into one object array with a
+    # row per time slot; empty cells are masked once for the whole block.
+    headers = df.iloc[header_idx, start_col_idx:end_col_idx]
+    header_present = headers.notna().to_numpy()
+    if not header_present.any():
         raise ValueError(
             f"No time headers found on row {config.header_row} "
             f"between columns {config.start_col} and {config.end_col}."
         )
+    col_positions = np.arange(df.shape[1])[start_col_idx:end_col_idx][header_present]
+    slots = [normalize_time_slot(h) for h in headers.to_numpy()[header_present]]
+
+    cells = df.iloc[:, col_positions].to_numpy(dtype=object).T
+    present = ~pd.isna(cells)
 
     result: dict[str, dict[str, list[str]]] = {}
     for day, day_range in config.day_ranges.items():
-        row_start = day_range.start_row - 1
-        row_end = day_range.end_row  # slice end is exclusive
-        result[day] = {}
-        for col_idx, time_str in time_headers.items():
-            entries = df.iloc[row_start:row_end, col_idx].dropna().tolist()
-            normalized = normalize_time_slot(time_str)
-            result[day][normalized] = entries
+        rows = slice(day_range.start_row - 1, day_range.end_row)  # end exclusive
+        result[day] = {
+            slot: column[mask].tolist()
+            for slot, column, mask in zip(slots, cells[:, rows], present[:, rows])
+        }
 
     return TimetableOutput(timetable=result)
 
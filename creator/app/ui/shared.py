@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
+from pathlib import Path
+
+import pandas as pd
 import streamlit as st
 from google import genai
 
 from ..core.gemini import get_client
+from ..core.models import TimetableConfig, TimetableOutput
 from ..core.settings import Settings, get_settings
+from ..core.utils import load_dataframe
+from ..services.timetable import build_timetable, preview_time_headers
 
 
 @st.cache_resource
@@ -15,6 +23,50 @@ def _cached_settings() -> Settings:
     return get_settings()
 
 
+# ── Upload cache ──────────────────────────────────────────────────────────────
+# Parsed uploads are cached by content hash, shared by every page and session,
+# so reruns triggered by widget changes never re-read the workbook. Arguments
+# starting with "_" are not hashed by Streamlit; the digest stands in for them.
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _parse_upload(digest: str, suffix: str, _data: bytes) -> pd.DataFrame:
+    return load_dataframe(io.BytesIO(_data), f"upload{suffix}")
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _time_headers(
+    digest: str, header_row: int, start_col: int, end_col: int, _df: pd.DataFrame
+) -> list[str]:
+    return preview_time_headers(_df, header_row, start_col, end_col)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _timetable(digest: str, config_json: str, _df: pd.DataFrame) -> TimetableOutput:
+    return build_timetable(_df, TimetableConfig.model_validate_json(config_json))
+
+
+def load_upload(uploaded) -> tuple[str, pd.DataFrame]:
+    """Parse an uploaded file once per content; return (content digest, frame)."""
+    data = uploaded.getvalue()
+    digest = hashlib.sha256(data).hexdigest()
+    return digest, _parse_upload(digest, Path(uploaded.name).suffix.lower(), data)
+
+
+def cached_time_headers(
+    digest: str, df: pd.DataFrame, header_row: int, start_col: int, end_col: int
+) -> list[str]:
+    """preview_time_headers for the upload with the given digest, cached."""
+    return _time_headers(digest, header_row, start_col, end_col, df)
+
+
+def cached_timetable(
+    digest: str, df: pd.DataFrame, config: TimetableConfig
+) -> TimetableOutput:
+    """build_timetable for the upload with the given digest, cached per config."""
+    return _timetable(digest, config.model_dump_json(), df)
+
+
 def render_api_key_sidebar() -> str:
     """Render API key configuration in the sidebar; return the resolved key."""
     settings = _cached_settings()
@@ -7,11 +7,12 @@ import json
 import streamlit as st
 
 from ..core.models import SubjectConfig, SubjectRange
-from ..core.utils import load_dataframe
 from ..services.subjects_ai import build_input_text, extract_subjects_ai
+from ..services.subjects_manual import parse_subject_text
 from .shared import (
     get_effective_settings,
     get_gemini_client_for_page,
+    load_upload,
     render_api_key_sidebar,
     render_model_selector,
 )
@@ -34,7 +35,7 @@ def render() -> None:
         return
 
     try:
-        df = load_dataframe(uploaded, uploaded.name)
+        _, df = load_upload(uploaded)
     except Exception as e:
         st.error(f"Error reading file: {e}")
         return
@@ -104,10 +105,6 @@ def render() -> None:
     # ── Step 2: Generate ──────────────────────────────────────────────────────
     st.header("Step 2: Generate with AI")
     if st.button("Generate Subject JSON", type="primary"):
-        client = get_gemini_client_for_page(api_key, model)
-        if not client:
-            return
-
         ranges = [
             SubjectRange(
                 start_row=r["start_row"],
@@ -123,8 +120,18 @@ def render() -> None:
             st.warning("No data found in the specified ranges.")
             return
 
-        with st.expander("Preview Input Sent to AI"):
-            st.text(input_text[:1000] + ("..." if len(input_text) > 1000 else ""))
+        # Lines the offline rules resolve never reach the model.
+        _, unresolved = parse_subject_text(input_text)
+        client = None
+        if unresolved:
+            client = get_gemini_client_for_page(api_key, model)
+            if not client:
+                return
+            ai_text = "\n".join(unresolved)
+            with st.expander(f"Preview Input Sent to AI ({len(unresolved)} lines)"):
+                st.text(ai_text[:1000] + ("..." if len(ai_text) > 1000 else ""))
+        else:
+            st.info("All lines were parsed offline; nothing is sent to AI.")
 
         settings = get_effective_settings(api_key, model)
         with st.spinner("AI is analyzing the data..."):
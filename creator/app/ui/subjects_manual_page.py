@@ -7,10 +7,14 @@ import json
 import streamlit as st
 
 from ..core.models import DayRange, SubjectConfig, SubjectRange, TimetableConfig
-from ..core.utils import load_dataframe
 from ..services.subjects_manual import extract_subjects_manual
-from ..services.timetable import build_timetable, preview_time_headers
-from .shared import render_api_key_sidebar, render_model_selector
+from .shared import (
+    cached_time_headers,
+    cached_timetable,
+    load_upload,
+    render_api_key_sidebar,
+    render_model_selector,
+)
 
 
 def render() -> None:
@@ -30,7 +34,7 @@ def render() -> None:
         return
 
     try:
-        df = load_dataframe(uploaded, uploaded.name)
+        digest, df = load_upload(uploaded)
     except Exception as e:
         st.error(f"Error reading file: {e}")
         return
@@ -106,7 +110,7 @@ def render() -> None:
     else:
         st.subheader("Preview of Selected Data")
         try:
-            headers = preview_time_headers(df, header_row, start_col, end_col)
+            headers = cached_time_headers(digest, df, header_row, start_col, end_col)
             if headers:
                 st.write("**Time Slots Found:**", headers)
             else:
@@ -122,7 +126,7 @@ def render() -> None:
                 day_ranges=day_ranges,
             )
             try:
-                result = build_timetable(df, config)
+                result = cached_timetable(digest, df, config)
             except ValueError as e:
                 st.error(str(e))
             else:
@@ -33,11 +33,13 @@ def _get_client(settings: "Settings") -> "genai.Client":
     return get_client(settings)
 
 
-def _load_df(file: Path) -> "pd.DataFrame":
-    from app.core.utils import load_dataframe
+def _load_df(file: Path, config: object | None = None) -> "pd.DataFrame":
+    """Load the sheet, only up to the rows/columns ``config`` reads if given."""
+    from app.core.utils import config_bounds, load_dataframe
 
+    max_row, max_col = config_bounds(config) if config is not None else (None, None)
     with open(file, "rb") as fh:
-        return load_dataframe(fh, file.name)
+        return load_dataframe(fh, file.name, max_row, max_col)
 
 
 # ── Commands ──────────────────────────────────────────────────────────────────
@@ -70,13 +72,13 @@ def cmd_timetable(
         s, e = rng_part.split("-")
         day_ranges[day_part.upper()] = DayRange(start_row=int(s), end_row=int(e))
 
-    df = _load_df(file)
     config = TimetableConfig(
         header_row=header_row,
         start_col=start_col,
         end_col=end_col,
         day_ranges=day_ranges,
     )
+    df = _load_df(file, config)
     result = build_timetable(df, config)
     output.write_text(json.dumps(result.model_dump(), indent=4))
     typer.echo(f"Timetable written to {output}")
@@ -113,7 +115,7 @@ def cmd_subjects(
         ranges=[SubjectRange(start_row=start_row, end_row=end_row, cols=col_list)],
         num_cols=num_cols,
     )
-    df = _load_df(file)
+    df = _load_df(file, config)
 
     if no_ai:
         from app.services.subjects_manual import extract_subjects_manual
@@ -127,17 +129,17 @@ def cmd_subjects(
             settings = Settings(
                 gemini_api_key=settings.gemini_api_key, model_name=model
             )
-        if not settings.has_api_key:
-            typer.echo(
-                "Error: GEMINI_API_KEY is required. Set it in .env or pass --api-key.",
-                err=True,
-            )
-            raise typer.Exit(1)
-        client = _get_client(settings)
+        # Without a key, lines the offline rules cannot resolve are an error.
+        client = _get_client(settings) if settings.has_api_key else None
         from app.services.subjects_ai import build_input_text, extract_subjects_ai
 
         input_text = build_input_text(df, config.ranges, config.num_cols)
-        subjects = extract_subjects_ai(input_text, client, settings)
+        try:
+            subjects = extract_subjects_ai(input_text, client, settings)
+        except ValueError as e:
+            hint = "" if client else " Set GEMINI_API_KEY in .env or pass --api-key."
+            typer.echo(f"Error: {e}{hint}", err=True)
+            raise typer.Exit(1)
 
     output.write_text(json.dumps(subjects, indent=4))
     typer.echo(f"{len(subjects)} subjects written to {output}")
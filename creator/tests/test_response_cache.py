@@ -0,0 +1,109 @@
+"""TTL, eviction and corrupt entries of the Gemini response cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from types import SimpleNamespace
+
+from app.core.response_cache import ResponseCache, response_key
+from app.core.settings import Settings
+from app.services.subjects_ai import SYSTEM_PROMPT, _extract_with_gemini
+
+
+def _age(cache: ResponseCache, key: str, seconds: float) -> None:
+    path = cache._path(key)
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=60, max_bytes=1 << 20)
+    cache.put("aa1", "fresh")
+    cache.put("aa2", "stale")
+    _age(cache, "aa2", 120)
+
+    assert cache.get("aa1") == "fresh"
+    assert cache.get("aa2") is None
+    assert not cache._path("aa2").exists()
+
+
+def test_reads_keep_the_write_time(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=60, max_bytes=1 << 20)
+    cache.put("aa1", "text")
+    _age(cache, "aa1", 50)
+    assert cache.get("aa1") == "text"
+
+    _age(cache, "aa1", 70)
+    assert cache.get("aa1") is None
+
+
+def test_least_recently_read_entries_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=3600, max_bytes=35)
+    for index in range(3):
+        cache.put(f"k{index}", "x" * 10)
+        then = time.time() - 100 + index
+        os.utime(cache._path(f"k{index}"), (then, then))
+    # Reading k0 makes k1 the least recently used entry.
+    assert cache.get("k0") == "x" * 10
+    cache.put("k3", "x" * 10)
+
+    assert [cache.get(f"k{index}") is not None for index in range(4)] == [
+        True,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_overwrites_do_not_grow_the_size_estimate(tmp_path):
+    cache = ResponseCache(tmp_path, ttl=3600, max_bytes=1 << 20)
+    cache.put("aa1", "x" * 100)
+    for _ in range(5):
+        cache.put("aa1", "y" * 100)
+
+    assert cache._bytes == 100
+
+
+def _client(text: str) -> SimpleNamespace:
+    calls = []
+
+    def generate_content(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(text=text)
+
+    return SimpleNamespace(
+        models=SimpleNamespace(generate_content=generate_content), calls=calls
+    )
+
+
+def test_corrupt_entry_is_replaced_by_the_live_response(tmp_path):
+    settings = Settings(GEMINI_CACHE_DIR=str(tmp_path / "cache"))
+    response = json.dumps({"subjects": [{"Code": "CS311"}]})
+    client = _client(response)
+    key = response_key(settings.model_name, SYSTEM_PROMPT, "CS311 something")
+    cache = ResponseCache(settings.cache_dir, 3600, 1 << 20)
+    cache.put(key, '{"subjects": [')
+
+    subjects = _extract_with_gemini("CS311 something", client, settings)
+
+    assert subjects == [{"Code": "CS311"}]
+    assert len(client.calls) == 1
+    assert cache.get(key) == response
+
+
+def test_hits_are_not_rewritten(tmp_path):
+    settings = Settings(GEMINI_CACHE_DIR=str(tmp_path / "cache"))
+    response = json.dumps({"subjects": []})
+    client = _client(response)
+    _extract_with_gemini("CS311 something", client, settings)
+    key = response_key(settings.model_name, SYSTEM_PROMPT, "CS311 something")
+    cache = ResponseCache(settings.cache_dir, 3600, 1 << 20)
+    _age(cache, key, 100)
+    written = cache._path(key).stat().st_mtime
+
+    _extract_with_gemini("CS311 something", client, settings)
+
+    assert len(client.calls) == 1
+    assert cache._path(key).stat().st_mtime == written
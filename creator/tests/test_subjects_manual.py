@@ -0,0 +1,139 @@
+"""Rule-based subject line parsing against the SYSTEM_PROMPT examples."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.services.subjects_manual import parse_subject_line, parse_subject_text
+
+
+def _subject(code: str, full_code: str, title: str) -> dict:
+    return {"Code": code, "Full Code": full_code, "Subject": title}
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        (
+            "CS311\t18B11CS311 Computer Networks & IoT",
+            [_subject("CS311", "18B11CS311", "Computer Networks & IoT")],
+        ),
+        (
+            "15B11PH211-PHYSICS-II",
+            [_subject("15B11PH211", "15B11PH211", "PHYSICS-II")],
+        ),
+        ("MA101,Calculus", [_subject("MA101", "", "Calculus")]),
+        (
+            "ECO101 / 19B11EC211 / Microeconomics (Honors)",
+            [_subject("ECO101", "19B11EC211", "Microeconomics (Honors)")],
+        ),
+        (
+            "15B11CI513 OR 15B11CI514 Software Engineering OR Artificial Intelligence",
+            [
+                _subject("15B11CI513", "15B11CI513", "Software Engineering"),
+                _subject("15B11CI514", "15B11CI514", "Artificial Intelligence"),
+            ],
+        ),
+        (
+            "15B17CI573 or 15B17CI574 Software Engineering Lab or Artificial Intelligence Lab",
+            [
+                _subject("15B17CI573", "15B17CI573", "Software Engineering Lab"),
+                _subject("15B17CI574", "15B17CI574", "Artificial Intelligence Lab"),
+            ],
+        ),
+        (
+            "CS311 or CS312 Software Engineering or Artificial Intelligence",
+            [
+                _subject("CS311", "", "Software Engineering"),
+                _subject("CS312", "", "Artificial Intelligence"),
+            ],
+        ),
+        (
+            "15B11CI513 OR 15B11CI514 Software Engineering",
+            [
+                _subject("15B11CI513", "15B11CI513", "Software Engineering"),
+                _subject("15B11CI514", "15B11CI514", "Software Engineering"),
+            ],
+        ),
+        (
+            "HUM101-19B11HU211-Professional Ethics",
+            [_subject("HUM101", "19B11HU211", "Professional Ethics")],
+        ),
+        (
+            "CS311/18B11CS311 Computer Netwks & IoT",
+            [_subject("CS311", "18B11CS311", "Computer Netwks & IoT")],
+        ),
+        (
+            "CS311-18B11CS311-Computer Networks",
+            [_subject("CS311", "18B11CS311", "Computer Networks")],
+        ),
+        (
+            "15B11PH211/PHYSICS-II",
+            [_subject("15B11PH211", "15B11PH211", "PHYSICS-II")],
+        ),
+        (
+            "CS311/18B11CS311 Unix/Linux Systems",
+            [_subject("CS311", "18B11CS311", "Unix/Linux Systems")],
+        ),
+        (
+            "CS311 OR 15B11CI514 Software Engineering OR Artificial Intelligence",
+            [
+                _subject("CS311", "", "Software Engineering"),
+                _subject("15B11CI514", "15B11CI514", "Artificial Intelligence"),
+            ],
+        ),
+    ],
+)
+def test_prompt_examples(line, expected):
+    assert parse_subject_line(line) == expected
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        # A code-like token at the start of the title.
+        "CS311 18B11CS311 MA101 Calculus",
+        "15B11CI513 OR 15B11CI514 CS101 Intro",
+        # Full code before the short one.
+        "18B11CS311/CS311 Computer Networks",
+        # OR inside a title, or with more than two codes before it.
+        "CS311 18B11CS311 Logic or Circuit Design",
+        "CS311 CS312 or CS313 Subject1 or Subject2",
+        # Three or more ORs.
+        "15B11CI513 OR 15B11CI514 OR 15B11CI515 Sub1 OR Sub2 OR Sub3",
+    ],
+)
+def test_ambiguous_lines_are_deferred(line):
+    assert parse_subject_line(line) is None
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "",
+        "   ",
+        "Short Subject Code/Full Subject Code/Subject Title",
+        "Course Code\tTitle",
+        "SUBJECT CODE",
+    ],
+)
+def test_headers_and_blanks_are_skipped(line):
+    assert parse_subject_line(line) == []
+
+
+def test_parse_subject_text_splits_resolved_and_deferred():
+    text = "\n".join(
+        [
+            "Short Subject Code/Full Subject Code/Subject Title",
+            "CS311-18B11CS311-Computer Networks",
+            "",
+            "CS311 18B11CS311 Logic or Circuit Design",
+            "15B11PH211/PHYSICS-II",
+        ]
+    )
+    subjects, unresolved = parse_subject_text(text)
+    assert subjects == [
+        _subject("CS311", "18B11CS311", "Computer Networks"),
+        _subject("15B11PH211", "15B11PH211", "PHYSICS-II"),
+    ]
+    assert unresolved == ["CS311 18B11CS311 Logic or Circuit Design"]
@@ -0,0 +1,155 @@
+"""Windowed workbook loading against the full pandas read."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from app.core.models import DayRange, SubjectConfig, SubjectRange, TimetableConfig
+from app.core.utils import config_bounds, load_dataframe
+from app.services.subjects_manual import extract_subjects_manual
+from app.services.timetable import build_timetable
+
+SAMPLE = (
+    Path(__file__).resolve().parents[2]
+    / "data"
+    / "time-table"
+    / "2026"
+    / "EVEN26"
+    / "62.json"
+)
+
+HEADER_ROW = 3
+FIRST_DAY_ROW = 4
+
+
+def _sample_workbook() -> tuple[bytes, TimetableConfig, SubjectConfig]:
+    """Lay the real Sector 62 year 3 timetable out as the grid sheet it came from.
+
+    One row per class entry under a day, a time slot per column, an extra
+    empty slot with a numeric header, the subject list below the grid, and a
+    second sheet. Returns the xlsx bytes and the timetable/subject configs.
+    """
+    year = json.loads(SAMPLE.read_text(encoding="utf-8"))["3"]
+    timetable, subjects = year["timetable"], year["subjects"]
+    slots = list(dict.fromkeys(s for day in timetable.values() for s in day))
+
+    book = Workbook()
+    sheet = book.active
+    sheet.cell(1, 1, "JIIT Sector 62 — B.Tech III Year")
+    sheet.cell(HEADER_ROW, 1, "Day")
+    for col, slot in enumerate(slots, start=2):
+        sheet.cell(HEADER_ROW, col, slot)
+    # Numeric header over a slot with no classes: only a full read sees the
+    # strings further down this column.
+    numeric_col = len(slots) + 2
+    sheet.cell(HEADER_ROW, numeric_col, 17)
+
+    day_ranges: dict[str, DayRange] = {}
+    row = FIRST_DAY_ROW
+    for day, day_slots in timetable.items():
+        height = max(len(entries) for entries in day_slots.values())
+        sheet.cell(row, 1, day)
+        for col, slot in enumerate(slots, start=2):
+            for offset, entry in enumerate(day_slots.get(slot, [])):
+                sheet.cell(row + offset, col, entry)
+        day_ranges[day] = DayRange(start_row=row, end_row=row + height - 1)
+        row += height
+
+    subjects_row = row + 2
+    sheet.cell(subjects_row, 2, "Code")
+    for offset, subject in enumerate(subjects, start=1):
+        sheet.cell(subjects_row + offset, 2, subject["Code"])
+        sheet.cell(subjects_row + offset, 3, subject["Full Code"])
+        sheet.cell(subjects_row + offset, 4, subject["Subject"])
+        sheet.cell(subjects_row + offset, numeric_col, f"note {offset}")
+
+    other = book.create_sheet("Electives")
+    for r in range(1, 200):
+        other.append([f"filler {r}"] * 20)
+
+    buffer = io.BytesIO()
+    book.save(buffer)
+    timetable_config = TimetableConfig(
+        header_row=HEADER_ROW,
+        start_col=2,
+        end_col=numeric_col,
+        day_ranges=day_ranges,
+    )
+    subject_config = SubjectConfig(
+        ranges=[
+            SubjectRange(
+                start_row=subjects_row + 1,
+                end_row=subjects_row + len(subjects),
+                cols=[2, 3, 4],
+            )
+        ]
+    )
+    return buffer.getvalue(), timetable_config, subject_config
+
+
+@pytest.fixture(scope="module")
+def sample() -> tuple[bytes, TimetableConfig, SubjectConfig]:
+    if not SAMPLE.is_file():
+        pytest.skip(f"sample timetable {SAMPLE} not found")
+    return _sample_workbook()
+
+
+def test_windowed_timetable_matches_full_load(sample):
+    data, config, _ = sample
+    full = load_dataframe(io.BytesIO(data), "sample.xlsx")
+    window = load_dataframe(io.BytesIO(data), "sample.xlsx", *config_bounds(config))
+
+    assert len(window) < len(full)
+    expected = build_timetable(full, config).model_dump()
+    assert build_timetable(window, config).model_dump() == expected
+    assert "17" in expected["timetable"]["MON"]
+
+
+def test_windowed_subjects_match_full_load(sample):
+    data, _, config = sample
+    full = load_dataframe(io.BytesIO(data), "sample.xlsx")
+    window = load_dataframe(io.BytesIO(data), "sample.xlsx", *config_bounds(config))
+
+    assert extract_subjects_manual(window, config) == extract_subjects_manual(
+        full, config
+    )
+
+
+def test_window_cells_equal_full_load_cells(sample):
+    data, config, _ = sample
+    max_row, max_col = config_bounds(config)
+    full = load_dataframe(io.BytesIO(data), "sample.xlsx")
+    window = load_dataframe(io.BytesIO(data), "sample.xlsx", max_row, max_col)
+
+    expected = full.iloc[:max_row, :max_col]
+    assert window.shape == expected.shape
+    assert _cells(window) == _cells(expected)
+
+
+def _cells(df: pd.DataFrame) -> list[list[str | None]]:
+    return [
+        [None if pd.isna(v) else repr(v) for v in row]
+        for row in df.itertuples(index=False)
+    ]
+
+
+@pytest.mark.parametrize("max_row, max_col", [(3, 2), (2, 1), (1, 2), (3, 1)])
+def test_numeric_column_reads_as_in_full_load(max_row, max_col):
+    book = Workbook()
+    for row in ([1, "a"], [None, "b"], [3, "c"], [None, None], [5, "d"]):
+        book.active.append(row)
+    buffer = io.BytesIO()
+    book.save(buffer)
+    data = buffer.getvalue()
+
+    full = load_dataframe(io.BytesIO(data), "numbers.xlsx")
+    window = load_dataframe(io.BytesIO(data), "numbers.xlsx", max_row, max_col)
+
+    assert str(full.iloc[0, 0]) == "1.0"
+    assert _cells(window) == _cells(full.iloc[:max_row, :max_col])
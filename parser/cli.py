@@ -0,0 +1,254 @@
+"""
+Command line entry point for maintainer tooling.
+
+Usage:
+    python cli.py export ../website/data/time-table/2026/EVEN26 -o out/EVEN26
+    python cli.py diff old/62.json ../website/data/time-table/2026/EVEN26/62.json
+    python cli.py bench -o bench.json --baseline bench-main.json
+    python cli.py verify --path compiled
+    python cli.py profile ../data/time-table/2026/EVEN26/62.json 3 B12 CS311
+    python cli.py slim-wheel dist/jiit_timetable_parser-0.1.0-py3-none-any.whl -o dist
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from main import profile_time_table
+from modules.semester import diff_campus_files
+from tools.bench import compare_reports, run_benchmarks
+from tools.corpus import DATA_ROOT
+from tools.export import export_semester
+from tools.verify import FAST_PATHS, verify_corpus
+from tools.wheel import slim_wheel, wheel_report
+
+
+def _export(args: argparse.Namespace) -> int:
+    manifest, written = export_semester(
+        args.semester_dir,
+        args.out,
+        workers=args.workers,
+        previous_dir=args.previous,
+    )
+    print(f"Wrote {written} of {len(manifest['files'])} timetables to {args.out}")
+    return 0
+
+
+def _diff(args: argparse.Namespace) -> int:
+    campus = args.campus or Path(args.new).stem
+    old_data = json.loads(Path(args.old).read_text(encoding="utf-8"))
+    new_data = json.loads(Path(args.new).read_text(encoding="utf-8"))
+
+    report = {}
+    for year, diff in diff_campus_files(campus, old_data, new_data).items():
+        if not (diff.changed or diff.added or diff.removed or diff.moved):
+            continue
+        report[year] = {
+            "added": [list(item) for item in diff.added],
+            "removed": [list(item) for item in diff.removed],
+            "moved": [list(item) for item in diff.moved],
+            "changed_subjects": sorted(diff.changed_subjects),
+            "affected_subjects": sorted(diff.affected_subjects),
+            "affected_batches": list(diff.affected_batches),
+        }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    report = run_benchmarks(
+        args.data,
+        repeat=args.repeat,
+        pairs=args.pairs,
+        seed=args.seed,
+        memory=not args.no_memory,
+    )
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    speedups = {}
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        speedups = compare_reports(baseline, report)
+
+    corpus = report["corpus"]
+    print(
+        f"{corpus['years']} campus/years, {corpus['batches']} batches, "
+        f"{corpus['cases']} timetables (commit {report['commit']})"
+    )
+    for name, result in report["results"].items():
+        rows = [(name, result)] + [
+            (f"{name}[{campus}]", campus_result)
+            for campus, campus_result in result.get("by_campus", {}).items()
+        ]
+        for row_name, row in rows:
+            line = (
+                f"{row_name:28} {row['calls']:7} calls {row['seconds']:9.3f}s "
+                f"{row['per_second'] or 0:10.1f}/s "
+                f"{row['peak_memory_bytes'] / 1024:9.0f} KiB peak"
+            )
+            if row_name in speedups:
+                line += f"  x{speedups[row_name]:.2f} vs baseline"
+            print(line)
+    return 0
+
+
+def _verify(args: argparse.Namespace) -> int:
+    results = verify_corpus(args.data, args.path)
+    for result in results:
+        speedup = f"x{result.speedup:.2f}" if result.speedup else "-"
+        print(
+            f"{result.name:22} {result.cases:7} cases {result.mismatches:5} mismatches "
+            f"{result.seconds:8.3f}s vs {result.reference_seconds:8.3f}s ({speedup})"
+        )
+        if result.first_mismatch:
+            print(f"  first mismatch: {result.first_mismatch}")
+    return 1 if any(result.mismatches for result in results) else 0
+
+
+def _profile(args: argparse.Namespace) -> int:
+    campus = args.campus or Path(args.file).stem
+    year_data = json.loads(Path(args.file).read_text(encoding="utf-8"))[args.year]
+    _, profile = profile_time_table(
+        campus,
+        args.year,
+        year_data["timetable"],
+        year_data["subjects"],
+        args.batch,
+        args.electives,
+    )
+    print(json.dumps(profile, indent=2))
+    return 0
+
+
+def _slim_wheel(args: argparse.Namespace) -> int:
+    slim = slim_wheel(args.wheel, args.out)
+    print(f"Wrote {slim}")
+    if args.runs:
+        report = wheel_report(args.wheel, slim, runs=args.runs)
+        if args.report:
+            Path(args.report).write_text(
+                json.dumps(report, indent=2) + "\n", encoding="utf-8"
+            )
+        for label in ("wheel", "slim"):
+            row = report[label]
+            print(
+                f"{row['file']:48} {row['bytes'] / 1024:7.1f} KiB "
+                f"import main {row['import_ms']:7.2f} ms, "
+                f"first timetable {row['first_timetable_ms']:7.2f} ms"
+            )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="JIIT timetable parser tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser(
+        "export",
+        help="Precompute every batch timetable of a semester as JSON shards",
+    )
+    export.add_argument(
+        "semester_dir", help="Semester directory, e.g. data/time-table/2026/EVEN26"
+    )
+    export.add_argument("-o", "--out", required=True, help="Output directory")
+    export.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count, 1 to run in-process)",
+    )
+    export.add_argument(
+        "--previous",
+        help="Previous release of the semester directory; only batches it "
+        "affects are regenerated (needs an existing manifest in --out)",
+    )
+    export.set_defaults(handler=_export)
+
+    diff = commands.add_parser(
+        "diff", help="Show what changed between two releases of a campus file"
+    )
+    diff.add_argument("old", help="Old campus file, e.g. old/62.json")
+    diff.add_argument("new", help="New campus file, e.g. data/.../62.json")
+    diff.add_argument(
+        "--campus",
+        choices=["62", "128", "BCA"],
+        help="Campus of the files (default: the new file's name)",
+    )
+    diff.set_defaults(handler=_diff)
+
+    bench = commands.add_parser(
+        "bench", help="Benchmark the parser over the data/time-table corpus"
+    )
+    bench.add_argument(
+        "--data", default=DATA_ROOT, help="Corpus root (default: data/time-table)"
+    )
+    bench.add_argument("-o", "--out", help="Write the JSON report to this file")
+    bench.add_argument(
+        "--baseline", help="Earlier JSON report to print speedups against"
+    )
+    bench.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per benchmark (best kept)"
+    )
+    bench.add_argument(
+        "--pairs", type=int, default=500, help="Timetable pairs to compare"
+    )
+    bench.add_argument("--seed", type=int, default=0, help="Sampling seed")
+    bench.add_argument(
+        "--no-memory", action="store_true", help="Skip the peak memory runs"
+    )
+    bench.set_defaults(handler=_bench)
+
+    verify = commands.add_parser(
+        "verify",
+        help="Check the optimized entry points against the original creators",
+    )
+    verify.add_argument(
+        "--data", default=DATA_ROOT, help="Corpus root (default: data/time-table)"
+    )
+    verify.add_argument(
+        "--path",
+        action="append",
+        choices=list(FAST_PATHS),
+        help="Fast path to check; repeat for several (default: all)",
+    )
+    verify.set_defaults(handler=_verify)
+
+    profile = commands.add_parser(
+        "profile", help="Time the stages of one create_time_table call"
+    )
+    profile.add_argument("file", help="Campus file, e.g. data/.../62.json")
+    profile.add_argument("year", help="Year of study in the file")
+    profile.add_argument("batch", help="Batch, e.g. B12")
+    profile.add_argument("electives", nargs="*", help="Elective subject codes")
+    profile.add_argument(
+        "--campus",
+        choices=["62", "128", "BCA"],
+        help="Campus of the file (default: the file's name)",
+    )
+    profile.set_defaults(handler=_profile)
+
+    slim = commands.add_parser(
+        "slim-wheel",
+        help="Precompile a built wheel to -OO bytecode for Pyodide and report "
+        "its size and cold import time",
+    )
+    slim.add_argument("wheel", help="Wheel built by python -m build --wheel")
+    slim.add_argument("-o", "--out", required=True, help="Output directory")
+    slim.add_argument(
+        "--runs",
+        type=int,
+        default=10,
+        help="Cold interpreter launches per wheel for the report (0 to skip)",
+    )
+    slim.add_argument("--report", help="Also write the report as JSON")
+    slim.set_defaults(handler=_slim_wheel)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
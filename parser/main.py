@@ -1,20 +1,48 @@
-from modules.tt_parsers.BCA.creator import (creator as creator_bca, creator_year1 as creator_bca_year1,)
-from modules.tt_parsers.sector_62.creator import (
-    creator as creator_btech,
-    creator_year1 as creator_btech_year1,
-    time_table_creator,
-    time_table_creator_v2,
+import json
+from importlib import import_module
+from modules.semester import (
+    CompiledSemester,
+    TimetableCache,
+    batch_sort_key,
+    campus_parser,
+    campus_profile,
+    compile_semester,
 )
-from modules.tt_parsers.sector_128.creator import (
-    creator as creator_btech_offcampus,
-    creator_year1 as creator_btech_offcampus_year1,
-    banado,
-    bando_year1,
-)
-from modules.compare_tt import compare_timetables, _expand_timetable_to_hourly
+from models.scheduled_class import ScheduledClass
+from models.week_grid import ClassTable, WeekGrid
+from utils.subject import SubjectIndex
+from utils.timetable import collect_timetable
+from collections.abc import Iterator
 from typing import Literal, TypedDict
 from utils.debug import pprint
 
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "compare_timetables": ("modules.compare_tt", "compare_timetables"),
+    "compare_group": ("modules.compare_tt", "compare_group"),
+    "_expand_timetable_to_hourly": ("modules.compare_tt", "_expand_timetable_to_hourly"),
+    "time_table_creator": ("modules.tt_parsers.sector_62.creator", "time_table_creator"),
+    "time_table_creator_v2": ("modules.tt_parsers.sector_62.creator", "time_table_creator_v2"),
+    "creator_btech": ("modules.tt_parsers.sector_62.creator", "creator"),
+    "creator_btech_year1": ("modules.tt_parsers.sector_62.creator", "creator_year1"),
+    "banado": ("modules.tt_parsers.sector_128.creator", "banado"),
+    "bando_year1": ("modules.tt_parsers.sector_128.creator", "bando_year1"),
+    "creator_btech_offcampus": ("modules.tt_parsers.sector_128.creator", "creator"),
+    "creator_btech_offcampus_year1": ("modules.tt_parsers.sector_128.creator", "creator_year1"),
+    "creator_bca": ("modules.tt_parsers.BCA.creator", "creator"),
+    "creator_bca_year1": ("modules.tt_parsers.BCA.creator", "creator_year1"),
+}
+"""Names importable from main that are only loaded on first access (PEP 562),
+keeping the campus parsers and compare_tt off the import path of `main`"""
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = globals()[name] = getattr(import_module(module_name), attribute)
+    return value
+
+
 class TimetableParams(TypedDict, total=False):
     """Parameters for creating a timetable."""
     campus: Literal["62", "128", "BCA"]
@@ -55,32 +83,237 @@ def create_time_table(
     Returns:
         dict: Formatted personalized timetable
     """
-    if year == "1":
-        if campus == "62":
-            return time_table_creator(
-                time_table_json, subject_json, batch, electives_subject_codes
-            )
-        elif campus == "BCA":
-            return creator_bca_year1(
-                time_table_json, subject_json, batch, electives_subject_codes
-            )
-        else:  # 128
-            return bando_year1(
-                time_table_json, subject_json, batch, electives_subject_codes
-            )
-    else:
-        if campus == "62":
-            return time_table_creator_v2(
-                time_table_json, subject_json, batch, electives_subject_codes
-            )
-        elif campus == "BCA":
-            return creator_bca(
-                time_table_json, subject_json, batch, electives_subject_codes
-            )
-        else:  # 128
-            return banado(
-                time_table_json, subject_json, batch, electives_subject_codes
+    # Any campus other than "62" and "BCA" routes to 128. The campus package
+    # is only imported on first use.
+    creator_module = campus_parser(campus).creator
+    create = creator_module.creator_year1 if year == "1" else creator_module.creator
+    return create(time_table_json, subject_json, batch, electives_subject_codes)
+
+
+def profile_time_table(
+    campus: Literal["62", "128", "BCA"],
+    year: Literal["1", "2", "3", "4", "5"],
+    time_table_json: dict,
+    subject_json: list,
+    batch: str,
+    electives_subject_codes: list[str] = [],
+) -> tuple[dict, dict]:
+    """
+    Run create_time_table with per-stage profiling.
+
+    The stages (subject_index, tokenize, batch_matching, elective_resolution,
+    subject_lookup, format, process_timeslot, collect) are timed exclusively
+    and counted, and the tokenizer, batch and time slot caches report their
+    hits and misses. create_time_table itself carries no profiling code;
+    `modules.semester.campus_profile` profiles other calls the same way.
+
+    Args:
+        campus: Campus identifier ("62", "128", or "BCA")
+        year: Year of study ("1", "2", "3", "4", "5")
+        time_table_json: Raw timetable data
+        subject_json: List of subject information dictionaries
+        batch: User's batch (e.g., "A6", "B12", "BCA1")
+        electives_subject_codes: List of enrolled elective subject codes
+
+    Returns:
+        tuple[dict, dict]: The timetable create_time_table returns, and the
+            profile as `utils.profiling.Profile.as_dict()`
+    """
+    with campus_profile(campus) as profile:
+        timetable = create_time_table(
+            campus, year, time_table_json, subject_json, batch, electives_subject_codes
+        )
+    return timetable, profile.as_dict()
+
+
+def create_time_table_cache(
+    maxsize: int = 1024, directory: str | None = None, disk_maxsize: int = 65536
+) -> TimetableCache:
+    """
+    Create a result cache in front of create_time_table.
+
+    Requests are keyed by a content hash of time_table_json/subject_json,
+    campus, year, batch and the sorted, deduplicated electives, e.g.:
+
+        cache = create_time_table_cache(maxsize=4096, directory=".cache/timetables")
+        timetable = cache.create_time_table("62", "3", tt, subjects, "B12", ["CS311"])
+        cache.stats()  # {"hits": ..., "disk_hits": ..., "misses": ..., ...}
+
+    Args:
+        maxsize: Timetables kept in the in-memory LRU
+        directory: Directory of JSON blobs kept across restarts; memory only if None
+        disk_maxsize: Blobs kept in directory; the least recently used go first
+
+    Returns:
+        TimetableCache: The cache, with the same create_time_table signature
+    """
+    return TimetableCache(create_time_table, maxsize, directory, disk_maxsize)
+
+def iter_classes(
+    campus: Literal["62", "128", "BCA"],
+    year: Literal["1", "2", "3", "4", "5"],
+    time_table_json: dict,
+    subject_json: list,
+    batch: str,
+    electives_subject_codes: list[str] = [],
+) -> Iterator[ScheduledClass]:
+    """
+    Lazily yield the classes of a personalized timetable as they are matched.
+
+    The raw timetable is walked on demand, so callers that only need the
+    next class or a count can stop early. collect_timetable() over every
+    class gives what create_time_table returns; errors are raised to the
+    caller instead of producing an empty timetable.
+
+    Args:
+        campus: Campus identifier ("62", "128", or "BCA")
+        year: Year of study ("1", "2", "3", "4", "5")
+        time_table_json: Raw timetable data
+        subject_json: List of subject information dictionaries
+        batch: User's batch (e.g., "A6", "B12", "BCA1")
+        electives_subject_codes: List of enrolled elective subject codes
+
+    Yields:
+        ScheduledClass: Each matched class with its day, times, subject, type and location
+    """
+    creator_module = campus_parser(campus).creator
+    time_table = time_table_json if isinstance(time_table_json, dict) else {}
+    subject_index = SubjectIndex(subject_json)
+    iterate = (
+        creator_module.iter_classes_year1 if year == "1" else creator_module.iter_classes
+    )
+    yield from iterate(
+        creator_module.class_entries(time_table),
+        subject_index,
+        batch,
+        electives_subject_codes,
+    )
+
+
+def create_all_timetables(
+    campus: Literal["62", "128", "BCA"],
+    year: Literal["1", "2", "3", "4", "5"],
+    time_table_json: dict,
+    subject_json: list,
+    electives_by_batch: dict[str, list[str]] | None = None,
+    batches: list[str] | None = None,
+    as_grid: bool = False,
+) -> dict[str, dict] | dict[str, WeekGrid]:
+    """
+    Create the personalized timetable of every batch of a campus/year at once.
+
+    The timetable is tokenized and indexed a single time, and each entry is
+    only visited for the batches it applies to. Each value is identical to
+    what create_time_table returns for that batch.
+
+    Args:
+        campus: Campus identifier ("62", "128", or "BCA")
+        year: Year of study ("1", "2", "3", "4", "5")
+        time_table_json: Raw timetable data
+        subject_json: List of subject information dictionaries
+        electives_by_batch: Enrolled elective subject codes per batch; batches
+            missing from it get no electives. Batches only listed here are
+            generated as well.
+        batches: Only generate these batches, e.g. the affected_batches of a
+            SemesterDiff after a timetable re-release
+        as_grid: Return WeekGrids sharing one ClassTable instead of dicts,
+            for bulk work that keeps many timetables in memory
+
+    Returns:
+        dict[str, dict] | dict[str, WeekGrid]: Batch -> formatted timetable,
+            in natural batch order
+    """
+    semester = compile_semester(campus, year, time_table_json, subject_json)
+    electives_by_batch = electives_by_batch or {}
+    if batches is None:
+        batches = [*semester.batches, *electives_by_batch]
+    batches = sorted(set(batches), key=batch_sort_key)
+    if as_grid:
+        table = ClassTable()
+        return {
+            batch: semester.create_week_grid(
+                batch, electives_by_batch.get(batch, []), table
             )
+            for batch in batches
+        }
+    return {
+        batch: semester.create_time_table(batch, electives_by_batch.get(batch, []))
+        for batch in batches
+    }
+
+
+_resident_semesters: dict[str, CompiledSemester] = {}
+"""Compiled semesters kept alive between calls, keyed by caller-chosen handle"""
+
+
+def load_semester(
+    key: str,
+    json_text: str,
+    campus: Literal["62", "128", "BCA"],
+    year: Literal["1", "2", "3", "4", "5"],
+) -> list[str]:
+    """
+    Parse and compile one campus/year semester and keep it resident under `key`.
+
+    Meant for the Pyodide frontend: the semester JSON crosses the FFI once as
+    a string, and later calls only pass the handle, batch and electives.
+    Loading an existing key replaces it.
+
+    Args:
+        key: Handle used by later create_time_table_by_handle calls
+        json_text: JSON object with "timetable" and "subjects" for one year
+        campus: Campus identifier ("62", "128", or "BCA")
+        year: Year of study ("1", "2", "3", "4", "5")
+
+    Returns:
+        list[str]: Batches named in the timetable, naturally sorted
+    """
+    data = json.loads(json_text)
+    semester = compile_semester(
+        campus, year, data.get("timetable", {}), data.get("subjects", [])
+    )
+    _resident_semesters[key] = semester
+    return list(semester.batches)
+
+
+def unload_semester(key: str) -> bool:
+    """
+    Drop a resident semester.
+
+    Args:
+        key: Handle passed to load_semester
+
+    Returns:
+        bool: True if a semester was loaded under `key`
+    """
+    return _resident_semesters.pop(key, None) is not None
+
+
+def create_time_table_by_handle(
+    key: str,
+    batch: str,
+    electives_subject_codes: list[str] = [],
+) -> str:
+    """
+    Create a personalized timetable from a semester loaded with load_semester.
+
+    Args:
+        key: Handle passed to load_semester
+        batch: User's batch (e.g., "A6", "B12", "BCA1")
+        electives_subject_codes: List of enrolled elective subject codes
+
+    Returns:
+        str: The timetable create_time_table would return, encoded as JSON
+
+    Raises:
+        KeyError: If no semester is loaded under `key`
+    """
+    semester = _resident_semesters.get(key)
+    if semester is None:
+        raise KeyError(f"no semester loaded under {key!r}")
+    return json.dumps(
+        semester.create_time_table(batch, list(electives_subject_codes))
+    )
 
 
 def create_and_compare_timetable(
@@ -128,6 +361,8 @@ def create_and_compare_timetable(
         electives_subject_codes=params_list[1].get("electives_subject_codes", []),
     )
 
+    from modules.compare_tt import compare_timetables
+
     comparison = compare_timetables(timetable1, timetable2)
 
     return {
@@ -137,6 +372,42 @@ def create_and_compare_timetable(
     }
 
 
+def create_and_compare_group(
+    params_list: list[TimetableParams],
+) -> dict:
+    """
+    Create any number of timetables and compare them as a group.
+
+    Args:
+        params_list: One parameter dictionary per person, with the same keys as
+            in create_and_compare_timetable
+
+    Returns:
+        dict: Result containing:
+            - timetables: The generated timetables, in params_list order
+            - comparison: The compare_group result with common_free_slots,
+              busy_counts and classes_together
+    """
+    timetables = [
+        create_time_table(
+            campus=params["campus"],
+            year=params["year"],
+            time_table_json=params["time_table_json"],
+            subject_json=params["subject_json"],
+            batch=params["batch"],
+            electives_subject_codes=params.get("electives_subject_codes", []),
+        )
+        for params in params_list
+    ]
+
+    from modules.compare_tt import compare_group
+
+    return {
+        "timetables": timetables,
+        "comparison": compare_group(timetables),
+    }
+
+
 if __name__ == "__main__":
     ...
     # import json
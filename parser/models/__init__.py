@@ -1,6 +1,10 @@
 from .enums import ClassType, WeekDay, RawWeekDay
 from .subject import Subject
 from .class_info import ClassInfo
+from .parsed_entry import ParsedEntry
+from .time_slot import TimeSlot
+from .scheduled_class import ScheduledClass
+from .week_grid import ClassTable, WeekGrid
 
 __all__ = [
     "ClassType",
@@ -8,4 +12,9 @@ __all__ = [
     "RawWeekDay",
     "Subject",
     "ClassInfo",
+    "ParsedEntry",
+    "TimeSlot",
+    "ScheduledClass",
+    "ClassTable",
+    "WeekGrid",
 ]
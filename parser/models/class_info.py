@@ -3,10 +3,18 @@ from dataclasses import dataclass
 from .enums import ClassType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClassInfo:
     """Information about a single class."""
 
     subject_name: str
     type: ClassType
     location: str
+
+    def to_dict(self) -> dict:
+        """The class as stored in a formatted timetable"""
+        return {
+            "subject_name": self.subject_name,
+            "type": self.type,
+            "location": self.location,
+        }
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedEntry:
+    """A raw timetable class string split into its fields.
+
+    Produced once per distinct string by the campus tokenizers and shared
+    between every lookup of that string, so it is immutable.
+    """
+
+    type: str
+    """Leading type marker as written (usually L, T or P); empty for blank strings"""
+    batch_raw: str
+    """Batch specification as extracted by the campus batch extractor"""
+    batches: tuple[str, ...]
+    """Batches parsed from batch_raw by the campus batch parser"""
+    code: str
+    """Subject code"""
+    location: str
+    """Room or lab identifier"""
+    faculty: str
+    """Faculty initials after the slash; empty if absent"""
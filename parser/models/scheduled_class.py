@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledClass:
+    """One class of a personalized timetable, as yielded by the iter_classes API.
+
+    Fields hold exactly what the formatted timetable dict stores, so
+    `day`, `slot` and `info()` rebuild it entry by entry.
+    """
+
+    day: str
+    """Full day name (e.g. 'Monday'), or the raw day if it is not recognised"""
+    start_time: str
+    """Start time, normally HH:MM"""
+    end_time: str
+    """End time, normally HH:MM"""
+    subject_name: str
+    """Subject name, or the subject code if it has no entry in the subjects list"""
+    type: str
+    """Class type (usually L, T or P)"""
+    location: str
+    """Room or lab identifier"""
+
+    @property
+    def slot(self) -> str:
+        """The 'start-end' key of the class in the formatted timetable"""
+        return f"{self.start_time}-{self.end_time}"
+
+    def info(self) -> dict:
+        """The class as stored in the formatted timetable"""
+        return {
+            "subject_name": self.subject_name,
+            "type": self.type,
+            "location": self.location,
+        }
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+
+def parse_time(time_str: str) -> int:
+    """
+    Convert an 'HH:MM' string to minutes since midnight.
+
+    Args:
+        time_str (str): The time string (e.g., '09:30').
+
+    Returns:
+        int: Minutes since midnight (e.g., 570).
+    """
+    hours, _, minutes = time_str.strip().partition(":")
+    return int(hours) * 60 + int(minutes or 0)
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class TimeSlot:
+    """A class slot as minutes since midnight.
+
+    Produced once per distinct (label, type) by `utils.time.parse_timeslot`.
+    Slots order by start and then end. `end` can reach 24:00 when a slot
+    runs up to midnight.
+    """
+
+    start: int
+    """Start time in minutes since midnight"""
+    end: int
+    """End time in minutes since midnight"""
+
+    @property
+    def start_time(self) -> str:
+        """Start time in HH:MM format"""
+        return f"{self.start // 60:02d}:{self.start % 60:02d}"
+
+    @property
+    def end_time(self) -> str:
+        """End time in HH:MM format"""
+        return f"{self.end // 60:02d}:{self.end % 60:02d}"
+
+    @classmethod
+    def from_label(cls, label: str) -> "TimeSlot | None":
+        """Parse an 'HH:MM-HH:MM' slot key of a formatted timetable; None if malformed"""
+        try:
+            start, end = label.split("-")
+            return cls(parse_time(start), parse_time(end))
+        except (AttributeError, ValueError):
+            return None
+
+    def __str__(self) -> str:
+        return f"{self.start_time}-{self.end_time}"
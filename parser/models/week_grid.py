@@ -0,0 +1,174 @@
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .class_info import ClassInfo
+from .scheduled_class import ScheduledClass
+from .time_slot import TimeSlot
+
+
+class ClassTable:
+    """Interned classes and slot labels shared by any number of WeekGrids.
+
+    Grids of one semester typically reuse a few dozen classes and slot
+    labels, so each is stored once here and grids only hold small integer
+    ids. Slot labels are parsed into TimeSlots once, on first use.
+    """
+
+    __slots__ = ("classes", "labels", "slots", "_class_ids", "_label_ids")
+
+    def __init__(self) -> None:
+        self.classes: list[ClassInfo] = []
+        """Interned classes, indexed by class id"""
+        self.labels: list[str] = []
+        """Interned 'start-end' slot labels, indexed by label id"""
+        self.slots: list[TimeSlot | None] = []
+        """Parsed slot per label id; None if the label is malformed"""
+        self._class_ids: dict[ClassInfo, int] = {}
+        self._label_ids: dict[str, int] = {}
+
+    def class_id(self, class_info: ClassInfo) -> int:
+        """Return the id of a class, interning it if new"""
+        class_id = self._class_ids.get(class_info)
+        if class_id is None:
+            class_id = self._class_ids[class_info] = len(self.classes)
+            self.classes.append(class_info)
+        return class_id
+
+    def label_id(self, label: str) -> int:
+        """Return the id of a slot label, interning and parsing it if new"""
+        label_id = self._label_ids.get(label)
+        if label_id is None:
+            label_id = self._label_ids[label] = len(self.labels)
+            self.labels.append(label)
+            self.slots.append(TimeSlot.from_label(label))
+        return label_id
+
+
+@dataclass(frozen=True, slots=True)
+class WeekGrid:
+    """A formatted timetable stored as compact arrays over a ClassTable.
+
+    Each placement (day, slot) -> class is three array items: a day index,
+    an interned slot label id and an interned class id, kept in the dict's
+    insertion order. `to_dict()` rebuilds the formatted timetable exactly,
+    for class entries holding subject_name, type and location.
+
+    Build instances with `from_dict` or `from_classes`.
+    """
+
+    table: ClassTable
+    """Class and label interning shared with other grids"""
+    days: tuple[str, ...]
+    """Day names in first-seen order"""
+    day_ids: array
+    """Per placement: index into days"""
+    label_ids: array
+    """Per placement: slot label id in table"""
+    class_ids: array
+    """Per placement: class id in table"""
+
+    @classmethod
+    def from_dict(cls, timetable: dict, table: ClassTable | None = None) -> "WeekGrid":
+        """
+        Compact a formatted timetable.
+
+        Args:
+            timetable (dict): Day -> 'start-end' slot -> class info dict.
+            table (ClassTable | None): Table to intern into; a new one if None.
+
+        Returns:
+            WeekGrid: The compacted timetable.
+        """
+        table = table if table is not None else ClassTable()
+        day_ids, label_ids, class_ids = array("B"), array("I"), array("I")
+        for day_id, slots in enumerate(timetable.values()):
+            for label, class_info in slots.items():
+                day_ids.append(day_id)
+                label_ids.append(table.label_id(label))
+                class_ids.append(
+                    table.class_id(
+                        ClassInfo(
+                            class_info.get("subject_name"),
+                            class_info.get("type"),
+                            class_info.get("location"),
+                        )
+                    )
+                )
+        return cls(table, tuple(timetable), day_ids, label_ids, class_ids)
+
+    @classmethod
+    def from_classes(
+        cls, classes: Iterable[ScheduledClass], table: ClassTable | None = None
+    ) -> "WeekGrid":
+        """
+        Build a grid straight from scheduled classes, without the nested dict.
+
+        Like the formatted timetable, a later class in the same day and slot
+        replaces the earlier one but keeps its position.
+
+        Args:
+            classes (Iterable[ScheduledClass]): Classes in timetable order.
+            table (ClassTable | None): Table to intern into; a new one if None.
+
+        Returns:
+            WeekGrid: Equal to `from_dict(collect_timetable(classes))`.
+        """
+        table = table if table is not None else ClassTable()
+        days: dict[str, int] = {}
+        placements: dict[tuple[int, int], int] = {}
+        for scheduled in classes:
+            day_id = days.setdefault(scheduled.day, len(days))
+            label_id = table.label_id(scheduled.slot)
+            placements[day_id, label_id] = table.class_id(
+                ClassInfo(scheduled.subject_name, scheduled.type, scheduled.location)
+            )
+
+        # Placements were inserted in timetable order; the dict groups them by day.
+        ordered = sorted(placements.items(), key=lambda item: item[0][0])
+        return cls(
+            table,
+            tuple(days),
+            array("B", [day_id for (day_id, _), _ in ordered]),
+            array("I", [label_id for (_, label_id), _ in ordered]),
+            array("I", [class_id for _, class_id in ordered]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.class_ids)
+
+    def to_dict(self) -> dict:
+        """The formatted timetable: day -> 'start-end' slot -> class info dict"""
+        timetable: dict[str, dict] = {day: {} for day in self.days}
+        labels, classes = self.table.labels, self.table.classes
+        for day_id, label_id, class_id in zip(
+            self.day_ids, self.label_ids, self.class_ids
+        ):
+            timetable[self.days[day_id]][labels[label_id]] = classes[class_id].to_dict()
+        return timetable
+
+    def intervals(self) -> dict[str, list[tuple[int, int, ClassInfo]]]:
+        """
+        Every day's classes as (start, end, class) minute intervals.
+
+        Malformed and empty slots are skipped; days without any are kept.
+
+        Returns:
+            dict[str, list[tuple[int, int, ClassInfo]]]: Day -> intervals
+                sorted by start and end.
+        """
+        by_day: dict[str, list[tuple[int, int, ClassInfo]]] = {
+            day: [] for day in self.days
+        }
+        slots, classes = self.table.slots, self.table.classes
+        for day_id, label_id, class_id in zip(
+            self.day_ids, self.label_ids, self.class_ids
+        ):
+            slot = slots[label_id]
+            if slot is not None and slot.start < slot.end:
+                by_day[self.days[day_id]].append(
+                    (slot.start, slot.end, classes[class_id])
+                )
+        for intervals in by_day.values():
+            intervals.sort(key=lambda interval: interval[:2])
+        return by_day
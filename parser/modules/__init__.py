@@ -2,14 +2,50 @@
 Timetable creator modules.
 """
 
-from utils.batch import parse_batch_numbers, is_elective, is_batch_included, batch_extractor
-from utils.subject import subject_extractor, subject_name_extractor, is_enrolled_subject
+from importlib import import_module
+
+from utils.batch import (
+    parse_batch_numbers,
+    is_elective,
+    is_batch_included,
+    batch_extractor,
+    BatchSpec,
+    batch_spec,
+)
+from utils.subject import (
+    subject_extractor,
+    subject_name_extractor,
+    is_enrolled_subject,
+    SubjectIndex,
+)
 from utils.location import location_extractor
-from utils.time import process_day, convert_time_format, process_timeslot
+from utils.time import process_day, convert_time_format, parse_timeslot, process_timeslot
+from utils.tokenizer import tokenize
 from utils.debug import pprint
 
-from .tt_parsers import sector_62, sector_128, BCA
-from .compare_tt import compare_timetables, _expand_timetable_to_hourly
+from .semester import CompiledSemester, compile_semester
+
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "sector_62": (".tt_parsers.sector_62", None),
+    "sector_128": (".tt_parsers.sector_128", None),
+    "BCA": (".tt_parsers.BCA", None),
+    "compare_timetables": (".compare_tt", "compare_timetables"),
+    "compare_group": (".compare_tt", "compare_group"),
+    "compatibility_matrix": (".compare_tt", "compatibility_matrix"),
+    "_expand_timetable_to_hourly": (".compare_tt", "_expand_timetable_to_hourly"),
+}
+"""Campus packages and comparisons, imported on first access (PEP 562):
+name -> (module, attribute of the module or None for the module itself)"""
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = import_module(module_name, __name__)
+    value = globals()[name] = module if attribute is None else getattr(module, attribute)
+    return value
+
 
 __all__ = [
     # Common utilities
@@ -17,13 +53,18 @@ __all__ = [
     "is_elective",
     "is_batch_included",
     "batch_extractor",
+    "BatchSpec",
+    "batch_spec",
     "subject_extractor",
     "location_extractor",
     "subject_name_extractor",
     "is_enrolled_subject",
+    "SubjectIndex",
     "process_day",
     "convert_time_format",
+    "parse_timeslot",
     "process_timeslot",
+    "tokenize",
     "pprint",
     # Modules
     "sector_62",
@@ -31,5 +72,10 @@ __all__ = [
     "BCA",
     # Compare
     "compare_timetables",
+    "compare_group",
+    "compatibility_matrix",
     "_expand_timetable_to_hourly",
+    # Compiled semesters
+    "CompiledSemester",
+    "compile_semester",
 ]
@@ -1,3 +1,10 @@
 from .compare import compare_timetables, _expand_timetable_to_hourly
+from .group import compare_group
+from .matrix import compatibility_matrix
 
-__all__ = ["compare_timetables", "_expand_timetable_to_hourly"]
+__all__ = [
+    "compare_timetables",
+    "_expand_timetable_to_hourly",
+    "compare_group",
+    "compatibility_matrix",
+]
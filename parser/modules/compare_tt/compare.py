@@ -1,3 +1,16 @@
+import heapq
+
+from models.week_grid import WeekGrid
+
+from .intervals import (
+    class_dict,
+    class_key,
+    format_range,
+    parse_time,
+    timetable_intervals,
+)
+
+
 def _expand_timetable_to_hourly(timetable: dict) -> dict:
     """
     Expand a timetable with multi-hour blocks into hourly slots.
@@ -32,53 +45,106 @@ def _expand_timetable_to_hourly(timetable: dict) -> dict:
     return expanded
 
 
-def compare_timetables(timetable1: dict, timetable2: dict) -> dict:
+def _merge_together(together: list[tuple[int, int, tuple, dict]]) -> dict:
     """
-    Compare two timetables and return:
-      - common_free_slots: dict of day -> list of time slots where both are free
-      - classes_together: dict of day -> dict of time slot -> class info where both have the same class
+    Merge touching or overlapping shared-class intervals of the same class.
+    """
+    together.sort(key=lambda item: item[:2])
+    merged: list[list] = []
+    last_run: dict[tuple, list] = {}
+    for start, end, key, class_info in together:
+        run = last_run.get(key)
+        if run is not None and start <= run[1]:
+            run[1] = max(run[1], end)
+        else:
+            run = last_run[key] = [start, end, class_info]
+            merged.append(run)
+    return {format_range(start, end): class_info for start, end, class_info in merged}
+
+
+def compare_timetables(
+    timetable1: dict | WeekGrid,
+    timetable2: dict | WeekGrid,
+    day_start: str = "08:00",
+    day_end: str = "17:00",
+) -> dict:
+    """
+    Compare two timetables at minute resolution and return:
+      - common_free_slots: dict of day -> list of time ranges within the day window where both are free
+      - classes_together: dict of day -> dict of time range -> class info where both have the same class
+
+    Each day's classes are turned into sorted intervals and both people are
+    walked in a single merge sweep, so 50-minute slots and labs that do not
+    start on the hour are compared exactly. Ranges have any length (e.g.
+    "11:50-14:00"), unlike the fixed hourly slots of earlier versions.
+
+    Args:
+        timetable1: First personalized timetable, as a dict or WeekGrid
+        timetable2: Second personalized timetable, as a dict or WeekGrid
+        day_start: Start of the day window, "HH:MM"
+        day_end: End of the day window, "HH:MM"
     """
-    # Expand both timetables to hourly slots for accurate comparison
-    expanded1 = _expand_timetable_to_hourly(timetable1)
-    expanded2 = _expand_timetable_to_hourly(timetable2)
+    window_start, window_end = parse_time(day_start), parse_time(day_end)
+
+    intervals1 = timetable_intervals(timetable1)
+    intervals2 = timetable_intervals(timetable2)
 
     # Collect all days
-    all_days = set(timetable1.keys()) | set(timetable2.keys())
+    all_days = set(intervals1.keys()) | set(intervals2.keys())
     result = {
         "common_free_slots": {},
         "classes_together": {},
     }
 
     for day in all_days:
-        slots1 = expanded1.get(day, {})
-        slots2 = expanded2.get(day, {})
-
-        # Generate all hourly slots with 2-digit format (08:00, 09:00, etc.)
-        all_slots = [f"{time:02d}:00-{time+1:02d}:00" for time in range(8, 17)]
+        # Each person's classes as (start, end, class_info, person), by start
+        tagged = [
+            [(start, end, class_info, person) for start, end, class_info in intervals]
+            for person, intervals in enumerate(
+                person_intervals.get(day, [])
+                for person_intervals in (intervals1, intervals2)
+            )
+        ]
 
         free_slots = []
-        together_slots = {}
-
-        for slot in all_slots:
-            class1 = slots1.get(slot)
-            class2 = slots2.get(slot)
-
-            if class1 is None and class2 is None:
-                free_slots.append(slot)  # both free
-
-            elif class1 is not None and class2 is not None:
-                # Both have a class at this slot
-                if (
-                    class1.get("subject_name") == class2.get("subject_name")
-                    and class1.get("type") == class2.get("type")
-                    and class1.get("location") == class2.get("location")
-                ):
-                    together_slots[slot] = class1
+        together = []
+        # Classes of each person that may still overlap later ones
+        active: tuple[list, list] = ([], [])
+        cursor = window_start
+
+        for start, end, class_info, person in heapq.merge(
+            *tagged, key=lambda item: item[:2]
+        ):
+            if start > cursor and cursor < window_end:
+                free_slots.append(format_range(cursor, min(start, window_end)))
+            cursor = max(cursor, end)
+
+            # Everything still active for the other person started no later
+            # than this class, so the overlap starts here.
+            other = active[1 - person]
+            other[:] = [item for item in other if item[1] > start]
+            key = class_key(class_info)
+            for _, other_end, other_info in other:
+                overlap_start = max(start, window_start)
+                overlap_end = min(end, other_end, window_end)
+                if overlap_start < overlap_end and class_key(other_info) == key:
+                    together.append(
+                        (
+                            overlap_start,
+                            overlap_end,
+                            key,
+                            class_dict(class_info if person == 0 else other_info),
+                        )
+                    )
+            active[person].append((start, end, class_info))
+
+        if cursor < window_end:
+            free_slots.append(format_range(cursor, window_end))
 
         if free_slots:
             result["common_free_slots"][day] = free_slots
 
-        if together_slots:
-            result["classes_together"][day] = together_slots
+        if together:
+            result["classes_together"][day] = _merge_together(together)
 
     return result
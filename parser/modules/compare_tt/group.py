@@ -0,0 +1,139 @@
+from bisect import bisect_left
+from collections.abc import Iterator
+
+from models.week_grid import WeekGrid
+
+from .intervals import (
+    class_dict,
+    class_key,
+    format_range,
+    parse_time,
+    timetable_intervals,
+)
+
+
+def _runs(bounds: list[int], values: list) -> Iterator[tuple[int, int, object]]:
+    """
+    Yield (start, end, value) for each run of equal, non-None segment values.
+    """
+    run_start = 0
+    for index in range(1, len(values) + 1):
+        if index == len(values) or values[index] != values[run_start]:
+            if values[run_start] is not None:
+                yield bounds[run_start], bounds[index], values[run_start]
+            run_start = index
+
+
+def compare_group(
+    timetables: list[dict | WeekGrid],
+    day_start: str = "08:00",
+    day_end: str = "17:00",
+) -> dict:
+    """
+    Compare any number of timetables at once, at minute resolution.
+
+    Each day window is cut at every class boundary, and each resulting
+    segment holds a bitset with bit i set when person i (the i-th timetable)
+    has a class then, plus one bitset per distinct class. Free time, busy
+    counts and shared classes then come from integer comparisons and
+    popcounts. For two timetables, common_free_slots and classes_together
+    match compare_timetables.
+
+    Args:
+        timetables: Personalized timetables (dicts or WeekGrids), one per person
+        day_start: Start of the day window, "HH:MM"
+        day_end: End of the day window, "HH:MM"
+
+    Returns:
+        dict: Result containing:
+            - common_free_slots: dict of day -> list of time ranges where everyone is free
+            - busy_counts: dict of day -> dict of time range -> number of people busy,
+              for ranges where anyone is busy
+            - classes_together: dict of day -> dict of time range -> class info where
+              everyone has the same class
+    """
+    window_start, window_end = parse_time(day_start), parse_time(day_end)
+    everyone = (1 << len(timetables)) - 1
+
+    # day -> per-person intervals clipped to the window, days in first-seen order
+    days: dict[str, list[list]] = {}
+    for person, timetable in enumerate(timetables):
+        for day, intervals in timetable_intervals(timetable).items():
+            per_person = days.setdefault(day, [[] for _ in timetables])
+            per_person[person] = [
+                (max(start, window_start), min(end, window_end), class_info)
+                for start, end, class_info in intervals
+                if start < window_end and end > window_start
+            ]
+
+    result = {
+        "common_free_slots": {},
+        "busy_counts": {},
+        "classes_together": {},
+    }
+
+    for day, per_person in days.items():
+        bounds = sorted(
+            {
+                window_start,
+                window_end,
+                *(
+                    bound
+                    for intervals in per_person
+                    for start, end, _ in intervals
+                    for bound in (start, end)
+                ),
+            }
+        )
+        busy = [0] * (len(bounds) - 1)
+        attending: list[dict[tuple, int]] = [{} for _ in busy]
+        lead_info: dict[tuple, dict] = {}
+
+        for person, intervals in enumerate(per_person):
+            bit = 1 << person
+            for start, end, class_info in intervals:
+                key = class_key(class_info)
+                if person == 0:
+                    lead_info.setdefault(key, class_info)
+                for segment in range(
+                    bisect_left(bounds, start), bisect_left(bounds, end)
+                ):
+                    busy[segment] |= bit
+                    by_class = attending[segment]
+                    by_class[key] = by_class.get(key, 0) | bit
+
+        free_slots = [
+            format_range(start, end)
+            for start, end, _ in _runs(
+                bounds, [True if not people else None for people in busy]
+            )
+        ]
+        busy_counts = {
+            format_range(start, end): count
+            for start, end, count in _runs(
+                bounds, [people.bit_count() or None for people in busy]
+            )
+        }
+        shared = []
+        for key in lead_info:
+            attended = [
+                True if by_class.get(key) == everyone else None
+                for by_class in attending
+            ]
+            shared.extend(
+                (start, end, key) for start, end, _ in _runs(bounds, attended)
+            )
+        shared.sort(key=lambda run: run[:2])
+        together_slots = {
+            format_range(start, end): class_dict(lead_info[key])
+            for start, end, key in shared
+        }
+
+        if free_slots:
+            result["common_free_slots"][day] = free_slots
+        if busy_counts:
+            result["busy_counts"][day] = busy_counts
+        if together_slots:
+            result["classes_together"][day] = together_slots
+
+    return result
@@ -0,0 +1,96 @@
+"""
+Minute-resolution interval helpers shared by the timetable comparisons.
+"""
+
+from models.class_info import ClassInfo
+from models.time_slot import TimeSlot, parse_time
+from models.week_grid import WeekGrid
+
+Interval = tuple[int, int, dict | ClassInfo]
+"""(start, end, class_info) with times in minutes since midnight"""
+
+
+def format_range(start: int, end: int) -> str:
+    """
+    Format a minute range as an 'HH:MM-HH:MM' time slot.
+
+    Args:
+        start (int): Start in minutes since midnight.
+        end (int): End in minutes since midnight.
+
+    Returns:
+        str: The time slot (e.g., '09:00-10:50').
+    """
+    return f"{start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}"
+
+
+def day_intervals(slots: dict) -> list[Interval]:
+    """
+    Turn one day of a personalized timetable into intervals sorted by start.
+
+    Slots whose time range cannot be parsed, or that are empty, are skipped.
+
+    Args:
+        slots (dict): Time slot -> class info for one day.
+
+    Returns:
+        list[Interval]: The day's classes sorted by start and end.
+    """
+    intervals = []
+    for time_range, class_info in slots.items():
+        slot = TimeSlot.from_label(time_range)
+        if slot is not None and slot.start < slot.end:
+            intervals.append((slot.start, slot.end, class_info))
+    intervals.sort(key=lambda interval: interval[:2])
+    return intervals
+
+
+def timetable_intervals(timetable: dict | WeekGrid) -> dict[str, list[Interval]]:
+    """
+    Turn every day of a personalized timetable into sorted intervals.
+
+    WeekGrids are read directly from their arrays, without the nested dict.
+
+    Args:
+        timetable (dict | WeekGrid): A formatted timetable or its grid.
+
+    Returns:
+        dict[str, list[Interval]]: Day -> the day's classes sorted by start and end.
+    """
+    if isinstance(timetable, WeekGrid):
+        return timetable.intervals()
+    return {day: day_intervals(slots) for day, slots in timetable.items()}
+
+
+def class_key(class_info: dict | ClassInfo) -> tuple:
+    """
+    Identity of a class for deciding whether two people attend the same one.
+
+    Args:
+        class_info (dict | ClassInfo): A class entry of a personalized timetable.
+
+    Returns:
+        tuple: (subject_name, type, location).
+    """
+    if isinstance(class_info, ClassInfo):
+        return class_info.subject_name, class_info.type, class_info.location
+    return (
+        class_info.get("subject_name"),
+        class_info.get("type"),
+        class_info.get("location"),
+    )
+
+
+def class_dict(class_info: dict | ClassInfo) -> dict:
+    """
+    A class entry as it appears in comparison results.
+
+    Args:
+        class_info (dict | ClassInfo): A class entry of a personalized timetable.
+
+    Returns:
+        dict: The class info dict.
+    """
+    if isinstance(class_info, ClassInfo):
+        return class_info.to_dict()
+    return class_info
@@ -0,0 +1,99 @@
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
+from models.week_grid import WeekGrid
+
+from .intervals import parse_time, timetable_intervals
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def compatibility_matrix(
+    timetables: Sequence[dict | WeekGrid] | Mapping[str, dict | WeekGrid],
+    day_start: str = "08:00",
+    day_end: str = "17:00",
+) -> tuple["np.ndarray", list[str]]:
+    """
+    Count the free minutes every pair of people share in a week.
+
+    The day window of every day in the roster is cut at every class boundary,
+    giving an M x segments occupancy matrix that is built once. The shared
+    free time of all pairs is then a single weighted matrix product. Entry
+    [i, j] is the total length of the compare_timetables(i, j)
+    common_free_slots, with days that neither has classes on but someone
+    else in the roster does counted as free. The diagonal holds each person's
+    own free minutes.
+
+    Requires numpy (the `matrix` extra).
+
+    Args:
+        timetables: Personalized timetables (dicts or WeekGrids), as a list or
+            as name -> timetable
+        day_start: Start of the day window, "HH:MM"
+        day_end: End of the day window, "HH:MM"
+
+    Returns:
+        tuple[numpy.ndarray, list[str]]: The M x M matrix of shared free minutes
+            (int64) and the row/column labels: the mapping keys, or the list
+            positions as strings.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "compatibility_matrix requires numpy: "
+            "pip install 'jiit-timetable-parser[matrix]'"
+        ) from e
+
+    if isinstance(timetables, Mapping):
+        labels = [str(label) for label in timetables]
+        timetables = list(timetables.values())
+    else:
+        labels = [str(position) for position in range(len(timetables))]
+
+    window_start, window_end = parse_time(day_start), parse_time(day_end)
+
+    # day -> per-person intervals clipped to the window, days in first-seen order
+    days: dict[str, list[list[tuple[int, int]]]] = {}
+    for person, timetable in enumerate(timetables):
+        for day, intervals in timetable_intervals(timetable).items():
+            per_person = days.setdefault(day, [[] for _ in timetables])
+            per_person[person] = [
+                (max(start, window_start), min(end, window_end))
+                for start, end, _ in intervals
+                if start < window_end and end > window_start
+            ]
+
+    occupancy_blocks = []
+    weight_blocks = []
+    for per_person in days.values():
+        bounds = sorted(
+            {
+                window_start,
+                window_end,
+                *(
+                    bound
+                    for intervals in per_person
+                    for interval in intervals
+                    for bound in interval
+                ),
+            }
+        )
+        busy = np.zeros((len(timetables), len(bounds) - 1), dtype=bool)
+        for person, intervals in enumerate(per_person):
+            for start, end in intervals:
+                busy[person, bisect_left(bounds, start) : bisect_left(bounds, end)] = (
+                    True
+                )
+        occupancy_blocks.append(busy)
+        weight_blocks.append(np.diff(np.asarray(bounds, dtype=np.float64)))
+
+    if not occupancy_blocks:
+        return np.zeros((len(timetables), len(timetables)), dtype=np.int64), labels
+
+    free = ~np.concatenate(occupancy_blocks, axis=1)
+    weights = np.concatenate(weight_blocks)
+    shared = (free * weights) @ free.T.astype(np.float64)
+    return np.rint(shared).astype(np.int64), labels
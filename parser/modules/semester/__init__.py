@@ -0,0 +1,28 @@
+from .compiled import (
+    CampusParser,
+    CompiledSemester,
+    batch_sort_key,
+    campus_parser,
+    campus_profile,
+    compile_semester,
+)
+from .cache import CACHE_VERSION, TimetableCache, semester_hash
+from .diff import SemesterDiff, diff_campus_files, diff_semesters
+from .layout import CAMPUSES, semester_jobs
+
+__all__ = [
+    "CampusParser",
+    "CompiledSemester",
+    "batch_sort_key",
+    "campus_parser",
+    "campus_profile",
+    "compile_semester",
+    "CACHE_VERSION",
+    "TimetableCache",
+    "semester_hash",
+    "SemesterDiff",
+    "diff_campus_files",
+    "diff_semesters",
+    "CAMPUSES",
+    "semester_jobs",
+]
@@ -0,0 +1,378 @@
+"""
+Result cache for personalised timetables.
+
+Timetables are keyed by a content hash of the semester (raw timetable and
+subjects) together with campus, year, batch and the sorted, deduplicated
+elective codes, which the creators treat as a set. Results are kept as
+compact JSON in a bounded in-memory LRU and, optionally, as one JSON blob
+per key in a bounded directory that survives restarts.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+_CREATOR_SOURCES = (
+    "models",
+    "utils",
+    "modules/tt_parsers",
+    "modules/semester/compiled",
+)
+"""Packages, and modules without their suffix, relative to the parser root
+whose code decides generated timetables"""
+
+
+def _source_hash(root: str | os.PathLike, sources: tuple[str, ...]) -> str:
+    """
+    Hash the code of some packages and modules.
+
+    Sources and compiled modules in place of them (as in the slim wheel) are
+    both hashed; `__pycache__` directories are skipped.
+
+    Args:
+        root (str | os.PathLike): Directory the sources are relative to.
+        sources (tuple[str, ...]): Package directories, or module paths
+            without their suffix.
+
+    Returns:
+        str: Hex SHA-256 prefix over the relative path and content of each file.
+    """
+    root = Path(root)
+    digest = hashlib.sha256()
+    for source in sources:
+        path = root / source
+        files = (
+            sorted(path.rglob("*"))
+            if path.is_dir()
+            else [path.with_suffix(".py"), path.with_suffix(".pyc")]
+        )
+        for file in files:
+            relative = file.relative_to(root)
+            if (
+                file.suffix in (".py", ".pyc")
+                and "__pycache__" not in relative.parts
+                and file.is_file()
+            ):
+                digest.update(relative.as_posix().encode("utf-8") + b"\0")
+                digest.update(file.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+CACHE_VERSION = _source_hash(Path(__file__).resolve().parents[2], _CREATOR_SOURCES)
+"""Part of every key: a hash of the creator sources, so blobs written before
+any change to them are no longer served"""
+
+
+def _dump(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def semester_hash(time_table_json: dict, subject_json: list) -> str:
+    """
+    Hash the content of a semester.
+
+    Key order is kept, since it decides the order of the generated timetable.
+
+    Args:
+        time_table_json (dict): Raw timetable data.
+        subject_json (list): Subject information dictionaries.
+
+    Returns:
+        str: Hex SHA-256 of the serialized timetable and subjects.
+    """
+    return hashlib.sha256(
+        _dump([time_table_json, subject_json]).encode("utf-8")
+    ).hexdigest()
+
+
+class TimetableCache:
+    """
+    In-memory LRU with an optional on-disk tier in front of a timetable
+    creator such as `main.create_time_table`.
+
+    Semester hashes are remembered by object id for the last 16
+    timetable/subject pairs seen, so the raw data passed in must not be
+    mutated afterwards. Those pairs are kept alive by the cache, since a
+    freed object's id can be reused, and plain dicts and lists cannot be
+    weakly referenced; `clear()` releases them. Each call returns a fresh
+    dict. Safe to share between threads.
+
+    The on-disk tier is best-effort: a blob that cannot be read or written is
+    a miss or a skipped write, never an error. Once it holds more than
+    disk_maxsize blobs, the least recently used tenth is deleted.
+    """
+
+    def __init__(
+        self,
+        create: Callable[..., dict],
+        maxsize: int = 1024,
+        directory: str | os.PathLike | None = None,
+        disk_maxsize: int = 65536,
+    ) -> None:
+        """
+        Args:
+            create (Callable[..., dict]): Called as create(campus, year,
+                time_table_json, subject_json, batch, electives) on a miss.
+            maxsize (int): Timetables kept in memory.
+            directory (str | os.PathLike | None): Directory for the on-disk
+                tier; memory only if None.
+            disk_maxsize (int): Blobs kept in directory.
+        """
+        self.create = create
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        self.disk_maxsize = disk_maxsize
+        self.hits = 0
+        """Lookups answered from memory"""
+        self.disk_hits = 0
+        """Lookups answered from the on-disk tier"""
+        self.misses = 0
+        """Lookups that generated the timetable"""
+        self.evictions = 0
+        """Timetables dropped from memory to respect maxsize"""
+        self.disk_evictions = 0
+        """Blobs deleted to respect disk_maxsize"""
+        self._disk_size: int | None = None
+        """Blobs in directory; None until the first write counts them"""
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._semesters: OrderedDict[int, tuple[dict, list, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _semester_hash(self, time_table_json: dict, subject_json: list) -> str:
+        with self._lock:
+            known = self._semesters.get(id(time_table_json))
+            if known is not None and known[1] is subject_json:
+                self._semesters.move_to_end(id(time_table_json))
+                return known[2]
+        digest = semester_hash(time_table_json, subject_json)
+        with self._lock:
+            # The objects are kept alive so their ids are not reused.
+            self._semesters[id(time_table_json)] = (
+                time_table_json,
+                subject_json,
+                digest,
+            )
+            if len(self._semesters) > 16:
+                self._semesters.popitem(last=False)
+        return digest
+
+    def key(
+        self,
+        campus: str,
+        year: str,
+        time_table_json: dict,
+        subject_json: list,
+        batch: str,
+        electives_subject_codes: list[str] = [],
+    ) -> str:
+        """
+        Cache key of a timetable request.
+
+        Returns:
+            str: Hex SHA-256 of the cache version, semester hash, campus, year,
+                batch and normalized electives.
+        """
+        electives = sorted(set(electives_subject_codes))
+        request = _dump(
+            [
+                CACHE_VERSION,
+                self._semester_hash(time_table_json, subject_json),
+                campus,
+                year,
+                batch,
+                electives,
+            ]
+        )
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, text: str) -> None:
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _blobs(self) -> list[Path]:
+        return list(self.directory.glob("*/*.json"))
+
+    def _read(self, key: str) -> str | None:
+        path = self._path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        # Blobs are evicted oldest mtime first, so a read counts as a use.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return text
+
+    def _write(self, key: str, text: str) -> None:
+        path = self._path(key)
+        temporary = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            existed = path.exists()
+            # Written to a temporary file first so readers never see a partial blob.
+            handle, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(handle, "w", encoding="utf-8") as blob:
+                blob.write(text)
+            os.replace(temporary, path)
+            temporary = None
+            with self._lock:
+                if self._disk_size is None:
+                    self._disk_size = len(self._blobs())
+                elif not existed:
+                    self._disk_size += 1
+                full = self._disk_size > self.disk_maxsize
+            if full:
+                self._evict_disk()
+        except OSError:
+            if temporary is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(temporary)
+
+    def _evict_disk(self) -> None:
+        with self._lock:
+            blobs = []
+            for path in self._blobs():
+                with contextlib.suppress(OSError):
+                    blobs.append((path.stat().st_mtime, path))
+            blobs.sort(key=lambda blob: blob[0])
+            # Down to 90% of the budget, so the directory is not rescanned on
+            # every write once it is full.
+            excess = len(blobs) - self.disk_maxsize * 9 // 10
+            for _, path in blobs[: max(excess, 0)]:
+                with contextlib.suppress(OSError):
+                    path.unlink()
+                    self.disk_evictions += 1
+            self._disk_size = len(blobs) - max(excess, 0)
+
+    def get_json(
+        self,
+        campus: str,
+        year: str,
+        time_table_json: dict,
+        subject_json: list,
+        batch: str,
+        electives_subject_codes: list[str] = [],
+    ) -> str:
+        """
+        Return a timetable as compact JSON, generating it only on a miss.
+
+        Args:
+            campus (str): Campus identifier ("62", "128", or "BCA").
+            year (str): Year of study ("1", "2", "3", "4", "5").
+            time_table_json (dict): Raw timetable data.
+            subject_json (list): Subject information dictionaries.
+            batch (str): User's batch (e.g., "A6", "B12", "BCA1").
+            electives_subject_codes (list[str]): Enrolled elective subject codes.
+
+        Returns:
+            str: The timetable `create` returns, encoded as JSON.
+        """
+        key = self.key(
+            campus,
+            year,
+            time_table_json,
+            subject_json,
+            batch,
+            electives_subject_codes,
+        )
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return text
+
+        if self.directory is not None:
+            text = self._read(key)
+            if text is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                self._remember(key, text)
+                return text
+
+        text = _dump(
+            self.create(
+                campus,
+                year,
+                time_table_json,
+                subject_json,
+                batch,
+                electives_subject_codes,
+            )
+        )
+        with self._lock:
+            self.misses += 1
+        self._remember(key, text)
+
+        if self.directory is not None:
+            self._write(key, text)
+        return text
+
+    def create_time_table(
+        self,
+        campus: str,
+        year: str,
+        time_table_json: dict,
+        subject_json: list,
+        batch: str,
+        electives_subject_codes: list[str] = [],
+    ) -> dict:
+        """
+        Cached equivalent of `create(...)`; see get_json.
+
+        Returns:
+            dict: A fresh copy of the formatted personalized timetable.
+        """
+        return json.loads(
+            self.get_json(
+                campus,
+                year,
+                time_table_json,
+                subject_json,
+                batch,
+                electives_subject_codes,
+            )
+        )
+
+    def stats(self) -> dict:
+        """
+        Counters for monitoring.
+
+        Returns:
+            dict: hits, disk_hits, misses, evictions, disk_evictions, the
+                number of timetables in memory (size), maxsize and the hit
+                ratio over all lookups.
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_evictions": self.disk_evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_ratio": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Drop the in-memory tier and reset the counters; disk blobs are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._semesters.clear()
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+            self.disk_evictions = 0
@@ -0,0 +1,357 @@
+"""
+Compiled semesters: tokenize and index a raw timetable once, then build
+personalised timetables for any number of batches from the index.
+"""
+
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from importlib import import_module
+from itertools import chain
+from types import MappingProxyType, ModuleType
+from typing import NamedTuple
+
+from models.parsed_entry import ParsedEntry
+from models.scheduled_class import ScheduledClass
+from models.week_grid import ClassTable, WeekGrid
+from utils.batch import BatchSpec
+from utils.profiling import Hook, Profile, module_hooks
+from utils.subject import EnrolledSubjects, SubjectIndex
+from utils.time import parse_timeslot
+
+ClassEntry = tuple[str, str, ParsedEntry]
+"""A tokenized class string with its raw day and time slot keys"""
+
+
+class CampusParser(NamedTuple):
+    """The campus-specific pieces a compiled semester is built from."""
+
+    creator: ModuleType
+    """Creator module providing class_entries, build and build_year1"""
+    batch_spec: Callable[[str], BatchSpec]
+    """Compiles a raw batch specification"""
+    tokenize: Callable[[str], ParsedEntry]
+    """Tokenizes a raw class string"""
+    is_elective: Callable[[ParsedEntry], bool]
+    """Whether a tokenized class string is an elective"""
+
+
+_CAMPUS_MODULES: dict[str, tuple[str, str, str]] = {
+    "62": ("modules.tt_parsers.sector_62.creator", "utils.batch", "utils.tokenizer"),
+    "128": (
+        "modules.tt_parsers.sector_128.creator",
+        "modules.tt_parsers.sector_128.utils",
+        "modules.tt_parsers.sector_128.utils",
+    ),
+    "BCA": (
+        "modules.tt_parsers.BCA.creator",
+        "modules.tt_parsers.BCA.utils",
+        "modules.tt_parsers.BCA.utils",
+    ),
+}
+"""Per campus: the creator module, the module providing batch_spec and
+is_elective_entry, and the module providing tokenize. Campuses are imported on first use, so a visitor only loads their own."""
+
+_CAMPUSES: dict[str, CampusParser] = {}
+"""Campus parsers imported so far"""
+
+
+def campus_parser(campus: str) -> CampusParser:
+    """
+    Return the parser pieces create_time_table would use for a campus,
+    importing the campus on first use.
+
+    Args:
+        campus (str): Campus identifier ("62", "128", or "BCA").
+
+    Returns:
+        CampusParser: Every campus other than "62" and "BCA" routes to 128.
+    """
+    campus = campus if campus in _CAMPUS_MODULES else "128"
+    parser = _CAMPUSES.get(campus)
+    if parser is None:
+        # The campus packages re-export a `creator` function that shadows the
+        # `creator` submodule, so the modules are fetched by their dotted name.
+        creator_name, batch_name, tokenize_name = _CAMPUS_MODULES[campus]
+        batch_module = import_module(batch_name)
+        parser = _CAMPUSES[campus] = CampusParser(
+            import_module(creator_name),
+            batch_module.batch_spec,
+            import_module(tokenize_name).tokenize,
+            batch_module.is_elective_entry,
+        )
+    return parser
+
+
+def campus_profile(campus: str) -> Profile:
+    """
+    Create a profile of a campus's generation stages.
+
+    The campus creator's PROFILE_HOOKS are timed together with subject name
+    lookups and elective resolution, and the tokenizer, batch and time slot
+    caches report their hits and misses.
+
+    Args:
+        campus (str): Campus identifier ("62", "128", or "BCA").
+
+    Returns:
+        Profile: An inactive profile, to be used as a context manager.
+    """
+    creator_module, compile_batch, tokenize, _ = campus_parser(campus)
+    hooks = [
+        *module_hooks(creator_module, creator_module.PROFILE_HOOKS),
+        Hook(SubjectIndex, "subject_name", "subject_lookup"),
+        Hook(SubjectIndex, "enrolled", "elective_resolution"),
+        Hook(EnrolledSubjects, "check", "elective_resolution"),
+    ]
+    caches = {
+        "tokenize": tokenize,
+        "batch_spec": compile_batch,
+        "parse_timeslot": parse_timeslot,
+    }
+    return Profile(hooks, caches)
+
+
+def batch_sort_key(batch: str) -> tuple[str, int, str]:
+    """
+    Sort key ordering batches naturally, e.g. A2 before A10.
+
+    Args:
+        batch (str): A batch identifier such as 'A6' or 'BCA1'.
+
+    Returns:
+        tuple[str, int, str]: Letter prefix, numeric suffix and the batch itself.
+    """
+    prefix = batch.rstrip("0123456789")
+    number = batch[len(prefix) :]
+    return prefix, int(number) if number else -1, batch
+
+
+def _reraise(error: Exception) -> Iterator[ClassEntry]:
+    """
+    Entries that raise `error` once iteration starts.
+
+    The creators' build functions catch errors while walking the entries, so
+    a compile error raised here surfaces inside their try block: it is
+    logged the way the original creator logged it and an empty timetable is
+    returned. Raising at the call site would bypass that handling.
+    """
+    raise error
+    yield
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSemester:
+    """
+    An immutable, indexed view of one campus/year timetable.
+
+    Every class string is tokenized once and filed under the batches its batch
+    specification names; single-letter wildcards and match-all entries go to
+    separate buckets. Building a personalised timetable then only visits the
+    entries that can apply to the requested batch, in their original order,
+    and produces exactly what `main.create_time_table` returns.
+
+    Build instances with `compile_semester`.
+    """
+
+    campus: str
+    year: str
+    subject_index: SubjectIndex
+    entries: tuple[ClassEntry, ...]
+    batch_index: Mapping[str, tuple[int, ...]]
+    """Concrete batch -> positions in entries, wildcards already merged in"""
+    letter_index: Mapping[str, tuple[int, ...]]
+    """Wildcard letter -> positions in entries"""
+    match_all: tuple[int, ...]
+    """Positions of entries that apply to every batch"""
+    error: Exception | None = field(default=None, compare=False)
+    """Exception raised while walking a malformed timetable, if any"""
+
+    @property
+    def batches(self) -> tuple[str, ...]:
+        """Concrete batches named anywhere in the timetable, in natural order."""
+        return tuple(sorted(self.batch_index, key=batch_sort_key))
+
+    def candidates(self, batch: str) -> list[ClassEntry]:
+        """
+        Return the entries that may apply to a batch, in timetable order.
+
+        Args:
+            batch (str): User's batch (e.g., "A6", "B12", "BCA1").
+
+        Returns:
+            list[ClassEntry]: Exactly the (day, time, entry) items whose batch
+                specification includes the batch.
+        """
+        positions = self.batch_index.get(batch)
+        if positions is None:
+            # An empty batch fails on the first wildcard entry it reaches, as
+            # `BatchSpec.includes` does; keep all of them so the creator does too.
+            letters = (
+                self.letter_index.values()
+                if not batch
+                else [self.letter_index.get(batch[0], ())]
+            )
+            positions = sorted({*chain.from_iterable(letters), *self.match_all})
+        entries = self.entries
+        return [entries[position] for position in positions]
+
+    def core_subject_codes(self, batch: str) -> list[str]:
+        """
+        Return the subject codes a batch takes whatever its electives are.
+
+        These are the codes of entries that name the batch explicitly and are
+        not electives by the campus's `is_elective_entry`, in timetable order.
+        Year 1 timetables include core subjects without any codes, so the list
+        is empty there.
+
+        Args:
+            batch (str): User's batch (e.g., "A6", "B12", "BCA1").
+
+        Returns:
+            list[str]: Subject codes to pass as the batch's core elective set.
+        """
+        if self.year == "1":
+            return []
+        parser = campus_parser(self.campus)
+        codes: dict[str, None] = {}
+        for _, _, entry in self.candidates(batch):
+            if (
+                entry.code
+                and batch in parser.batch_spec(entry.batch_raw).batches
+                and not parser.is_elective(entry)
+            ):
+                codes.setdefault(entry.code, None)
+        return list(codes)
+
+    def iter_classes(
+        self, batch: str, electives_subject_codes: list[str] = []
+    ) -> Iterator[ScheduledClass]:
+        """
+        Yield the batch's classes one by one, in timetable order.
+
+        Consuming every class with `utils.timetable.collect_timetable` gives
+        create_time_table's result; unlike create_time_table, errors are
+        raised to the caller instead of producing an empty timetable.
+
+        Args:
+            batch (str): User's batch (e.g., "A6", "B12", "BCA1").
+            electives_subject_codes (list[str]): Enrolled elective subject codes.
+
+        Yields:
+            ScheduledClass: Each matched class, formatted.
+        """
+        if self.error is not None:
+            raise self.error
+        creator_module = campus_parser(self.campus).creator
+        iterate = (
+            creator_module.iter_classes_year1
+            if self.year == "1"
+            else creator_module.iter_classes
+        )
+        yield from iterate(
+            self.candidates(batch), self.subject_index, batch, electives_subject_codes
+        )
+
+    def create_time_table(
+        self, batch: str, electives_subject_codes: list[str] = []
+    ) -> dict:
+        """
+        Create a personalized timetable from the index.
+
+        Args:
+            batch (str): User's batch (e.g., "A6", "B12", "BCA1").
+            electives_subject_codes (list[str]): Enrolled elective subject codes.
+
+        Returns:
+            dict: Formatted personalized timetable, identical to create_time_table.
+        """
+        creator_module = campus_parser(self.campus).creator
+        build = creator_module.build_year1 if self.year == "1" else creator_module.build
+        entries = (
+            _reraise(self.error) if self.error is not None else self.candidates(batch)
+        )
+        return build(entries, self.subject_index, batch, electives_subject_codes)
+
+    def create_week_grid(
+        self,
+        batch: str,
+        electives_subject_codes: list[str] = [],
+        table: ClassTable | None = None,
+    ) -> WeekGrid:
+        """
+        Create a personalized timetable as a compact WeekGrid.
+
+        Args:
+            batch (str): User's batch (e.g., "A6", "B12", "BCA1").
+            electives_subject_codes (list[str]): Enrolled elective subject codes.
+            table (ClassTable | None): Table shared with other grids of the
+                semester; a new one if None.
+
+        Returns:
+            WeekGrid: Grid whose to_dict() equals create_time_table's result.
+        """
+        try:
+            return WeekGrid.from_classes(
+                self.iter_classes(batch, electives_subject_codes), table
+            )
+        except Exception:
+            return WeekGrid.from_classes((), table)
+
+
+def compile_semester(
+    campus: str,
+    year: str,
+    time_table_json: dict,
+    subject_json: list,
+) -> CompiledSemester:
+    """
+    Tokenize and index a raw timetable for repeated personalised lookups.
+
+    Args:
+        campus: Campus identifier ("62", "128", or "BCA")
+        year: Year of study ("1", "2", "3", "4", "5")
+        time_table_json: Raw timetable data
+        subject_json: List of subject information dictionaries
+
+    Returns:
+        CompiledSemester: The compiled, reusable semester.
+    """
+    creator_module, compile_batch, _, _ = campus_parser(campus)
+    time_table = time_table_json if isinstance(time_table_json, dict) else {}
+
+    error = None
+    try:
+        entries = tuple(creator_module.class_entries(time_table))
+    except Exception as e:
+        entries, error = (), e
+
+    by_batch: dict[str, list[int]] = {}
+    by_letter: dict[str, list[int]] = {}
+    match_all: list[int] = []
+    for position, (_, _, entry) in enumerate(entries):
+        spec = compile_batch(entry.batch_raw)
+        if spec.match_all:
+            match_all.append(position)
+            continue
+        for letter in spec.letters:
+            by_letter.setdefault(letter, []).append(position)
+        for batch in spec.batches - spec.letters:
+            by_batch.setdefault(batch, []).append(position)
+
+    batch_index = {
+        batch: tuple(sorted({*positions, *by_letter.get(batch[:1], ()), *match_all}))
+        for batch, positions in by_batch.items()
+    }
+
+    return CompiledSemester(
+        campus=campus,
+        year=year,
+        subject_index=SubjectIndex(subject_json),
+        entries=entries,
+        batch_index=MappingProxyType(batch_index),
+        letter_index=MappingProxyType(
+            {letter: tuple(positions) for letter, positions in by_letter.items()}
+        ),
+        match_all=tuple(match_all),
+        error=error,
+    )
@@ -0,0 +1,197 @@
+"""
+Diffs between two releases of a campus timetable file, and the batches and
+subjects whose personalised timetables they affect.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+
+from .compiled import (
+    CompiledSemester,
+    batch_sort_key,
+    campus_parser,
+    compile_semester,
+)
+
+SlotClass = tuple[str, str, str]
+"""(day, time slot, raw class string)"""
+
+MovedClass = tuple[str, str, str, str, str]
+"""(raw class string, old day, old time slot, new day, new time slot)"""
+
+
+@dataclass(frozen=True, slots=True)
+class SemesterDiff:
+    """
+    What changed in one campus/year between two timetable releases.
+
+    Build instances with `diff_semesters` or `diff_campus_files`.
+    """
+
+    campus: str
+    year: str
+    added: tuple[SlotClass, ...]
+    """Class strings only in the new release, at their new day/slot"""
+    removed: tuple[SlotClass, ...]
+    """Class strings only in the old release, at their old day/slot"""
+    moved: tuple[MovedClass, ...]
+    """Class strings present in both releases at a different day/slot"""
+    changed_subjects: frozenset[str]
+    """Subject list codes added, removed or edited"""
+    affected_subjects: frozenset[str]
+    """Codes of added, removed or moved classes, plus changed_subjects"""
+    affected_batches: tuple[str, ...]
+    """Batches whose personalised timetable may differ, in natural order"""
+
+    @property
+    def changed(self) -> bool:
+        """Whether any personalised timetable of this campus/year may differ."""
+        return bool(self.affected_batches)
+
+
+def _slot_classes(time_table: dict) -> dict[str, list[tuple[str, str]]]:
+    """
+    Map each raw class string to the (day, slot) positions it appears at.
+    """
+    positions: dict[str, list[tuple[str, str]]] = defaultdict(list)
+    if not isinstance(time_table, dict):
+        return positions
+    for day, time_slots in time_table.items():
+        if not isinstance(time_slots, dict):
+            continue
+        for time, classes in time_slots.items():
+            if not isinstance(classes, list):
+                continue
+            for text in classes:
+                if isinstance(text, str) and text.strip():
+                    positions[text].append((day, time))
+    return positions
+
+
+def _subjects_by_code(subject_json: list) -> dict[str, dict]:
+    subjects: dict[str, dict] = {}
+    for subject in subject_json if isinstance(subject_json, list) else []:
+        if isinstance(subject, dict) and isinstance(subject.get("Code"), str):
+            subjects.setdefault(subject["Code"], subject)
+    return subjects
+
+
+def _affected_batches(old: CompiledSemester, new: CompiledSemester) -> list[str]:
+    """
+    Batches whose candidate entries or subject lookups differ between releases.
+
+    A personalised timetable only depends on the batch's candidate entries,
+    in order, and on how the subject index resolves their codes, so batches
+    with neither changed produce identical output for any electives.
+    """
+    if old.error is not None or new.error is not None:
+        return sorted({*old.batches, *new.batches}, key=batch_sort_key)
+
+    affected = []
+    for batch in sorted({*old.batches, *new.batches}, key=batch_sort_key):
+        old_entries = old.candidates(batch)
+        new_entries = new.candidates(batch)
+        if old_entries != new_entries or any(
+            old.subject_index.resolve(entry.code)
+            != new.subject_index.resolve(entry.code)
+            for _, _, entry in new_entries
+        ):
+            affected.append(batch)
+    return affected
+
+
+def diff_semesters(
+    campus: str, year: str, old_data: dict, new_data: dict
+) -> SemesterDiff:
+    """
+    Diff one campus/year between two timetable releases.
+
+    Args:
+        campus: Campus identifier ("62", "128", or "BCA")
+        year: Year of study ("1", "2", "3", "4", "5")
+        old_data: The old `{"timetable": ..., "subjects": ...}` of the year
+        new_data: The new `{"timetable": ..., "subjects": ...}` of the year
+
+    Returns:
+        SemesterDiff: Changed classes and the batches/subjects they affect.
+    """
+    old_time_table = old_data.get("timetable", {}) if isinstance(old_data, dict) else {}
+    new_time_table = new_data.get("timetable", {}) if isinstance(new_data, dict) else {}
+    old_subjects = old_data.get("subjects", []) if isinstance(old_data, dict) else []
+    new_subjects = new_data.get("subjects", []) if isinstance(new_data, dict) else []
+
+    old = compile_semester(campus, year, old_time_table, old_subjects)
+    new = compile_semester(campus, year, new_time_table, new_subjects)
+
+    old_positions = _slot_classes(old_time_table)
+    new_positions = _slot_classes(new_time_table)
+
+    added: list[SlotClass] = []
+    removed: list[SlotClass] = []
+    moved: list[MovedClass] = []
+    changed_texts = []
+    for text in dict.fromkeys([*old_positions, *new_positions]):
+        before = list(old_positions.get(text, ()))
+        after = list(new_positions.get(text, ()))
+        for position in list(before):
+            if position in after:
+                before.remove(position)
+                after.remove(position)
+        if not before and not after:
+            continue
+        changed_texts.append(text)
+        for (old_day, old_time), (new_day, new_time) in zip(before, after):
+            moved.append((text, old_day, old_time, new_day, new_time))
+        removed.extend((day, time, text) for day, time in before[len(after) :])
+        added.extend((day, time, text) for day, time in after[len(before) :])
+
+    old_by_code = _subjects_by_code(old_subjects)
+    new_by_code = _subjects_by_code(new_subjects)
+    changed_subjects = frozenset(
+        code
+        for code in {*old_by_code, *new_by_code}
+        if old_by_code.get(code) != new_by_code.get(code)
+    )
+
+    tokenize = campus_parser(campus).tokenize
+    affected_subjects = changed_subjects | {
+        code for code in (tokenize(text).code for text in changed_texts) if code
+    }
+
+    return SemesterDiff(
+        campus=campus,
+        year=year,
+        added=tuple(added),
+        removed=tuple(removed),
+        moved=tuple(moved),
+        changed_subjects=changed_subjects,
+        affected_subjects=frozenset(affected_subjects),
+        affected_batches=tuple(_affected_batches(old, new)),
+    )
+
+
+def diff_campus_files(
+    campus: str, old_data: dict, new_data: dict
+) -> dict[str, SemesterDiff]:
+    """
+    Diff every year of two releases of a campus file (e.g. `62.json`).
+
+    Years only present in one release diff against an empty year, so all of
+    their batches are affected.
+
+    Args:
+        campus: Campus identifier ("62", "128", or "BCA")
+        old_data: The old parsed campus file, year -> {timetable, subjects}
+        new_data: The new parsed campus file, year -> {timetable, subjects}
+
+    Returns:
+        dict[str, SemesterDiff]: Year -> diff, for every year in either release.
+    """
+    old_data = old_data if isinstance(old_data, dict) else {}
+    new_data = new_data if isinstance(new_data, dict) else {}
+    return {
+        year: diff_semesters(
+            campus, year, old_data.get(year, {}), new_data.get(year, {})
+        )
+        for year in dict.fromkeys([*old_data, *new_data])
+    }
@@ -0,0 +1,33 @@
+"""
+Layout of a semester directory, `data/time-table/<year>/<SEM>/`, which
+holds one `<campus>.json` file mapping each year to its raw timetable and
+subjects.
+"""
+
+import json
+from pathlib import Path
+
+CAMPUSES = ("62", "128", "BCA")
+"""Campus data files looked for in a semester directory, as <campus>.json"""
+
+
+def semester_jobs(semester_dir: Path) -> list[tuple[Path, str, str]]:
+    """
+    List the campus/year timetables present in a semester directory.
+
+    Args:
+        semester_dir (Path): A `data/time-table/<year>/<SEM>/` directory.
+
+    Returns:
+        list[tuple[Path, str, str]]: (data file, campus, year) per timetable.
+    """
+    jobs = []
+    for campus in CAMPUSES:
+        path = semester_dir / f"{campus}.json"
+        if not path.is_file():
+            continue
+        data = json.loads(path.read_text(encoding="utf-8"))
+        for year, year_data in data.items():
+            if isinstance(year_data, dict) and "timetable" in year_data:
+                jobs.append((path, campus, year))
+    return jobs
@@ -1,225 +1,247 @@
-from .utils import (
-    batch_extractor,
-    parse_batches,
-    subject_extractor,
-)
-
-from utils.subject import is_enrolled_subject, subject_name_extractor, type_extractor
-from utils.location import location_extractor
+from collections.abc import Iterable, Iterator
+
+from models.parsed_entry import ParsedEntry
+from models.scheduled_class import ScheduledClass
+
+from .utils import tokenize
+
+from utils.subject import SubjectIndex, type_extractor
 from utils.time import process_day, process_timeslot
+from utils.timetable import collect_timetable
 
 
-def creator(
-    time_table_json: dict,
-    subject_json: list,
-    batch: str,
-    enrolled_subject_codes: list[str] = [],
-) -> dict:
+PROFILE_HOOKS = {
+    "SubjectIndex": "subject_index",
+    "tokenize": "tokenize",
+    "type_extractor": "format",
+    "_scheduled_class": "format",
+    "_scheduled_class_year1": "format",
+    "process_day": "format",
+    "process_timeslot": "process_timeslot",
+    "collect_timetable": "collect",
+}
+"""Module functions timed per stage by utils.profiling"""
+
+
+def class_entries(time_table: dict) -> Iterator[tuple[str, str, ParsedEntry]]:
     """
-    BCA version of time_table_creator_v2: Only include classes if the subject is in the enrolled_subject_codes (using is_enrolled_subject logic), and the batch matches.
-    Fix ambiguous 12:00/01:00 times by treating 12:00 as PM and 01:00 as PM if after 12:00.
-    Always ensure start_time and end_time are valid strings.
+    Walk a raw BCA timetable and yield (day, time, entry) per class string, skipping blanks, lunch and talks.
     """
-    try:
-        time_table = time_table_json if isinstance(time_table_json, dict) else {}
-        subjects = subject_json if isinstance(subject_json, list) else []
-        your_time_table = []
-        days = list(time_table.keys())
+    days = list(time_table.keys())
 
-        for day in days:
-            time_slots = time_table[day]
-            time_slot_keys = list(time_slots.keys())
+    for day in days:
+        time_slots = time_table[day]
+        time_slot_keys = list(time_slots.keys())
 
-            for time in time_slot_keys:
-                classes = time_slots[time]
+        for time in time_slot_keys:
+            classes = time_slots[time]
 
-                if not isinstance(classes, list):
+            if not isinstance(classes, list):
+                continue
+
+            for indi_class in classes:
+                if not isinstance(indi_class, str) or not indi_class.strip():
+                    continue
+
+                if "LUNCH" in indi_class.upper() or "TALK" in indi_class.upper():
                     continue
 
-                for indi_class in classes:
-                    if not isinstance(indi_class, str) or not indi_class.strip():
-                        continue
-
-                    if "LUNCH" in indi_class.upper() or "TALK" in indi_class.upper():
-                        continue
-
-                    code = subject_extractor(indi_class)
-                    batchs = batch_extractor(indi_class)
-                    batchs_list = parse_batches(batchs)
-
-                    is_actually_enrolled_subject, subject_details = is_enrolled_subject(
-                        enrolled_subject_codes=enrolled_subject_codes,
-                        subject_dict=subjects,
-                        subject_code=code,
-                    )
-
-                    if is_actually_enrolled_subject and (
-                        batch in batchs_list or any(batch == b for b in batchs_list)
-                    ):
-                        your_time_table.append(
-                            [
-                                day,
-                                time,
-                                (
-                                    subject_details["Subject"]
-                                    if subject_details is not None
-                                    else subject_name_extractor(subjects, code)
-                                ),
-                                type_extractor(indi_class),
-                                location_extractor(indi_class),
-                            ]
-                        )
-
-        formatted_timetable = {}
-
-        for entry in your_time_table:
-            day = process_day(entry[0])
-            time = entry[1]
-
-            # Fix for ambiguous 12:00/01:00 times (treat 12:00 as PM, 01:00 as PM if after 12:00)
-            raw_times = [
-                t.strip() for t in time.replace("AM", "").replace("PM", "").split("-")
-            ]
-
-            if len(raw_times) == 2:
-                start_raw, end_raw = raw_times
-                # Add PM if missing for 12:00
-
-                if start_raw in ["12:00", "12"] and "PM" not in time.upper():
-                    start_time, _ = process_timeslot(
-                        start_raw + " PM-" + end_raw, entry[3]
-                    )
-                else:
-                    start_time, _ = process_timeslot(
-                        start_raw + "-" + end_raw, entry[3]
-                    )
-                # Add PM to end if it's 1:00 or 01:00 and start is 12:00
-                if (end_raw in ["1:00", "01:00", "1", "01"]) and (
-                    start_raw in ["12:00", "12"]
-                ):
-                    _, end_time = process_timeslot(
-                        start_raw + "-" + end_raw + " PM", entry[3]
-                    )
-                else:
-                    _, end_time = process_timeslot(start_raw + "-" + end_raw, entry[3])
+                yield day, time, tokenize(indi_class)
+
+
+def _scheduled_class(
+    day: str, time: str, subject_name: str, type: str, location: str
+) -> ScheduledClass:
+    """
+    Format one matched (day, time, subject, type, location) row, fixing ambiguous 12:00/01:00 times.
+    """
+    day = process_day(day)
+
+    # Fix for ambiguous 12:00/01:00 times (treat 12:00 as PM, 01:00 as PM if after 12:00)
+    raw_times = [
+        t.strip() for t in time.replace("AM", "").replace("PM", "").split("-")
+    ]
+
+    if len(raw_times) == 2:
+        start_raw, end_raw = raw_times
+        # Add PM if missing for 12:00
+
+        if start_raw in ["12:00", "12"] and "PM" not in time.upper():
+            start_time, _ = process_timeslot(start_raw + " PM-" + end_raw, type)
+        else:
+            start_time, _ = process_timeslot(start_raw + "-" + end_raw, type)
+        # Add PM to end if it's 1:00 or 01:00 and start is 12:00
+        if (end_raw in ["1:00", "01:00", "1", "01"]) and (
+            start_raw in ["12:00", "12"]
+        ):
+            _, end_time = process_timeslot(start_raw + "-" + end_raw + " PM", type)
+        else:
+            _, end_time = process_timeslot(start_raw + "-" + end_raw, type)
+    else:
+        start_time, end_time = process_timeslot(time, type)
+
+    # Defensive: ensure start_time and end_time are valid strings
+    if not start_time or not isinstance(start_time, str):
+        start_time = "00:00"
+    if not end_time or not isinstance(end_time, str):
+        end_time = "00:00"
+
+    # Only set end_time to 13:00 if start_time is 12:00 and end_time is 01:00
+    if start_time == "12:00" and end_time == "01:00":
+        end_time = "13:00"
+
+    return ScheduledClass(day, start_time, end_time, subject_name, type, location)
+
+
+def _scheduled_class_year1(
+    day: str, time: str, subject_name: str, type: str, location: str
+) -> ScheduledClass:
+    """
+    Format one matched Year 1 row, reading dotted times directly.
+    """
+    day = process_day(day)
+    try:
+        t = time.replace("AM", "").replace("PM", "").replace(":", ".").replace(" ", "")
+        t = t.replace("-", "-")
+
+        if "." in t:
+            start, end = t.split("-")
+            start = start.strip()
+            end = end.strip()
+            if "." in start:
+                start = start.replace(".", ":")
+            else:
+                start = f"{start}:00"
+            if "." in end:
+                end = end.replace(".", ":")
             else:
-                start_time, end_time = process_timeslot(time, entry[3])
-
-            # Defensive: ensure start_time and end_time are valid strings
-            if not start_time or not isinstance(start_time, str):
-                start_time = "00:00"
-            if not end_time or not isinstance(end_time, str):
-                end_time = "00:00"
-
-            # Only set end_time to 13:00 if start_time is 12:00 and end_time is 01:00
-            if start_time == "12:00" and end_time == "01:00":
-                end_time = "13:00"
-
-            if day not in formatted_timetable:
-                formatted_timetable[day] = {}
-            # Only add if both times are valid
-
-            if start_time and end_time:
-                formatted_timetable[day][f"{start_time}-{end_time}"] = {
-                    "subject_name": entry[2],
-                    "type": entry[3],
-                    "location": entry[4],
-                }
-        return formatted_timetable
+                end = f"{end}:00"
+            start_time, end_time = start, end
+        else:
+            start_time, end_time = process_timeslot(time, type)
+
+    except Exception:
+        start_time, end_time = process_timeslot(time, type)
+
+    return ScheduledClass(day, start_time, end_time, subject_name, type, location)
+
+
+def iter_classes(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
+    batch: str,
+    enrolled_subject_codes: list[str] = [],
+) -> Iterator[ScheduledClass]:
+    """
+    Yield the classes of a BCA Year 2+ timetable as they are matched.
+    """
+    enrollment = subject_index.enrolled(enrolled_subject_codes)
+
+    for day, time, entry in entries:
+        is_actually_enrolled_subject, subject_details = enrollment.check(entry.code)
+
+        if is_actually_enrolled_subject and batch in entry.batches:
+            yield _scheduled_class(
+                day,
+                time,
+                (
+                    subject_details["Subject"]
+                    if subject_details is not None
+                    else subject_index.subject_name(entry.code)
+                ),
+                type_extractor(entry.type),
+                entry.location,
+            )
+
+
+def iter_classes_year1(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
+    batch: str,
+    enrolled_subject_codes: list[str] = [],
+) -> Iterator[ScheduledClass]:
+    """
+    Yield the classes of a BCA Year 1 timetable as they are matched.
+    """
+    for day, time, entry in entries:
+        # Only check if batch is present in the entry's batches
+        if batch in entry.batches:
+            yield _scheduled_class_year1(
+                day,
+                time,
+                subject_index.subject_name(entry.code),
+                type_extractor(entry.type),
+                entry.location,
+            )
+
+
+def build(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
+    batch: str,
+    enrolled_subject_codes: list[str] = [],
+) -> dict:
+    """
+    Create a BCA Year 2+ timetable from tokenized class entries.
+    """
+    try:
+        return collect_timetable(
+            iter_classes(entries, subject_index, batch, enrolled_subject_codes)
+        )
 
     except Exception as e:
         print(f"Error in creator: {str(e)}")
         return {}
 
 
-def creator_year1(
-    time_table_json: dict,
-    subject_json: list,
+def build_year1(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
     batch: str,
     enrolled_subject_codes: list[str] = [],
 ) -> dict:
     """
-    For BCA Year 1: Return all classes which have the given batch (e.g., BCA1) in their batch list, regardless of enrolled_subject_codes.
+    Create a BCA Year 1 timetable from tokenized class entries.
     """
     try:
-        time_table = time_table_json if isinstance(time_table_json, dict) else {}
-        subjects = subject_json if isinstance(subject_json, list) else []
-        your_time_table = []
-        days = list(time_table.keys())
-
-        for day in days:
-            time_slots = time_table[day]
-            time_slot_keys = list(time_slots.keys())
-
-            for time in time_slot_keys:
-                classes = time_slots[time]
-                if not isinstance(classes, list):
-                    continue
-
-                for indi_class in classes:
-                    if not isinstance(indi_class, str) or not indi_class.strip():
-                        continue
-                    if "LUNCH" in indi_class.upper() or "TALK" in indi_class.upper():
-                        continue
-                    code = subject_extractor(indi_class)
-                    batchs = batch_extractor(indi_class)
-                    batchs_list = parse_batches(batchs)
-                    # Only check if batch is present in batchs_list
-
-                    if batch in batchs_list or any(batch == b for b in batchs_list):
-                        your_time_table.append(
-                            [
-                                day,
-                                time,
-                                subject_name_extractor(subjects, code),
-                                type_extractor(indi_class),
-                                location_extractor(indi_class),
-                            ]
-                        )
-
-        formatted_timetable = {}
-
-        for entry in your_time_table:
-            day = process_day(entry[0])
-            time = entry[1]
-            try:
-                t = (
-                    time.replace("AM", "")
-                    .replace("PM", "")
-                    .replace(":", ".")
-                    .replace(" ", "")
-                )
-                t = t.replace("-", "-")
-
-                if "." in t:
-                    start, end = t.split("-")
-                    start = start.strip()
-                    end = end.strip()
-                    if "." in start:
-                        start = start.replace(".", ":")
-                    else:
-                        start = f"{start}:00"
-                    if "." in end:
-                        end = end.replace(".", ":")
-                    else:
-                        end = f"{end}:00"
-                    start_time, end_time = start, end
-                else:
-                    start_time, end_time = process_timeslot(time, entry[3])
-
-            except Exception:
-                start_time, end_time = process_timeslot(time, entry[3])
-
-            if day not in formatted_timetable:
-                formatted_timetable[day] = {}
-
-            formatted_timetable[day][f"{start_time}-{end_time}"] = {
-                "subject_name": entry[2],
-                "type": entry[3],
-                "location": entry[4],
-            }
-        return formatted_timetable
+        return collect_timetable(
+            iter_classes_year1(entries, subject_index, batch, enrolled_subject_codes)
+        )
 
     except Exception as e:
         print(f"Error in creator_year1: {str(e)}")
         return {}
+
+
+def creator(
+    time_table_json: dict,
+    subject_json: list,
+    batch: str,
+    enrolled_subject_codes: list[str] = [],
+) -> dict:
+    """
+    BCA version of time_table_creator_v2: Only include classes if the subject is in the enrolled_subject_codes (using is_enrolled_subject logic), and the batch matches.
+    Fix ambiguous 12:00/01:00 times by treating 12:00 as PM and 01:00 as PM if after 12:00.
+    Always ensure start_time and end_time are valid strings.
+    """
+    time_table = time_table_json if isinstance(time_table_json, dict) else {}
+    subjects = subject_json if isinstance(subject_json, list) else []
+    return build(
+        class_entries(time_table), SubjectIndex(subjects), batch, enrolled_subject_codes
+    )
+
+
+def creator_year1(
+    time_table_json: dict,
+    subject_json: list,
+    batch: str,
+    enrolled_subject_codes: list[str] = [],
+) -> dict:
+    """
+    For BCA Year 1: Return all classes which have the given batch (e.g., BCA1) in their batch list, regardless of enrolled_subject_codes.
+    """
+    time_table = time_table_json if isinstance(time_table_json, dict) else {}
+    subjects = subject_json if isinstance(subject_json, list) else []
+    return build_year1(
+        class_entries(time_table), SubjectIndex(subjects), batch, enrolled_subject_codes
+    )
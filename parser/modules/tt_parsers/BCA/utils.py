@@ -1,4 +1,9 @@
 import re
+from functools import lru_cache
+
+from models.parsed_entry import ParsedEntry
+from utils.batch import BatchSpec
+from utils.location import location_extractor as dash_location_extractor
 
 
 def parse_batches(batch_input: str) -> list[str]:
@@ -45,6 +50,36 @@ def parse_batches(batch_input: str) -> list[str]:
     return [batch_input]
 
 
+@lru_cache(maxsize=1024)
+def batch_spec(batch_input: str) -> BatchSpec:
+    """Compiles a BCA batch string into a cached BatchSpec.
+
+    BCA batches only match exactly, so the spec has no wildcard letters.
+
+    Args:
+        batch_input: The raw batch string from the timetable.
+
+    Returns:
+        The compiled specification.
+    """
+    return BatchSpec(frozenset(parse_batches(batch_input)), frozenset())
+
+
+def is_elective_entry(entry: ParsedEntry) -> bool:
+    """Checks if a tokenized class string is an elective.
+
+    BCA timetables have no elective marker; a class shared by more than three
+    batches is taken to be the combined lecture of an elective.
+
+    Args:
+        entry: The tokenized class string.
+
+    Returns:
+        True if the entry is an elective, False otherwise.
+    """
+    return len(entry.batches) > 3
+
+
 def batch_extractor(text: str) -> str:
     """Extracts batch information from a string, usually before a bracket or subject code.
 
@@ -148,3 +183,37 @@ def subject_name_extractor(subjects_dict: list[dict], code: str) -> str:
             return subject.get("Subject", code)
 
     return code
+
+
+@lru_cache(maxsize=4096)
+def tokenize(text: str) -> ParsedEntry:
+    """Parses a BCA class string such as 'LBCA1BCA2(CS101)-G1/ABC' into its fields.
+
+    The bracketed shape is split in a single scan; anything else falls back to
+    the individual extractors. The location follows the dash-based rule the
+    BCA creators use (`utils.location.location_extractor`) rather than
+    `location_extractor` in this module. Results are memoized per string.
+
+    Args:
+        text: The raw class string from the timetable.
+
+    Returns:
+        The parsed fields of the class string.
+    """
+    open_idx = text.find("(")
+    close_idx = text.find(")", open_idx) if open_idx != -1 else -1
+    if close_idx != -1:
+        batch_raw = text[:open_idx].strip()
+        code = text[open_idx + 1 : close_idx].strip()
+    else:
+        batch_raw = batch_extractor(text)
+        code = subject_extractor(text)
+
+    return ParsedEntry(
+        type=text.strip()[:1],
+        batch_raw=batch_raw,
+        batches=tuple(parse_batches(batch_raw)),
+        code=code,
+        location=dash_location_extractor(text),
+        faculty=text.partition("/")[2].strip(),
+    )
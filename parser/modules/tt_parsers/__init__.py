@@ -1,5 +1,11 @@
-from . import BCA
-from . import sector_62
-from . import sector_128
+from importlib import import_module
 
 __all__ = ["BCA", "sector_62", "sector_128"]
+
+
+def __getattr__(name: str):
+    # Campus packages are imported on first access (PEP 562), so loading one
+    # campus does not load the others.
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
@@ -1,164 +1,191 @@
+from collections.abc import Iterable, Iterator
+
+from models.parsed_entry import ParsedEntry
+from models.scheduled_class import ScheduledClass
+from utils.subject import SubjectIndex
 from utils.time import process_day, process_timeslot
+from utils.timetable import collect_timetable
 
 
 from .utils import (
-    batch_extractor,
-    datetime,
     do_you_have_subject,
-    expand_batch,
-    faculty_extractor,
     is_batch_included,
-    is_elective,
-    location_extractor,
-    subject_extractor,
-    subject_name,
+    tokenize,
 )
 
 
-def banado(
-    time_table_json: dict,
-    subject_json: list[dict],
+PROFILE_HOOKS = {
+    "SubjectIndex": "subject_index",
+    "tokenize": "tokenize",
+    "is_batch_included": "batch_matching",
+    "do_you_have_subject": "elective_resolution",
+    "_scheduled_class": "format",
+    "_scheduled_class_year1": "format",
+    "process_day": "format",
+    "process_timeslot": "process_timeslot",
+    "collect_timetable": "collect",
+}
+"""Module functions timed per stage by utils.profiling"""
+
+
+def class_entries(time_table: dict) -> Iterator[tuple[str, str, ParsedEntry]]:
+    """Walks a raw Sector 128 timetable and yields (day, time, entry) per class string."""
+    days = list(time_table.keys())
+    # Iterate through each day in the timetable
+    for day in days:
+        time_slots = time_table[day]
+        time_slot_keys = list(time_slots.keys())
+
+        for time in time_slot_keys:
+            classes = time_slots[time]
+            if not isinstance(classes, list):
+                continue
+
+            for indi_class in classes:
+                if not isinstance(indi_class, str):
+                    continue
+                yield day, time, tokenize(indi_class)
+
+
+def _scheduled_class(
+    day: str, time: str, subject_name: str, type: str, location: str
+) -> ScheduledClass:
+    """Formats one matched (day, time, subject, type, location) row."""
+    day = process_day(day)
+    start_time, end_time = process_timeslot(time, type)
+
+    if subject_name in [
+        "ENGINEERING DRAWING AND DESIGN",
+        "Engineering Drawing & Design",
+    ]:
+        end_time = f"{int(end_time[:2])+1}{end_time[2:]}"
+
+    # Format end time to ensure it's in HH:MM format
+    if len(end_time) == 4:  # If end time is like "1100"
+        end_time = f"{end_time[:2]}:{end_time[2:]}"
+    elif len(end_time) == 3:
+        end_time = f"0{end_time[0]}:{end_time[1:]}"
+
+    if subject_name.strip() == subject_name.strip().upper():
+        subject_name = subject_name.strip().title()
+
+    return ScheduledClass(day, start_time, end_time, subject_name, type, location)
+
+
+def _scheduled_class_year1(
+    day: str, time: str, subject_name: str, type: str, location: str
+) -> ScheduledClass:
+    """Year 1 variant of _scheduled_class without end-time or title normalisation."""
+    day = process_day(day)
+    start_time, end_time = process_timeslot(time, type)
+
+    if subject_name.strip() in [
+        "ENGINEERING DRAWING AND DESIGN",
+        "Engineering Drawing & Design",
+    ]:
+        end_time = f"{int(end_time[:2])+1}{end_time[2:]}"
+
+    return ScheduledClass(day, start_time, end_time, subject_name, type, location)
+
+
+def iter_classes(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
+    batch: str,
+    subject_codes: list[str],
+) -> Iterator[ScheduledClass]:
+    """Yields the classes of a Year 2+ Sector 128 timetable as they are matched."""
+    for day, time, entry in entries:
+        if do_you_have_subject(
+            subject_codes=subject_codes, subject_code=entry.code
+        ) and is_batch_included(batch, entry.batch_raw):
+            yield _scheduled_class(
+                day,
+                time,
+                subject_index.subject_name(entry.code),
+                entry.type,
+                entry.location,
+            )
+
+
+def iter_classes_year1(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
+    batch: str,
+    electives_subject_codes: list[str] = [],
+) -> Iterator[ScheduledClass]:
+    """Yields the classes of a Year 1 Sector 128 timetable as they are matched."""
+    for day, time, entry in entries:
+        if is_batch_included(batch, entry.batch_raw):
+            yield _scheduled_class_year1(
+                day,
+                time,
+                subject_index.subject_name(entry.code),
+                entry.type,
+                entry.location,
+            )
+
+
+def build(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
     batch: str,
     subject_codes: list[str],
 ) -> dict:
+    """Builds a Year 2+ Sector 128 timetable from tokenized class entries."""
     try:
-        time_table = time_table_json
-        subject = subject_json
-        your_time_table = []
-
-        days = list(time_table.keys())
-        # Iterate through each day in the timetable
-        for day in days:
-            time_slots = time_table[day]
-            time_slot_keys = list(time_slots.keys())
-
-            for time in time_slot_keys:
-                classes = time_slots[time]
-                if not isinstance(classes, list):
-                    continue
-
-                for indi_class in classes:
-                    if not isinstance(indi_class, str):
-                        continue
-                    code = subject_extractor(indi_class.strip())
-                    batchs = batch_extractor(indi_class.strip())
-
-                    if do_you_have_subject(
-                        subject_codes=subject_codes, subject_code=code
-                    ) and is_batch_included(batch, batchs):
-                        your_time_table.append(
-                            [
-                                day,
-                                time,
-                                subject_name(subject, code),
-                                indi_class.strip()[0],
-                                location_extractor(indi_class.strip()),
-                            ]
-                        )
-
-        formatted_timetable = {}
-
-        for entry in your_time_table:
-            day = process_day(entry[0])
-            time = entry[1]
-            start_time, end_time = process_timeslot(time, entry[3])
-
-            if entry[2] in [
-                "ENGINEERING DRAWING AND DESIGN",
-                "Engineering Drawing & Design",
-            ]:
-                end_time = f"{int(end_time[:2])+1}{end_time[2:]}"
-
-            if day not in formatted_timetable:
-                formatted_timetable[day] = {}
-            # Format end time to ensure it's in HH:MM format
-            if len(end_time) == 4:  # If end time is like "1100"
-                end_time = f"{end_time[:2]}:{end_time[2:]}"
-            elif len(end_time) == 3:
-                end_time = f"0{end_time[0]}:{end_time[1:]}"
-
-            if entry[2].strip() == entry[2].strip().upper():
-                entry[2] = entry[2].strip().title()
-
-            formatted_timetable[day][f"{start_time}-{end_time}"] = {
-                "subject_name": entry[2],
-                "type": entry[3],
-                "location": entry[4],
-            }
-
-        return formatted_timetable
+        return collect_timetable(
+            iter_classes(entries, subject_index, batch, subject_codes)
+        )
 
     except Exception as e:
         print(f"Error in time_table_creator: {str(e)}")
         return {}
 
 
-def bando_year1(
-    time_table_json: dict,
-    subject_json: list[dict],
+def build_year1(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
     batch: str,
     electives_subject_codes: list[str] = [],
 ) -> dict:
+    """Builds a Year 1 Sector 128 timetable from tokenized class entries."""
     try:
-        time_table = time_table_json
-        subject = subject_json
-        your_time_table = []
+        return collect_timetable(
+            iter_classes_year1(entries, subject_index, batch, electives_subject_codes)
+        )
 
-        days = list(time_table.keys())
-        for day in days:
-            time_slots = time_table[day]
-            time_slot_keys = list(time_slots.keys())
+    except Exception as e:
+        print(f"Error in time_table_creator: {str(e)}")
+        return {}
 
-            for time in time_slot_keys:
-                classes = time_slots[time]
 
-                if not isinstance(classes, list):
-                    continue
+def banado(
+    time_table_json: dict,
+    subject_json: list[dict],
+    batch: str,
+    subject_codes: list[str],
+) -> dict:
+    return build(
+        class_entries(time_table_json),
+        SubjectIndex(subject_json),
+        batch,
+        subject_codes,
+    )
 
-                for indi_class in classes:
-                    if not isinstance(indi_class, str):
-                        continue
-                    code = subject_extractor(indi_class.strip())
-                    batchs = batch_extractor(indi_class.strip())
-
-                    if is_batch_included(batch, batchs):
-                        your_time_table.append(
-                            [
-                                day,
-                                time,
-                                subject_name(subject, code),
-                                indi_class.strip()[0],
-                                location_extractor(indi_class.strip()),
-                            ]
-                        )
-
-        formatted_timetable = {}
-
-        for entry in your_time_table:
-            day = process_day(entry[0])
-            time = entry[1]
-            start_time, end_time = process_timeslot(time, entry[3])
-
-            if entry[2].strip() in [
-                "ENGINEERING DRAWING AND DESIGN",
-                "Engineering Drawing & Design",
-            ]:
-                end_time = f"{int(end_time[:2])+1}{end_time[2:]}"
-
-            if day not in formatted_timetable:
-                formatted_timetable[day] = {}
-
-            formatted_timetable[day][f"{start_time}-{end_time}"] = {
-                "subject_name": entry[2],
-                "type": entry[3],
-                "location": entry[4],
-            }
-
-        return formatted_timetable
 
-    except Exception as e:
-        print(f"Error in time_table_creator: {str(e)}")
-        return {}
+def bando_year1(
+    time_table_json: dict,
+    subject_json: list[dict],
+    batch: str,
+    electives_subject_codes: list[str] = [],
+) -> dict:
+    return build_year1(
+        class_entries(time_table_json),
+        SubjectIndex(subject_json),
+        batch,
+        electives_subject_codes,
+    )
 
 
 # Aliases for consistent interface across modules
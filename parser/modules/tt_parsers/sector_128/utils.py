@@ -1,5 +1,9 @@
 import re
 from datetime import datetime
+from functools import lru_cache
+
+from models.parsed_entry import ParsedEntry
+from utils.batch import MATCH_ALL, BatchSpec
 
 
 def batch_extractor(text: str) -> str:
@@ -111,19 +115,23 @@ def is_batch_included(search_batch: str, extracted_batch_input: str) -> bool:
     Returns:
         True if the batch is included, False otherwise.
     """
-    if not extracted_batch_input:
-        return True
+    return batch_spec(extracted_batch_input).includes(search_batch)
 
-    batch_list = expand_batch(extracted_batch_input.strip())
 
-    if search_batch in batch_list:
-        return True
+@lru_cache(maxsize=8192)
+def batch_spec(extracted_batch_input: str) -> BatchSpec:
+    """Compiles a Sector 128 batch input string into a cached BatchSpec.
 
-    for batch in batch_list:
-        if len(batch) == 1 and search_batch[0] == batch:
-            return True
+    Args:
+        extracted_batch_input: The string containing one or more batch codes.
 
-    return False
+    Returns:
+        The compiled specification; empty input matches every batch.
+    """
+    if not extracted_batch_input:
+        return MATCH_ALL
+
+    return BatchSpec.from_batches(expand_batch(extracted_batch_input.strip()))
 
 
 def is_elective(extracted_batch: str) -> bool:
@@ -141,6 +149,21 @@ def is_elective(extracted_batch: str) -> bool:
     return False
 
 
+def is_elective_entry(entry: ParsedEntry) -> bool:
+    """Checks if a tokenized class string is an elective.
+
+    Besides 'ALL' classes, a class shared by more than three batches is the
+    combined lecture of an elective (e.g. an HSS elective for 'E1E2E3E4E5').
+
+    Args:
+        entry: The tokenized class string.
+
+    Returns:
+        True if the entry is an elective, False otherwise.
+    """
+    return is_elective(entry.batch_raw) or len(entry.batches) > 3
+
+
 def do_you_have_subject(subject_codes: list[str], subject_code: str) -> bool:
     """Checks if a subject code exists in a list of subject codes.
 
@@ -199,3 +222,43 @@ def subject_name(subjects_dict: list[dict], code: str) -> str:
         print(f"Error extracting subject name for code {code}: {e}")
 
     return code
+
+
+@lru_cache(maxsize=16384)
+def tokenize(text: str) -> ParsedEntry:
+    """Parses a Sector 128 class string into its fields in a single scan.
+
+    Every field matches what the individual extractors in this module return
+    for the stripped string. Results are memoized per string.
+
+    Args:
+        text: The raw class string from the timetable.
+
+    Returns:
+        The parsed fields of the class string.
+    """
+    stripped = text.strip()
+
+    open_idx = stripped.find("(")
+    if open_idx == -1:
+        batch_raw = stripped
+        code = stripped
+    else:
+        batch_raw = stripped[1:open_idx].strip()
+        close_idx = stripped.find(")", open_idx)
+        code = stripped[open_idx + 1 : close_idx] if close_idx != -1 else stripped
+
+    dash_idx = stripped.rfind("-")
+    if dash_idx == -1:
+        location = stripped
+    else:
+        location = stripped[dash_idx + 1 :].split("/")[0].strip()
+
+    return ParsedEntry(
+        type=stripped[:1],
+        batch_raw=batch_raw,
+        batches=tuple(expand_batch(batch_raw.strip())),
+        code=code,
+        location=location,
+        faculty=stripped.partition("/")[2].strip(),
+    )
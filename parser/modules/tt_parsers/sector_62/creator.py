@@ -1,213 +1,212 @@
-from utils.batch import batch_extractor, is_batch_included, is_elective, parse_batch_numbers
-from utils.subject import is_enrolled_subject, subject_extractor, subject_name_extractor
-from utils.location import location_extractor
+from collections.abc import Iterable, Iterator
+
+from models.parsed_entry import ParsedEntry
+from models.scheduled_class import ScheduledClass
+from utils.batch import is_batch_included, is_elective
+from utils.subject import SubjectIndex
 from utils.time import process_day, process_timeslot
+from utils.timetable import collect_timetable
+from utils.tokenizer import tokenize
 
 
-def time_table_creator(
-    time_table_json: dict,
-    subject_json: list,
-    batch: str,
-    electives_subject_codes: list[str] = [],
-) -> dict:
+PROFILE_HOOKS = {
+    "SubjectIndex": "subject_index",
+    "tokenize": "tokenize",
+    "is_elective": "batch_matching",
+    "is_batch_included": "batch_matching",
+    "_scheduled_class": "format",
+    "process_day": "format",
+    "process_timeslot": "process_timeslot",
+    "collect_timetable": "collect",
+}
+"""Module functions timed per stage by utils.profiling"""
+
+
+def class_entries(time_table: dict) -> Iterator[tuple[str, str, ParsedEntry]]:
     """
-    Create a personalized timetable for Year 1 students at Sector 62.
+    Walk a raw Sector 62 timetable and yield (day, time, entry) per class string.
     """
-    try:
-        time_table = time_table_json if isinstance(time_table_json, dict) else {}
-        subject = subject_json if isinstance(subject_json, list) else []
-        your_time_table = []
+    # Convert dict_keys to list for iteration
+    days = list(time_table.keys())
 
-        # Convert dict_keys to list for iteration
-        days = list(time_table.keys())
+    for day in days:
+        time_slots = time_table[day]
+        time_slot_keys = list(time_slots.keys())
 
-        for day in days:
-            time_slots = time_table[day]
-            time_slot_keys = list(time_slots.keys())
+        for time in time_slot_keys:
+            classes = time_slots[time]
+            if not isinstance(classes, list):
+                continue
 
-            for time in time_slot_keys:
-                classes = time_slots[time]
-                if not isinstance(classes, list):
+            for indi_class in classes:
+                if not isinstance(indi_class, str):
                     continue
 
-                for indi_class in classes:
-                    if not isinstance(indi_class, str):
-                        continue
-
-                    code = subject_extractor(indi_class.strip())
-                    batchs = batch_extractor(indi_class.strip())
-                    batchs_list = parse_batch_numbers(batchs)
-
-                    if not is_elective(
-                        extracted_batch=batchs,
-                        subject_code=code,
-                        extracted_batches=batchs_list,
-                    ):
-                        if is_batch_included(batch, batchs):
-                            your_time_table.append(
-                                [
-                                    day,
-                                    time,
-                                    subject_name_extractor(subject, code),  # type: ignore
-                                    indi_class.strip()[0],
-                                    location_extractor(indi_class.strip()),
-                                ]
-                            )
-                    else:
-                        is_enrolled, _ = is_enrolled_subject(
-                            enrolled_subject_codes=electives_subject_codes,
-                            subject_code=code,
-                            subject_dict=subject,  # type: ignore
-                        )
-                        if is_enrolled and is_batch_included(batch, batchs):
-                            your_time_table.append(
-                                [
-                                    day,
-                                    time,
-                                    subject_name_extractor(subject, code),  # type: ignore
-                                    indi_class.strip()[0],
-                                    location_extractor(indi_class.strip()),
-                                ]
-                            )
-
-        formatted_timetable = {}
-
-        for entry in your_time_table:
-            day = process_day(entry[0])
-            time = entry[1]
-            start_time, end_time = process_timeslot(time, entry[3])
-
-            if entry[2] in [
-                "ENGINEERING DRAWING AND DESIGN",
-                "Engineering Drawing & Design",
-            ]:
-                end_time = f"{int(end_time[:2])+1}{end_time[2:]}"
-
-            if day not in formatted_timetable:
-                formatted_timetable[day] = {}
-            # Format end time to ensure it's in HH:MM format
-            if len(end_time) == 4:  # If end time is like "1100"
-                end_time = f"{end_time[:2]}:{end_time[2:]}"
-
-            if (
-                len(entry[2].strip()) > 3
-                and len(entry[2].strip()) not in [5, 7]
-                and entry[2].strip() == entry[2].strip().upper()
-            ):
-                entry[2] = entry[2].strip().title()
-
-            formatted_timetable[day][f"{start_time}-{end_time}"] = {
-                "subject_name": entry[2],
-                "type": entry[3],
-                "location": entry[4],
-            }
-
-        return formatted_timetable
+                yield day, time, tokenize(indi_class)
+
+
+def _scheduled_class(
+    day: str, time: str, subject_name: str, type: str, location: str
+) -> ScheduledClass:
+    """
+    Format one matched (day, time, subject, type, location) row.
+    """
+    day = process_day(day)
+    start_time, end_time = process_timeslot(time, type)
+
+    if subject_name in [
+        "ENGINEERING DRAWING AND DESIGN",
+        "Engineering Drawing & Design",
+    ]:
+        end_time = f"{int(end_time[:2])+1}{end_time[2:]}"
+
+    # Format end time to ensure it's in HH:MM format
+    if len(end_time) == 4:  # If end time is like "1100"
+        end_time = f"{end_time[:2]}:{end_time[2:]}"
+
+    if (
+        len(subject_name.strip()) > 3
+        and len(subject_name.strip()) not in [5, 7]
+        and subject_name.strip() == subject_name.strip().upper()
+    ):
+        subject_name = subject_name.strip().title()
+
+    return ScheduledClass(day, start_time, end_time, subject_name, type, location)
+
+
+def iter_classes_year1(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
+    batch: str,
+    electives_subject_codes: list[str] = [],
+) -> Iterator[ScheduledClass]:
+    """
+    Yield the classes of a Year 1 Sector 62 timetable as they are matched.
+    """
+    enrollment = subject_index.enrolled(electives_subject_codes)
+
+    for day, time, entry in entries:
+        if not is_elective(
+            extracted_batch=entry.batch_raw,
+            subject_code=entry.code,
+            extracted_batches=entry.batches,
+        ):
+            if is_batch_included(batch, entry.batch_raw):
+                yield _scheduled_class(
+                    day,
+                    time,
+                    subject_index.subject_name(entry.code),
+                    entry.type,
+                    entry.location,
+                )
+        else:
+            is_enrolled, _ = enrollment.check(entry.code)
+            if is_enrolled and is_batch_included(batch, entry.batch_raw):
+                yield _scheduled_class(
+                    day,
+                    time,
+                    subject_index.subject_name(entry.code),
+                    entry.type,
+                    entry.location,
+                )
+
+
+def iter_classes(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
+    batch: str,
+    enrolled_subjects: list[str],
+) -> Iterator[ScheduledClass]:
+    """
+    Yield the classes of a Year 2+ Sector 62 timetable as they are matched.
+    """
+    enrollment = subject_index.enrolled(enrolled_subjects)
+
+    for day, time, entry in entries:
+        # Only add if code is in all_subs_code and batch is allowed
+        is_actu8ally_enrolled_suject, subject_details = enrollment.check(entry.code)
+        if is_actu8ally_enrolled_suject and is_batch_included(batch, entry.batch_raw):
+            yield _scheduled_class(
+                day,
+                time,
+                (
+                    subject_details["Subject"]
+                    if subject_details is not None
+                    else subject_index.subject_name(entry.code)
+                ),
+                entry.type if entry.type in ["L", "P", "T"] else "L",
+                entry.location,
+            )
+
+
+def build_year1(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
+    batch: str,
+    electives_subject_codes: list[str] = [],
+) -> dict:
+    """
+    Create a Year 1 Sector 62 timetable from tokenized class entries.
+    """
+    try:
+        return collect_timetable(
+            iter_classes_year1(entries, subject_index, batch, electives_subject_codes)
+        )
 
     except Exception as e:
         print(f"Error in time_table_creator: {str(e)}")
         return {}
 
 
-def time_table_creator_v2(
-    time_table_json: dict,
-    all_subjects: list[dict],  # {subject_code: [allowed_batches]}
+def build(
+    entries: Iterable[tuple[str, str, ParsedEntry]],
+    subject_index: SubjectIndex,
     batch: str,
     enrolled_subjects: list[str],
 ) -> dict:
     """
-    Create a personalized timetable for Year 2+ students at Sector 62.
+    Create a Year 2+ Sector 62 timetable from tokenized class entries.
     """
     try:
-        time_table = time_table_json if isinstance(time_table_json, dict) else {}
-
-        all_subjects = all_subjects if isinstance(all_subjects, list) else []
+        return collect_timetable(
+            iter_classes(entries, subject_index, batch, enrolled_subjects)
+        )
 
-        your_time_table = []
-
-        days = list(time_table.keys())
+    except Exception as e:
+        print(f"Error in time_table_creator_v2: {str(e)}")
+        return {}
 
-        for day in days:
-            time_slots = time_table[day]
-            time_slot_keys = list(time_slots.keys())
 
-            for time in time_slot_keys:
-                classes = time_slots[time]
-                if not isinstance(classes, list):
-                    continue
+def time_table_creator(
+    time_table_json: dict,
+    subject_json: list,
+    batch: str,
+    electives_subject_codes: list[str] = [],
+) -> dict:
+    """
+    Create a personalized timetable for Year 1 students at Sector 62.
+    """
+    time_table = time_table_json if isinstance(time_table_json, dict) else {}
+    subject = subject_json if isinstance(subject_json, list) else []
+    return build_year1(
+        class_entries(time_table), SubjectIndex(subject), batch, electives_subject_codes
+    )
 
-                for indi_class in classes:
-                    if not isinstance(indi_class, str):
-                        continue
-
-                    code = subject_extractor(indi_class.strip())
-                    batchs = batch_extractor(indi_class.strip())
-                    batchs_list = parse_batch_numbers(batchs)
-
-                    # Only add if code is in all_subs_code and batch is allowed
-                    is_actu8ally_enrolled_suject, subject_details = is_enrolled_subject(
-                        enrolled_subject_codes=enrolled_subjects,
-                        subject_dict=all_subjects,
-                        subject_code=code,
-                    )
-                    if is_actu8ally_enrolled_suject and is_batch_included(
-                        batch, batchs
-                    ):
-                        your_time_table.append(
-                            [
-                                day,
-                                time,
-                                (
-                                    subject_details["Subject"]
-                                    if subject_details is not None
-                                    else subject_name_extractor(all_subjects, code)  # type: ignore
-                                ),
-                                (
-                                    indi_class.strip()[0]
-                                    if indi_class.strip()[0] in ["L", "P", "T"]
-                                    else "L"
-                                ),
-                                location_extractor(indi_class.strip()),
-                            ]
-                        )
-
-        formatted_timetable = {}
-
-        for entry in your_time_table:
-            day = process_day(entry[0])
-            time = entry[1]
-            start_time, end_time = process_timeslot(time, entry[3])
-
-            if entry[2] in [
-                "ENGINEERING DRAWING AND DESIGN",
-                "Engineering Drawing & Design",
-            ]:
-                end_time = f"{int(end_time[:2])+1}{end_time[2:]}"
-
-            if day not in formatted_timetable:
-                formatted_timetable[day] = {}
-            # Format end time to ensure it's in HH:MM format
-            if len(end_time) == 4:  # If end time is like "1100"
-                end_time = f"{end_time[:2]}:{end_time[2:]}"
-
-            if (
-                len(entry[2].strip()) > 3
-                and len(entry[2].strip()) not in [5, 7]
-                and entry[2].strip() == entry[2].strip().upper()
-            ):
-                entry[2] = entry[2].strip().title()
-
-            formatted_timetable[day][f"{start_time}-{end_time}"] = {
-                "subject_name": entry[2],
-                "type": entry[3],
-                "location": entry[4],
-            }
-
-        return formatted_timetable
 
-    except Exception as e:
-        print(f"Error in time_table_creator_v2: {str(e)}")
-        return {}
+def time_table_creator_v2(
+    time_table_json: dict,
+    all_subjects: list[dict],  # {subject_code: [allowed_batches]}
+    batch: str,
+    enrolled_subjects: list[str],
+) -> dict:
+    """
+    Create a personalized timetable for Year 2+ students at Sector 62.
+    """
+    time_table = time_table_json if isinstance(time_table_json, dict) else {}
+    all_subjects = all_subjects if isinstance(all_subjects, list) else []
+    return build(
+        class_entries(time_table), SubjectIndex(all_subjects), batch, enrolled_subjects
+    )
 
 
 # Aliases for consistent interface across modules
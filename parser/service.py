@@ -0,0 +1,405 @@
+"""
+HTTP service for the parser, as a dependency-free ASGI application.
+
+Every semester under `data/time-table/<year>/<SEM>/` is compiled once at
+startup, in each worker process of a pool that runs the CPU work off the
+event loop. Responses carry an ETag derived from the semester content and the
+normalized request, so repeated requests are answered with 304 or from a
+bounded response cache without generating anything.
+
+Routes:
+    GET  /semesters      semester -> campus -> year -> batches
+    GET  /timetable      ?semester=2026/EVEN26&campus=62&year=3&batch=B12&electives=CS311,CS312
+    POST /compare        {"semester": ..., "people": [person, person]}
+    POST /compare-group  {"semester": ..., "people": [person, ...]}
+
+A person is {"campus", "year", "batch", "electives"} and may name its own
+"semester". Run with any ASGI server, e.g. `python service.py --port 8000`
+(needs the `service` extra for uvicorn).
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import traceback
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from modules.compare_tt import compare_group, compare_timetables
+from modules.semester import (
+    CACHE_VERSION,
+    CompiledSemester,
+    compile_semester,
+    semester_hash,
+    semester_jobs,
+)
+
+DATA_ROOT = Path(__file__).resolve().parents[1] / "data" / "time-table"
+"""The repository's `data/time-table` directory"""
+
+SemesterKey = tuple[str, str, str]
+"""(semester, campus, year), e.g. ("2026/EVEN26", "62", "3")"""
+
+
+def load_semesters(data_root: str | Path = DATA_ROOT) -> dict[SemesterKey, dict]:
+    """
+    Read every campus/year timetable below a data root.
+
+    Args:
+        data_root (str | Path): A `data/time-table` directory.
+
+    Returns:
+        dict[SemesterKey, dict]: The raw {"timetable", "subjects"} per key.
+
+    Raises:
+        FileNotFoundError: If data_root is not a directory.
+    """
+    if not Path(data_root).is_dir():
+        raise FileNotFoundError(f"data root {str(data_root)!r} is not a directory")
+    semesters = {}
+    for semester_dir in sorted(Path(data_root).glob("*/*")):
+        if not semester_dir.is_dir():
+            continue
+        name = f"{semester_dir.parent.name}/{semester_dir.name}"
+        for path, campus, year in semester_jobs(semester_dir):
+            year_data = json.loads(path.read_text(encoding="utf-8"))[year]
+            semesters[name, campus, year] = {
+                "timetable": year_data["timetable"],
+                "subjects": year_data.get("subjects") or [],
+            }
+    return semesters
+
+
+# Worker side: each worker process compiles the semesters once, and the jobs
+# below only receive small request tuples and return encoded JSON.
+
+_compiled: dict[SemesterKey, CompiledSemester] = {}
+
+
+def _compile_semesters(
+    semesters: dict[SemesterKey, dict],
+) -> dict[SemesterKey, CompiledSemester]:
+    return {
+        (semester, campus, year): compile_semester(
+            campus, year, data["timetable"], data["subjects"]
+        )
+        for (semester, campus, year), data in semesters.items()
+    }
+
+
+def _load_worker(data_root: str) -> None:
+    _compiled.update(_compile_semesters(load_semesters(data_root)))
+
+
+def _timetable(person: tuple) -> dict:
+    semester, campus, year, batch, electives = person
+    return _compiled[semester, campus, year].create_time_table(batch, list(electives))
+
+
+def _dump(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _timetable_job(person: tuple) -> bytes:
+    return _dump(_timetable(person))
+
+
+def _compare_job(people: tuple) -> bytes:
+    timetable1, timetable2 = (_timetable(person) for person in people)
+    return _dump(
+        {
+            "timetable1": timetable1,
+            "timetable2": timetable2,
+            "comparison": compare_timetables(timetable1, timetable2),
+        }
+    )
+
+
+def _group_job(people: tuple) -> bytes:
+    timetables = [_timetable(person) for person in people]
+    return _dump({"timetables": timetables, "comparison": compare_group(timetables)})
+
+
+def _etags(if_none_match: str) -> set[str]:
+    return {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+class BadRequest(Exception):
+    """A request the service answers with an error status"""
+
+    def __init__(self, message: str, status: int = 400) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class TimetableService:
+    """
+    ASGI application serving timetables and comparisons.
+
+    The pool starts on the ASGI lifespan startup event, or on the first
+    request for servers without lifespan support.
+    """
+
+    def __init__(
+        self,
+        data_root: str | os.PathLike = DATA_ROOT,
+        workers: int | None = None,
+        cache_size: int = 4096,
+    ) -> None:
+        """
+        Args:
+            data_root (str | os.PathLike): A `data/time-table` directory.
+            workers (int | None): Worker processes; the CPU count if None, and
+                0 to compile in-process and use a single thread.
+            cache_size (int): Encoded responses kept in memory, by ETag.
+        """
+        self.data_root = str(data_root)
+        self.workers = workers
+        self.cache_size = cache_size
+        self.catalogue: dict[str, dict[str, dict[str, list[str]]]] = {}
+        """semester -> campus -> year -> batches, as served by /semesters"""
+        self._hashes: dict[SemesterKey, str] = {}
+        self._responses: OrderedDict[str, bytes] = OrderedDict()
+        self._executor: Executor | None = None
+        self._starting: asyncio.Lock | None = None
+
+    # Lifecycle
+
+    def _start(self) -> None:
+        semesters = load_semesters(self.data_root)
+        compiled = _compile_semesters(semesters)
+
+        catalogue: dict[str, dict[str, dict[str, list[str]]]] = {}
+        for (semester, campus, year), data in semesters.items():
+            self._hashes[semester, campus, year] = semester_hash(
+                data["timetable"], data["subjects"]
+            )
+            catalogue.setdefault(semester, {}).setdefault(campus, {})[year] = list(
+                compiled[semester, campus, year].batches
+            )
+
+        # In-process, the semesters compiled for the catalogue serve requests;
+        # each worker process compiles its own copy instead.
+        if self.workers == 0:
+            _compiled.update(compiled)
+            executor = ThreadPoolExecutor(max_workers=1)
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_load_worker,
+                initargs=(self.data_root,),
+            )
+        self.catalogue = catalogue
+        self._executor = executor
+
+    async def startup(self) -> None:
+        """Load the semesters and start the worker pool, once."""
+        if self._starting is None:
+            self._starting = asyncio.Lock()
+        async with self._starting:
+            if self._executor is None:
+                await asyncio.get_running_loop().run_in_executor(None, self._start)
+
+    async def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # Requests
+
+    def _person(self, person: dict, default_semester: str | None) -> tuple:
+        if not isinstance(person, dict):
+            raise BadRequest("each person must be an object")
+        semester = person.get("semester") or default_semester
+        campus, year, batch = (
+            person.get("campus"),
+            person.get("year"),
+            person.get("batch"),
+        )
+        if isinstance(year, int):
+            year = str(year)
+        electives = person.get("electives", person.get("electives_subject_codes", []))
+        if isinstance(electives, str):
+            electives = [code for code in electives.split(",") if code]
+        if not isinstance(semester, str) or not semester:
+            raise BadRequest('semester is a required string, e.g. "2026/EVEN26"')
+        if not all(isinstance(value, str) and value for value in (campus, year, batch)):
+            raise BadRequest("campus, year and batch are required strings")
+        if not isinstance(electives, list) or not all(
+            isinstance(code, str) for code in electives
+        ):
+            raise BadRequest("electives must be a list of subject codes")
+        if (semester, campus, year) not in self._hashes:
+            raise BadRequest(
+                f"no timetable for semester {semester!r}, campus {campus!r}, "
+                f"year {year!r}",
+                404,
+            )
+        return (semester, campus, year, batch, tuple(sorted(set(electives))))
+
+    def _etag(self, route: str, people: tuple) -> str:
+        request = json.dumps(
+            [CACHE_VERSION, route]
+            + [[self._hashes[tuple(person[:3])], *person] for person in people],
+            separators=(",", ":"),
+        )
+        return '"' + hashlib.sha256(request.encode("utf-8")).hexdigest()[:32] + '"'
+
+    async def _generate(self, job, argument, etag: str) -> bytes:
+        body = self._responses.get(etag)
+        if body is not None:
+            self._responses.move_to_end(etag)
+            return body
+        loop = asyncio.get_running_loop()
+        body = await loop.run_in_executor(self._executor, job, argument)
+        self._responses[etag] = body
+        while len(self._responses) > self.cache_size:
+            self._responses.popitem(last=False)
+        return body
+
+    async def handle(
+        self, method: str, path: str, query: str, body: bytes, if_none_match: str = ""
+    ) -> tuple[int, bytes, str | None]:
+        """
+        Answer one request.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Request path.
+            query (str): Raw query string.
+            body (bytes): Request body.
+            if_none_match (str): The If-None-Match header; a matching ETag is
+                answered with 304 before anything is generated.
+
+        Returns:
+            tuple[int, bytes, str | None]: Status, JSON body and ETag.
+        """
+        if path == "/semesters":
+            if method != "GET":
+                raise BadRequest("use GET", 405)
+            return 200, _dump(self.catalogue), None
+
+        if path == "/timetable":
+            if method != "GET":
+                raise BadRequest("use GET", 405)
+            params = {key: values[-1] for key, values in parse_qs(query).items()}
+            person = self._person(params, params.get("semester"))
+            etag = self._etag(path, (person,))
+            if etag in _etags(if_none_match):
+                return 304, b"", etag
+            return 200, await self._generate(_timetable_job, person, etag), etag
+
+        if path in ("/compare", "/compare-group"):
+            if method != "POST":
+                raise BadRequest("use POST", 405)
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                raise BadRequest("body must be JSON")
+            people = payload.get("people") if isinstance(payload, dict) else None
+            if not isinstance(people, list):
+                raise BadRequest('body must have a "people" list')
+            if path == "/compare" and len(people) != 2:
+                raise BadRequest("/compare takes exactly two people")
+            if path == "/compare-group" and not people:
+                raise BadRequest("/compare-group takes at least one person")
+            people = tuple(self._person(p, payload.get("semester")) for p in people)
+            etag = self._etag(path, people)
+            if etag in _etags(if_none_match):
+                return 304, b"", etag
+            job = _compare_job if path == "/compare" else _group_job
+            return 200, await self._generate(job, people, etag), etag
+
+        raise BadRequest(f"no route {path}", 404)
+
+    # ASGI
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    try:
+                        await self.startup()
+                    except Exception as error:
+                        await send(
+                            {
+                                "type": "lifespan.startup.failed",
+                                "message": f"{type(error).__name__}: {error}",
+                            }
+                        )
+                        return
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await self.shutdown()
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        request_headers = dict(scope.get("headers", []))
+        try:
+            await self.startup()
+            status, content, etag = await self.handle(
+                scope["method"],
+                scope["path"],
+                scope.get("query_string", b"").decode("latin-1"),
+                body,
+                request_headers.get(b"if-none-match", b"").decode("latin-1"),
+            )
+        except BadRequest as error:
+            status, content, etag = error.status, _dump({"error": str(error)}), None
+        except Exception as error:
+            traceback.print_exc()
+            status, etag = 500, None
+            content = _dump({"error": f"{type(error).__name__}: {error}"})
+
+        headers = [(b"content-type", b"application/json")]
+        if etag is not None:
+            headers += [(b"etag", etag.encode()), (b"cache-control", b"no-cache")]
+
+        headers.append((b"content-length", str(len(content)).encode()))
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": content})
+
+
+app = TimetableService()
+"""Default application over the repository's data/time-table"""
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="JIIT timetable parser service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--data", default=str(DATA_ROOT), help="data/time-table root")
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (0: in-process)",
+    )
+    args = parser.parse_args()
+    uvicorn.run(
+        TimetableService(args.data, workers=args.workers),
+        host=args.host,
+        port=args.port,
+    )
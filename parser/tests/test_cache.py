@@ -0,0 +1,63 @@
+"""On-disk tier and key versioning of `TimetableCache`."""
+
+import os
+
+from modules.semester import TimetableCache
+from modules.semester.cache import _source_hash
+
+TIMETABLE = {"MON": {"9-9.50": ["LB12(CS311)-CR1/ABC"]}}
+
+
+def _create(campus, year, time_table_json, subject_json, batch, electives):
+    return {"batch": batch}
+
+
+def _blobs(directory) -> list[str]:
+    return [name for _, _, names in os.walk(directory) for name in names]
+
+
+def test_disk_tier_is_bounded(tmp_path):
+    cache = TimetableCache(_create, maxsize=1, directory=tmp_path, disk_maxsize=10)
+    for batch in range(25):
+        cache.get_json("62", "3", TIMETABLE, [], f"B{batch}")
+
+    assert len(_blobs(tmp_path)) <= 10
+    assert cache.stats()["disk_evictions"] == 25 - len(_blobs(tmp_path))
+    # The last blob written survives and is served from disk.
+    fresh = TimetableCache(_create, directory=tmp_path, disk_maxsize=10)
+    assert fresh.create_time_table("62", "3", TIMETABLE, [], "B24") == {"batch": "B24"}
+    assert fresh.stats()["disk_hits"] == 1
+
+
+def test_failed_disk_write_is_skipped(tmp_path):
+    # A file where the cache directory should be makes every write fail.
+    directory = tmp_path / "cache"
+    directory.write_text("")
+    cache = TimetableCache(_create, directory=directory)
+
+    assert cache.create_time_table("62", "3", TIMETABLE, [], "B12") == {"batch": "B12"}
+    assert cache.create_time_table("62", "3", TIMETABLE, [], "B12") == {"batch": "B12"}
+    assert cache.stats()["hits"] == 1
+    assert _blobs(tmp_path) == ["cache"]
+
+
+def test_source_hash_follows_creator_code(tmp_path):
+    package = tmp_path / "utils"
+    (package / "__pycache__").mkdir(parents=True)
+    (package / "batch.py").write_text("RULE = 1\n")
+    (tmp_path / "compiled.py").write_text("")
+    sources = ("utils", "compiled")
+    original = _source_hash(tmp_path, sources)
+
+    (package / "__pycache__" / "batch.cpython-312.pyc").write_bytes(b"stale")
+    (package / "notes.txt").write_text("ignored")
+    assert _source_hash(tmp_path, sources) == original
+
+    (package / "batch.py").write_text("RULE = 2\n")
+    changed = _source_hash(tmp_path, sources)
+    assert changed != original
+
+    # A sourceless (slim wheel) module is hashed by its bytecode.
+    (tmp_path / "compiled.py").unlink()
+    (tmp_path / "compiled.pyc").write_bytes(b"bytecode")
+    assert _source_hash(tmp_path, sources) != changed
@@ -0,0 +1,164 @@
+"""Minute-resolution sweeps of `compare_timetables` and `compare_group`."""
+
+import pytest
+
+from main import compare_group, compare_timetables
+from models import WeekGrid
+
+
+def _class(subject: str, type: str = "L", location: str = "CR1") -> dict:
+    return {"subject_name": subject, "type": type, "location": location}
+
+
+FIRST = {
+    "Monday": {
+        "09:00-09:50": _class("Maths"),
+        "10:00-10:50": _class("Physics"),
+        "14:00-15:50": _class("Lab", "P", "CL1"),
+    }
+}
+SECOND = {
+    "Monday": {
+        "09:00-09:50": _class("Maths"),
+        "11:00-11:50": _class("DBMS"),
+        "14:00-15:50": _class("Lab", "P", "CL1"),
+    },
+    "Tuesday": {"07:00-08:30": _class("Early")},
+}
+
+
+def test_free_time_is_merged_ranges_between_50_minute_slots():
+    result = compare_timetables(FIRST, SECOND)
+
+    assert result["common_free_slots"] == {
+        "Monday": [
+            "08:00-09:00",
+            "09:50-10:00",
+            "10:50-11:00",
+            "11:50-14:00",
+            "15:50-17:00",
+        ],
+        "Tuesday": ["08:30-17:00"],
+    }
+
+
+def test_shared_classes_and_labs_are_exact_overlaps():
+    result = compare_timetables(FIRST, SECOND)
+
+    assert result["classes_together"] == {
+        "Monday": {
+            "09:00-09:50": _class("Maths"),
+            "14:00-15:50": _class("Lab", "P", "CL1"),
+        }
+    }
+
+
+def test_day_window_clips_free_time_and_overlaps():
+    result = compare_timetables(FIRST, SECOND, day_start="09:30", day_end="15:00")
+
+    assert result["common_free_slots"] == {
+        "Monday": ["09:50-10:00", "10:50-11:00", "11:50-14:00"],
+        "Tuesday": ["09:30-15:00"],
+    }
+    assert result["classes_together"] == {
+        "Monday": {
+            "09:30-09:50": _class("Maths"),
+            "14:00-15:00": _class("Lab", "P", "CL1"),
+        }
+    }
+
+
+def test_back_to_back_slots_of_one_class_merge():
+    first = {"Friday": {"09:00-09:50": _class("OS"), "09:50-10:40": _class("OS")}}
+    second = {"Friday": {"09:00-10:40": _class("OS")}}
+
+    result = compare_timetables(first, second)
+
+    assert result["classes_together"] == {"Friday": {"09:00-10:40": _class("OS")}}
+    assert result["common_free_slots"] == {"Friday": ["08:00-09:00", "10:40-17:00"]}
+
+
+@pytest.mark.parametrize(
+    "other",
+    [_class("Maths", location="CR2"), _class("Maths", "T"), _class("Physics")],
+)
+def test_different_classes_at_the_same_time_are_not_together(other):
+    result = compare_timetables(
+        {"Monday": {"09:00-09:50": _class("Maths")}},
+        {"Monday": {"09:00-09:50": other}},
+    )
+
+    assert result["classes_together"] == {}
+
+
+def test_week_grids_compare_like_dicts():
+    expected = compare_timetables(FIRST, SECOND)
+
+    assert (
+        compare_timetables(WeekGrid.from_dict(FIRST), WeekGrid.from_dict(SECOND))
+        == expected
+    )
+
+
+THIRD = {
+    "Monday": {
+        "09:00-09:50": _class("Maths"),
+        "13:00-14:30": _class("Sports", location="Ground"),
+    }
+}
+
+
+def test_group_of_one_is_free_around_and_together_with_itself():
+    result = compare_group([FIRST])
+
+    assert result["common_free_slots"] == {
+        "Monday": ["08:00-09:00", "09:50-10:00", "10:50-14:00", "15:50-17:00"]
+    }
+    assert result["busy_counts"] == {
+        "Monday": {"09:00-09:50": 1, "10:00-10:50": 1, "14:00-15:50": 1}
+    }
+    assert result["classes_together"] == {"Monday": FIRST["Monday"]}
+
+
+def test_group_of_two_matches_compare_timetables():
+    result = compare_group([FIRST, SECOND])
+    expected = compare_timetables(FIRST, SECOND)
+
+    assert result["common_free_slots"] == expected["common_free_slots"]
+    assert result["classes_together"] == expected["classes_together"]
+
+
+def test_group_of_three_counts_busy_people_per_range():
+    result = compare_group([FIRST, SECOND, WeekGrid.from_dict(THIRD)])
+
+    assert result["busy_counts"] == {
+        "Monday": {
+            "09:00-09:50": 3,
+            "10:00-10:50": 1,
+            "11:00-11:50": 1,
+            "13:00-14:00": 1,
+            "14:00-14:30": 3,
+            "14:30-15:50": 2,
+        },
+        "Tuesday": {"08:00-08:30": 1},
+    }
+    assert result["common_free_slots"] == {
+        "Monday": [
+            "08:00-09:00",
+            "09:50-10:00",
+            "10:50-11:00",
+            "11:50-13:00",
+            "15:50-17:00",
+        ],
+        "Tuesday": ["08:30-17:00"],
+    }
+    assert result["classes_together"] == {"Monday": {"09:00-09:50": _class("Maths")}}
+
+
+def test_group_day_window_clips_busy_counts():
+    result = compare_group([FIRST, SECOND, THIRD], day_start="14:00", day_end="15:00")
+
+    assert result["busy_counts"] == {
+        "Monday": {"14:00-14:30": 3, "14:30-15:00": 2},
+    }
+    assert result["common_free_slots"] == {"Tuesday": ["14:00-15:00"]}
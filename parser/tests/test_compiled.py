@@ -0,0 +1,60 @@
+"""Per-campus elective rules behind `CompiledSemester.core_subject_codes`."""
+
+import json
+from pathlib import Path
+
+from modules.semester import campus_parser, compile_semester
+
+DATA_ROOT = Path(__file__).resolve().parents[2] / "data" / "time-table"
+
+
+def _corpus_year(semester: str, campus: str, year: str) -> tuple[dict, list]:
+    path = DATA_ROOT / semester / f"{campus}.json"
+    data = json.loads(path.read_text(encoding="utf-8"))[year]
+    return data["timetable"], data["subjects"]
+
+
+def test_sector_128_core_codes_skip_all_and_shared_electives():
+    timetable, subjects = _corpus_year("2025/EVEN25", "128", "3")
+    semester = compile_semester("128", "3", timetable, subjects)
+
+    # E1 also sits in 'ALL' electives and in HSS electives shared by five or
+    # more batches ('E1E2E3E4E5', 'F9E1E2E4E5', ...); only its own classes count.
+    assert semester.core_subject_codes("E1") == [
+        "18B11EC315",
+        "18B15EC315",
+        "15B17EC671",
+        "15B11EC611",
+    ]
+
+
+def test_sector_128_elective_rule():
+    parser = campus_parser("128")
+
+    assert parser.is_elective(parser.tokenize("LALL(15B11CI514)-CS1/ABC"))
+    assert parser.is_elective(parser.tokenize("LE1E2E3E4E5(16B1NHS636)-CS1/ABC"))
+    assert not parser.is_elective(parser.tokenize("LE1E2(15B11EC611)-CS1/ABC"))
+
+
+def test_bca_core_codes():
+    timetable = {
+        "MON": {
+            "9-9.50": [
+                "LBCA1(23B61CA221)-SHR/CR501",
+                "LBCA1BCA2BCA3BCA4(23B12CA216)-MEE/CS6",
+            ],
+            "10-10.50": ["PBCA1BCA2(23B65CA221)-SHR/CL1"],
+        }
+    }
+    semester = compile_semester("BCA", "2", timetable, [])
+
+    assert semester.core_subject_codes("BCA1") == ["23B61CA221", "23B65CA221"]
+    assert semester.core_subject_codes("BCA3") == []
+
+
+def test_year_1_has_no_core_codes():
+    timetable, subjects = _corpus_year("2026/EVEN26", "128", "1")
+    semester = compile_semester("128", "1", timetable, subjects)
+
+    assert semester.batches
+    assert all(semester.core_subject_codes(b) == [] for b in semester.batches)
@@ -0,0 +1,122 @@
+"""Release diffs and the incremental `export --previous` shard selection."""
+
+import copy
+import json
+
+import pytest
+
+from modules.semester import diff_semesters
+from tools.export import export_semester
+
+SUBJECTS = [
+    {"Code": "CS311", "Full Code": "18B11CS311", "Subject": "Networks"},
+    {"Code": "MA111", "Full Code": "15B11MA111", "Subject": "Maths"},
+]
+OLD = {
+    "timetable": {
+        "MON": {
+            "9-10AM": ["LA1(CS311)-G1/ABC", "LB1(MA111)-G2/XYZ"],
+            "10-11AM": ["TA2(MA111)-G3/XYZ"],
+        }
+    },
+    "subjects": SUBJECTS,
+}
+
+
+def _moved_b1_class() -> dict:
+    new = copy.deepcopy(OLD)
+    monday = new["timetable"]["MON"]
+    monday["11-12PM"] = [monday["9-10AM"].pop()]
+    return new
+
+
+def _renamed_maths() -> dict:
+    new = copy.deepcopy(OLD)
+    new["subjects"] = [SUBJECTS[0], {**SUBJECTS[1], "Subject": "Calculus"}]
+    return new
+
+
+def _dropped_a1_class() -> dict:
+    new = copy.deepcopy(OLD)
+    new["timetable"]["MON"]["9-10AM"].pop(0)
+    return new
+
+
+def test_identical_releases_affect_nothing():
+    diff = diff_semesters("62", "3", OLD, copy.deepcopy(OLD))
+
+    assert not diff.changed
+    assert (diff.added, diff.removed, diff.moved) == ((), (), ())
+    assert diff.affected_subjects == frozenset()
+
+
+def test_moved_class_affects_only_its_batch():
+    diff = diff_semesters("62", "3", OLD, _moved_b1_class())
+
+    assert diff.moved == (("LB1(MA111)-G2/XYZ", "MON", "9-10AM", "MON", "11-12PM"),)
+    assert (diff.added, diff.removed) == ((), ())
+    assert diff.affected_subjects == {"MA111"}
+    assert diff.affected_batches == ("B1",)
+
+
+def test_edited_subject_affects_every_batch_taking_it():
+    diff = diff_semesters("62", "3", OLD, _renamed_maths())
+
+    assert diff.moved == ()
+    assert diff.changed_subjects == {"MA111"}
+    assert diff.affected_batches == ("A2", "B1")
+
+
+def test_added_and_removed_classes():
+    diff = diff_semesters("62", "3", OLD, _dropped_a1_class())
+
+    assert diff.removed == (("MON", "9-10AM", "LA1(CS311)-G1/ABC"),)
+    assert diff.added == ()
+    assert diff.affected_subjects == {"CS311"}
+    assert diff.affected_batches == ("A1",)
+
+
+def _write_semester(root, name: str, year_data: dict):
+    semester_dir = root / name
+    semester_dir.mkdir()
+    (semester_dir / "62.json").write_text(json.dumps({"3": year_data}))
+    return semester_dir
+
+
+@pytest.mark.parametrize(
+    "new, regenerated, removed",
+    [
+        (_moved_b1_class(), {"B1"}, set()),
+        (_renamed_maths(), {"A2", "B1"}, set()),
+        (_dropped_a1_class(), set(), {"A1"}),
+    ],
+)
+def test_export_previous_rewrites_only_affected_shards(
+    tmp_path, new, regenerated, removed
+):
+    old_dir = _write_semester(tmp_path, "old", OLD)
+    new_dir = _write_semester(tmp_path, "new", new)
+    out_dir = tmp_path / "out"
+    old_manifest, written = export_semester(old_dir, out_dir, workers=1)
+    assert written == 3
+
+    shards = {name: (out_dir / name).read_bytes() for name in old_manifest["files"]}
+    manifest, written = export_semester(
+        new_dir, out_dir, workers=1, previous_dir=old_dir
+    )
+
+    assert written == len(regenerated)
+    for batch in {"A1", "A2", "B1"}:
+        name = f"62/3/{batch}.json"
+        if batch in removed:
+            assert name not in manifest["files"]
+            assert not (out_dir / name).exists()
+        elif batch in regenerated:
+            assert manifest["files"][name] != old_manifest["files"][name]
+            assert (out_dir / name).read_bytes() != shards[name]
+        else:
+            assert manifest["files"][name] == old_manifest["files"][name]
+            assert (out_dir / name).read_bytes() == shards[name]
+
+    fresh, _ = export_semester(new_dir, tmp_path / "fresh", workers=1)
+    assert manifest["files"] == fresh["files"]
@@ -0,0 +1,66 @@
+"""Class order of the `iter_classes` API and its raised errors."""
+
+import pytest
+
+from main import collect_timetable, compile_semester, create_time_table, iter_classes
+from models import ScheduledClass
+
+SUBJECTS = [
+    {"Code": "CS311", "Full Code": "18B11CS311", "Subject": "Networks"},
+    {"Code": "MA111", "Full Code": "15B11MA111", "Subject": "Maths"},
+]
+TIMETABLE = {
+    "TUES": {
+        "10-11AM": ["LB1(MA111)-G2/XYZ"],
+        "9-10AM": ["LA1B1(CS311)-G1/ABC"],
+    },
+    "MON": {"2-3PM": ["PB1(CS311)-CL1/ABC", "TB(MA111)-G3/XYZ"]},
+}
+ELECTIVES = ["CS311", "MA111"]
+
+
+def _compiled_iter_classes(*args):
+    campus, year, timetable, subjects, batch, electives = args
+    semester = compile_semester(campus, year, timetable, subjects)
+    return semester.iter_classes(batch, electives)
+
+
+ITERATORS = pytest.mark.parametrize(
+    "iterate", [iter_classes, _compiled_iter_classes], ids=["main", "compiled"]
+)
+
+
+@ITERATORS
+def test_classes_come_in_raw_timetable_order(iterate):
+    classes = list(iterate("62", "3", TIMETABLE, SUBJECTS, "B1", ELECTIVES))
+
+    assert classes == [
+        ScheduledClass("Tuesday", "10:00", "11:00", "Maths", "L", "G2"),
+        ScheduledClass("Tuesday", "09:00", "10:00", "Networks", "L", "G1"),
+        ScheduledClass("Monday", "14:00", "16:00", "Networks", "P", "CL1"),
+        ScheduledClass("Monday", "14:00", "15:00", "Maths", "T", "G3"),
+    ]
+    assert collect_timetable(classes) == create_time_table(
+        "62", "3", TIMETABLE, SUBJECTS, "B1", ELECTIVES
+    )
+
+
+def test_later_class_in_the_same_slot_wins():
+    timetable = {"MON": {"9-10AM": ["LB1(CS311)-G1/ABC", "LB1(MA111)-G2/XYZ"]}}
+    classes = list(iter_classes("62", "3", timetable, SUBJECTS, "B1", ELECTIVES))
+
+    assert [c.subject_name for c in classes] == ["Networks", "Maths"]
+    assert collect_timetable(classes) == {
+        "Monday": {
+            "09:00-10:00": {"subject_name": "Maths", "type": "L", "location": "G2"}
+        }
+    }
+
+
+@ITERATORS
+def test_empty_batch_raises_where_create_time_table_returns_empty(iterate):
+    # A class for a bare batch letter ('TB') indexes the user's batch.
+    with pytest.raises(IndexError):
+        list(iterate("62", "3", TIMETABLE, SUBJECTS, "", ["MA111"]))
+
+    assert create_time_table("62", "3", TIMETABLE, SUBJECTS, "", ["MA111"]) == {}
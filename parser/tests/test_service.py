@@ -0,0 +1,123 @@
+"""`TimetableService.handle` over an in-process (workers=0) service."""
+
+import asyncio
+import json
+
+import pytest
+
+from main import compare_timetables, create_time_table
+from service import BadRequest, TimetableService
+
+SUBJECTS = [
+    {"Code": "CS311", "Full Code": "18B11CS311", "Subject": "Networks"},
+    {"Code": "MA111", "Full Code": "15B11MA111", "Subject": "Maths"},
+]
+TIMETABLE = {
+    "MON": {
+        "9-10AM": ["LA1B1(CS311)-G1/ABC"],
+        "10-11AM": ["LB1(MA111)-G2/XYZ"],
+    },
+}
+PERSON = {"campus": "62", "year": "3", "batch": "B1", "electives": ["MA111"]}
+TIMETABLE_QUERY = "semester=2026/EVEN26&campus=62&year=3&batch=B1&electives=MA111"
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory):
+    data_root = tmp_path_factory.mktemp("time-table")
+    semester_dir = data_root / "2026" / "EVEN26"
+    semester_dir.mkdir(parents=True)
+    (semester_dir / "62.json").write_text(
+        json.dumps({"3": {"timetable": TIMETABLE, "subjects": SUBJECTS}})
+    )
+    service = TimetableService(data_root, workers=0)
+    asyncio.run(service.startup())
+    yield service
+    asyncio.run(service.shutdown())
+
+
+def _handle(service, method, path, query="", body=b"", if_none_match=""):
+    return asyncio.run(service.handle(method, path, query, body, if_none_match))
+
+
+def test_semesters_lists_compiled_batches(service):
+    status, body, etag = _handle(service, "GET", "/semesters")
+
+    assert status == 200
+    assert etag is None
+    assert json.loads(body) == {"2026/EVEN26": {"62": {"3": ["A1", "B1"]}}}
+
+
+def test_timetable_then_not_modified(service):
+    status, body, etag = _handle(service, "GET", "/timetable", TIMETABLE_QUERY)
+
+    assert status == 200
+    assert json.loads(body) == create_time_table(
+        "62", "3", TIMETABLE, SUBJECTS, "B1", ["MA111"]
+    )
+
+    status, body, again = _handle(
+        service, "GET", "/timetable", TIMETABLE_QUERY, if_none_match=f'W/{etag}, "x"'
+    )
+    assert (status, body, again) == (304, b"", etag)
+
+
+def test_electives_are_normalized_into_the_etag(service):
+    _, _, etag = _handle(service, "GET", "/timetable", TIMETABLE_QUERY + ",CS311,MA111")
+    _, _, reordered = _handle(
+        service, "GET", "/timetable", TIMETABLE_QUERY.replace("MA111", "CS311,MA111")
+    )
+
+    assert etag == reordered
+
+
+def test_compare_and_compare_group(service):
+    other = {**PERSON, "batch": "A1", "electives": ["CS311"]}
+    payload = {"semester": "2026/EVEN26", "people": [PERSON, other]}
+
+    status, body, _ = _handle(service, "POST", "/compare", body=json.dumps(payload))
+    result = json.loads(body)
+    assert status == 200
+    assert result["comparison"] == compare_timetables(
+        result["timetable1"], result["timetable2"]
+    )
+
+    status, body, _ = _handle(
+        service, "POST", "/compare-group", body=json.dumps(payload)
+    )
+    assert status == 200
+    assert len(json.loads(body)["timetables"]) == 2
+
+
+@pytest.mark.parametrize(
+    "method, path, query, body, status",
+    [
+        ("GET", "/timetable", "semester=2026/EVEN26&campus=62&year=3", b"", 400),
+        ("POST", "/compare", "", b"not json", 400),
+        ("POST", "/compare", "", b'{"people": "B1"}', 400),
+        (
+            "POST",
+            "/compare",
+            "",
+            json.dumps({"semester": "2026/EVEN26", "people": [PERSON]}).encode(),
+            400,
+        ),
+        ("POST", "/compare-group", "", b'{"people": []}', 400),
+        (
+            "GET",
+            "/timetable",
+            TIMETABLE_QUERY.replace("EVEN26", "ODD26"),
+            b"",
+            404,
+        ),
+        ("GET", "/nope", "", b"", 404),
+        ("POST", "/timetable", TIMETABLE_QUERY, b"", 405),
+        ("GET", "/compare", "", b"", 405),
+        ("PUT", "/semesters", "", b"", 405),
+    ],
+)
+def test_bad_requests(service, method, path, query, body, status):
+    with pytest.raises(BadRequest) as error:
+        _handle(service, method, path, query, body)
+
+    assert error.value.status == status
@@ -0,0 +1,83 @@
+"""WeekGrid round-trips and ClassTable sharing."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from main import create_all_timetables
+from models import ClassTable, ScheduledClass, WeekGrid
+
+DATA_ROOT = Path(__file__).resolve().parents[2] / "data" / "time-table"
+
+
+def _class(subject: str, type: str = "L", location: str = "CR1") -> dict:
+    return {"subject_name": subject, "type": type, "location": location}
+
+
+@pytest.mark.parametrize(
+    "timetable",
+    [
+        {},
+        {"Monday": {}},
+        {
+            "Wednesday": {
+                "14:00-15:50": _class("Lab", "P", "CL1"),
+                "09:00-09:50": _class("Maths"),
+            },
+            "Monday": {"09:00-09:50": _class("Maths"), "bad slot": _class("Odd")},
+        },
+    ],
+    ids=["empty", "empty-day", "unsorted"],
+)
+def test_to_dict_round_trips_key_order(timetable):
+    result = WeekGrid.from_dict(timetable).to_dict()
+
+    assert json.dumps(result) == json.dumps(timetable)
+
+
+def test_from_classes_matches_from_dict_and_keeps_replaced_position():
+    classes = [
+        ScheduledClass("Monday", "09:00", "09:50", "Maths", "L", "CR1"),
+        ScheduledClass("Monday", "10:00", "10:50", "Physics", "L", "CR2"),
+        ScheduledClass("Monday", "09:00", "09:50", "DBMS", "T", "CR3"),
+    ]
+
+    grid = WeekGrid.from_classes(classes)
+
+    assert list(grid.to_dict()["Monday"].items()) == [
+        ("09:00-09:50", _class("DBMS", "T", "CR3")),
+        ("10:00-10:50", _class("Physics", "L", "CR2")),
+    ]
+    assert grid.to_dict() == WeekGrid.from_dict(grid.to_dict()).to_dict()
+
+
+def test_grids_share_one_table():
+    table = ClassTable()
+    first = WeekGrid.from_dict({"Monday": {"09:00-09:50": _class("Maths")}}, table)
+    second = WeekGrid.from_dict(
+        {
+            "Tuesday": {
+                "09:00-09:50": _class("Maths"),
+                "10:00-10:50": _class("Physics"),
+            }
+        },
+        table,
+    )
+
+    assert first.table is second.table is table
+    assert table.labels == ["09:00-09:50", "10:00-10:50"]
+    assert len(table.classes) == 2
+    assert first.class_ids[0] == second.class_ids[0]
+    assert first.to_dict() == {"Monday": {"09:00-09:50": _class("Maths")}}
+
+
+def test_create_all_timetables_grids_share_a_table():
+    year = json.loads((DATA_ROOT / "2026" / "EVEN26" / "62.json").read_text())["3"]
+    args = ("62", "3", year["timetable"], year["subjects"])
+
+    grids = create_all_timetables(*args, as_grid=True)
+    dicts = create_all_timetables(*args)
+
+    assert len({id(grid.table) for grid in grids.values()}) == 1
+    assert {batch: grid.to_dict() for batch, grid in grids.items()} == dicts
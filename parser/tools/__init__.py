@@ -0,0 +1,3 @@
+"""
+Maintainer tooling that runs outside the browser and is not shipped in the wheel.
+"""
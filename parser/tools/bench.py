@@ -0,0 +1,215 @@
+"""
+Benchmarks of the public API over the real `data/time-table` corpus.
+
+Every campus/year/batch of every semester is generated with
+`create_time_table` for a few elective sets, each campus/year with
+`create_all_timetables`, and sampled pairs of the generated timetables are
+compared with `compare_timetables`. The report records per-function timings,
+throughput and peak traced memory as JSON, so runs on two commits can be
+compared with `compare_reports`.
+"""
+
+import os
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+from pathlib import Path
+
+from main import create_all_timetables, create_time_table
+from modules.compare_tt import compare_timetables
+
+from .corpus import DATA_ROOT, CorpusYear, corpus_years, sample_elective_sets
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _measure(run: Callable[[], None], repeat: int, memory: bool) -> tuple[float, int]:
+    """Best wall time of `repeat` runs, and the peak traced memory of one more"""
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+
+        peak = 0
+        if memory:
+            tracemalloc.start()
+            try:
+                run()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return best, peak
+
+
+def _result(calls: int, seconds: float, peak: int) -> dict:
+    return {
+        "calls": calls,
+        "seconds": round(seconds, 6),
+        "per_call_us": round(seconds / calls * 1e6, 3) if calls else None,
+        "per_second": round(calls / seconds, 1) if seconds else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_benchmarks(
+    data_root: str | Path = DATA_ROOT,
+    repeat: int = 3,
+    pairs: int = 500,
+    seed: int = 0,
+    memory: bool = True,
+) -> dict:
+    """
+    Benchmark timetable generation and comparison over the corpus.
+
+    Args:
+        data_root (str | Path): A `data/time-table` directory.
+        repeat (int): Timed runs per benchmark; the fastest is reported.
+        pairs (int): Number of timetable pairs to compare.
+        seed (int): Seed for the elective sets and the sampled pairs.
+        memory (bool): Also trace one extra run for its peak memory.
+
+    Returns:
+        dict: JSON-serializable report with the environment, the corpus size
+            and one result per benchmark.
+    """
+    rng = random.Random(seed)
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        years = corpus_years(data_root)
+    cases: list[tuple[CorpusYear, str, list[str]]] = [
+        (corpus_year, batch, electives)
+        for corpus_year in years
+        for electives in sample_elective_sets(corpus_year.subjects, rng)
+        for batch in corpus_year.batches
+    ]
+
+    results = {}
+
+    by_campus: dict[str, list[tuple[CorpusYear, str, list[str]]]] = {}
+    for case in cases:
+        by_campus.setdefault(case[0].campus, []).append(case)
+
+    def generate(campus_cases):
+        def run():
+            for corpus_year, batch, electives in campus_cases:
+                create_time_table(
+                    corpus_year.campus,
+                    corpus_year.year,
+                    corpus_year.timetable,
+                    corpus_year.subjects,
+                    batch,
+                    electives,
+                )
+
+        return run
+
+    seconds, peak = _measure(generate(cases), repeat, memory)
+    results["create_time_table"] = _result(len(cases), seconds, peak)
+    results["create_time_table"]["by_campus"] = {}
+    for campus, campus_cases in by_campus.items():
+        seconds, peak = _measure(generate(campus_cases), repeat, memory)
+        results["create_time_table"]["by_campus"][campus] = _result(
+            len(campus_cases), seconds, peak
+        )
+
+    def generate_all():
+        for corpus_year in years:
+            create_all_timetables(
+                corpus_year.campus,
+                corpus_year.year,
+                corpus_year.timetable,
+                corpus_year.subjects,
+            )
+
+    seconds, peak = _measure(generate_all, repeat, memory)
+    results["create_all_timetables"] = _result(
+        sum(len(corpus_year.batches) for corpus_year in years), seconds, peak
+    )
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        timetables = [
+            create_all_timetables(
+                corpus_year.campus,
+                corpus_year.year,
+                corpus_year.timetable,
+                corpus_year.subjects,
+            )
+            for corpus_year in years
+        ]
+    pools = [list(batches.values()) for batches in timetables if len(batches) > 1]
+    sampled = []
+    for _ in range(pairs if pools else 0):
+        pool = rng.choice(pools)
+        sampled.append(tuple(rng.sample(pool, 2)))
+
+    def compare():
+        for first, second in sampled:
+            compare_timetables(first, second)
+
+    seconds, peak = _measure(compare, repeat, memory)
+    results["compare_timetables"] = _result(len(sampled), seconds, peak)
+
+    return {
+        "commit": _git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {"repeat": repeat, "pairs": pairs, "seed": seed},
+        "corpus": {
+            "files": len({corpus_year.path for corpus_year in years}),
+            "years": len(years),
+            "batches": sum(len(corpus_year.batches) for corpus_year in years),
+            "cases": len(cases),
+        },
+        "results": results,
+    }
+
+
+def compare_reports(baseline: dict, current: dict) -> dict[str, float]:
+    """
+    Speedup of each benchmark between two reports.
+
+    Args:
+        baseline (dict): Report of the reference run.
+        current (dict): Report of the new run.
+
+    Returns:
+        dict[str, float]: Benchmark -> baseline seconds / current seconds;
+            above 1 means the current run is faster. Per-campus entries are
+            named like 'create_time_table[62]'.
+    """
+
+    def flatten(report: dict) -> dict[str, dict]:
+        flat = {}
+        for name, result in report.get("results", {}).items():
+            flat[name] = result
+            for campus, campus_result in result.get("by_campus", {}).items():
+                flat[f"{name}[{campus}]"] = campus_result
+        return flat
+
+    old, new = flatten(baseline), flatten(current)
+    return {
+        name: round(old[name]["seconds"] / new[name]["seconds"], 3)
+        for name in old
+        if name in new
+        and new[name]["seconds"]
+        and old[name]["calls"] == new[name]["calls"]
+    }
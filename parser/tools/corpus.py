@@ -0,0 +1,101 @@
+"""
+The real timetable corpus under `data/time-table/<year>/<SEM>/<campus>.json`,
+as used by the benchmark and equivalence tools.
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import NamedTuple
+
+from modules.semester import compile_semester, semester_jobs
+
+DATA_ROOT = Path(__file__).resolve().parents[2] / "data" / "time-table"
+"""The repository's `data/time-table` directory"""
+
+
+class CorpusYear(NamedTuple):
+    """One campus/year timetable of the corpus"""
+
+    path: Path
+    """The campus data file"""
+    campus: str
+    """Campus identifier ("62", "128", or "BCA")"""
+    year: str
+    """Year of study"""
+    timetable: dict
+    """Raw timetable data"""
+    subjects: list
+    """Subject information dictionaries"""
+    batches: tuple[str, ...]
+    """Every batch the timetable mentions, in natural order"""
+
+    @property
+    def name(self) -> str:
+        """Short label such as '2026/EVEN26/62.json:3'"""
+        return f"{'/'.join(self.path.parts[-3:])}:{self.year}"
+
+
+def corpus_years(data_root: str | Path = DATA_ROOT) -> list[CorpusYear]:
+    """
+    Load every campus/year timetable below a data root.
+
+    Args:
+        data_root (str | Path): A `data/time-table` directory.
+
+    Returns:
+        list[CorpusYear]: Each campus/year of every semester, in path order.
+    """
+    years = []
+    for semester_dir in sorted(Path(data_root).glob("*/*")):
+        if not semester_dir.is_dir():
+            continue
+        for path, campus, year in semester_jobs(semester_dir):
+            year_data = json.loads(path.read_text(encoding="utf-8"))[year]
+            timetable = year_data["timetable"]
+            subjects = year_data.get("subjects") or []
+            semester = compile_semester(campus, year, timetable, subjects)
+            years.append(
+                CorpusYear(path, campus, year, timetable, subjects, semester.batches)
+            )
+    return years
+
+
+def subject_codes(subjects: list) -> list[str]:
+    """
+    List every code a student may enter for the subjects of a timetable.
+
+    Args:
+        subjects (list): Subject information dictionaries.
+
+    Returns:
+        list[str]: Distinct short and full subject codes, in listing order.
+    """
+    codes: dict[str, None] = {}
+    for subject in subjects:
+        for key in ("Code", "Full Code"):
+            if subject.get(key):
+                codes.setdefault(subject[key], None)
+    return list(codes)
+
+
+def sample_elective_sets(
+    subjects: list, rng: random.Random, samples: int = 2, size: int = 4
+) -> list[list[str]]:
+    """
+    Pick a few elective code sets for a timetable.
+
+    Args:
+        subjects (list): Subject information dictionaries.
+        rng (random.Random): Source of the random samples.
+        samples (int): Number of random sets to add.
+        size (int): Codes per random set.
+
+    Returns:
+        list[list[str]]: No electives, every code, and `samples` random sets.
+    """
+    codes = subject_codes(subjects)
+    sets = [[], codes]
+    for _ in range(samples):
+        sets.append(rng.sample(codes, min(len(codes), size)))
+    return sets
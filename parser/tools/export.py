@@ -0,0 +1,178 @@
+"""
+Static export of every personalised timetable of a semester.
+
+Each campus/year of a semester directory is compiled once in a worker
+process and every batch is written as its own JSON shard:
+
+    <out>/<campus>/<year>/<batch>.json
+
+A `manifest.json` at the root lists every shard with its SHA-256 content
+hash and size, so a CDN or the website can cache shards by content.
+
+Given the previous release of the semester directory, only the batches a
+`SemesterDiff` marks as affected are regenerated; every other shard is left
+untouched and keeps its manifest entry and hash.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from modules.semester import compile_semester, diff_semesters, semester_jobs
+
+
+def _dump(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def export_campus_year(
+    path: Path,
+    campus: str,
+    year: str,
+    out_dir: Path,
+    previous_path: Path | None = None,
+    previous_files: dict | None = None,
+) -> tuple[dict, int]:
+    """
+    Generate and write the shards of every batch of one campus/year.
+
+    Args:
+        path (Path): The campus data file.
+        campus (str): Campus identifier ("62", "128", or "BCA").
+        year (str): Year of study ("1", "2", "3", "4", "5").
+        out_dir (Path): Root of the export.
+        previous_path (Path | None): The previous release of the campus file.
+        previous_files (dict | None): Manifest entries of the previous export
+            for this campus/year; shards of unaffected batches are kept.
+
+    Returns:
+        tuple[dict, int]: Manifest entries for the campus/year keyed by
+            relative path, and the number of shards written.
+    """
+    year_data = json.loads(path.read_text(encoding="utf-8"))[year]
+    semester = compile_semester(
+        campus, year, year_data["timetable"], year_data["subjects"]
+    )
+    previous_files = previous_files or {}
+
+    affected = None
+    if previous_path is not None and previous_path.is_file() and previous_files:
+        previous_data = json.loads(previous_path.read_text(encoding="utf-8"))
+        diff = diff_semesters(campus, year, previous_data.get(year, {}), year_data)
+        affected = set(diff.affected_batches)
+
+    shard_dir = out_dir / campus / year
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    files = {}
+    written = 0
+    for batch in semester.batches:
+        name = f"{campus}/{year}/{batch}.json"
+        if (
+            affected is not None
+            and batch not in affected
+            and name in previous_files
+            and (out_dir / name).is_file()
+        ):
+            files[name] = previous_files[name]
+            continue
+
+        electives = semester.core_subject_codes(batch)
+        content = _dump(
+            {
+                "campus": campus,
+                "year": year,
+                "batch": batch,
+                "electives_subject_codes": electives,
+                "timetable": semester.create_time_table(batch, electives),
+            }
+        )
+        (out_dir / name).write_bytes(content)
+        written += 1
+        files[name] = {
+            "campus": campus,
+            "year": year,
+            "batch": batch,
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "bytes": len(content),
+        }
+    return files, written
+
+
+def export_semester(
+    semester_dir: str | os.PathLike,
+    out_dir: str | os.PathLike,
+    workers: int | None = None,
+    previous_dir: str | os.PathLike | None = None,
+) -> tuple[dict, int]:
+    """
+    Export every campus/year/batch timetable of a semester directory.
+
+    Campus/years are generated in parallel with a process pool; pass
+    `workers=1` to stay in-process. With `previous_dir` and an existing
+    manifest in `out_dir`, only batches affected by the re-release are
+    regenerated, and shards of batches that no longer exist are removed.
+
+    Args:
+        semester_dir: A `data/time-table/<year>/<SEM>/` directory.
+        out_dir: Directory to write the shards and `manifest.json` to.
+        workers: Number of worker processes; defaults to the CPU count.
+        previous_dir: The previous release of `semester_dir`.
+
+    Returns:
+        tuple[dict, int]: The manifest that was written and the number of
+            shards written.
+    """
+    semester_dir = Path(semester_dir)
+    out_dir = Path(out_dir)
+    manifest_path = out_dir / "manifest.json"
+
+    previous_files: dict[tuple[str, str], dict] = {}
+    if previous_dir is not None and manifest_path.is_file():
+        previous_manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        for name, entry in previous_manifest.get("files", {}).items():
+            previous_files.setdefault((entry["campus"], entry["year"]), {})[
+                name
+            ] = entry
+
+    jobs = [
+        (
+            path,
+            campus,
+            year,
+            out_dir,
+            Path(previous_dir) / path.name if previous_dir is not None else None,
+            previous_files.get((campus, year)),
+        )
+        for path, campus, year in semester_jobs(semester_dir)
+    ]
+
+    if workers == 1:
+        results = [export_campus_year(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(export_campus_year, *job) for job in jobs]
+            results = [future.result() for future in futures]
+
+    files = {}
+    written = 0
+    for result_files, result_written in results:
+        files.update(result_files)
+        written += result_written
+
+    for entries in previous_files.values():
+        for name in entries:
+            if name not in files:
+                (out_dir / name).unlink(missing_ok=True)
+
+    manifest = {
+        "semester": semester_dir.name,
+        "files": dict(sorted(files.items())),
+    }
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+    return manifest, written
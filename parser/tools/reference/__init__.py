@@ -0,0 +1,14 @@
+"""
+Frozen copy of the timetable creators as they were before the optimization
+series: the string-scanning subject lookups and enrollment checks, batch
+parsing on every call and strptime-based time slots.
+
+`tools.verify` uses `create_time_table` from here as its reference, so the
+indexes and caches behind `main.create_time_table` are checked against code
+that shares none of them. Do not change these modules to follow the parser;
+a deliberate change in generated timetables has to be made here as well.
+"""
+
+from .timetable import create_time_table
+
+__all__ = ["create_time_table"]
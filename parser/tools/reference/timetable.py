@@ -0,0 +1,58 @@
+"""`create_time_table` as main.py defined it before the optimization series."""
+
+from typing import Literal
+
+from .tt_parsers.BCA.creator import creator as creator_bca
+from .tt_parsers.BCA.creator import creator_year1 as creator_bca_year1
+from .tt_parsers.sector_62.creator import time_table_creator, time_table_creator_v2
+from .tt_parsers.sector_128.creator import banado, bando_year1
+
+
+def create_time_table(
+    campus: Literal["62", "128", "BCA"],
+    year: Literal["1", "2", "3", "4", "5"],
+    time_table_json: dict,
+    subject_json: list,
+    batch: str,
+    electives_subject_codes: list[str] = [],
+) -> dict:
+    """
+    Create a personalized timetable with the original campus creators.
+
+    Args:
+        campus: Campus identifier ("62", "128", or "BCA")
+        year: Year of study ("1", "2", "3", "4", "5")
+        time_table_json: Raw timetable data
+        subject_json: List of subject information dictionaries
+        batch: User's batch (e.g., "A6", "B12", "BCA1")
+        electives_subject_codes: List of enrolled elective subject codes
+
+    Returns:
+        dict: Formatted personalized timetable
+    """
+    if year == "1":
+        if campus == "62":
+            return time_table_creator(
+                time_table_json, subject_json, batch, electives_subject_codes
+            )
+        elif campus == "BCA":
+            return creator_bca_year1(
+                time_table_json, subject_json, batch, electives_subject_codes
+            )
+        else:  # 128
+            return bando_year1(
+                time_table_json, subject_json, batch, electives_subject_codes
+            )
+    else:
+        if campus == "62":
+            return time_table_creator_v2(
+                time_table_json, subject_json, batch, electives_subject_codes
+            )
+        elif campus == "BCA":
+            return creator_bca(
+                time_table_json, subject_json, batch, electives_subject_codes
+            )
+        else:  # 128
+            return banado(
+                time_table_json, subject_json, batch, electives_subject_codes
+            )
@@ -0,0 +1,284 @@
+"""
+Differential check of the optimized entry points against the original creators.
+
+The reference is `tools.reference.create_time_table`, a frozen copy of the
+campus creators from before the optimization series, which shares none of
+the subject indexes, tokenizers, batch specs or time slot caches. Every
+fast path, `main.create_time_table` included, is run side by side with it
+over the whole `data/time-table` corpus, for every batch of every campus/year with no
+electives, each subject code on its own, and every code at once. Outputs
+are compared as serialized JSON, so key order counts as well. The first
+diverging entry of each path is reported, with the path's time relative to
+the reference.
+"""
+
+import json
+import os
+import time
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import NamedTuple
+
+import main
+from models.week_grid import ClassTable
+from modules.semester import compile_semester
+from utils.timetable import collect_timetable
+
+from . import reference
+from .corpus import DATA_ROOT, CorpusYear, corpus_years, subject_codes
+
+Case = tuple[str, list[str]]
+"""A batch and its elective subject codes"""
+
+FastPath = Callable[[CorpusYear, list[Case]], list[dict]]
+"""Produces one formatted timetable per case of a campus/year"""
+
+
+def _reference(corpus_year: CorpusYear, cases: list[Case]) -> list[dict]:
+    return [
+        reference.create_time_table(
+            corpus_year.campus,
+            corpus_year.year,
+            corpus_year.timetable,
+            corpus_year.subjects,
+            batch,
+            electives,
+        )
+        for batch, electives in cases
+    ]
+
+
+def _create_time_table(corpus_year: CorpusYear, cases: list[Case]) -> list[dict]:
+    return [
+        main.create_time_table(
+            corpus_year.campus,
+            corpus_year.year,
+            corpus_year.timetable,
+            corpus_year.subjects,
+            batch,
+            electives,
+        )
+        for batch, electives in cases
+    ]
+
+
+def _compiled(corpus_year: CorpusYear, cases: list[Case]) -> list[dict]:
+    semester = compile_semester(
+        corpus_year.campus,
+        corpus_year.year,
+        corpus_year.timetable,
+        corpus_year.subjects,
+    )
+    return [semester.create_time_table(batch, electives) for batch, electives in cases]
+
+
+def _iter_classes(corpus_year: CorpusYear, cases: list[Case]) -> list[dict]:
+    timetables = []
+    for batch, electives in cases:
+        try:
+            timetable = collect_timetable(
+                main.iter_classes(
+                    corpus_year.campus,
+                    corpus_year.year,
+                    corpus_year.timetable,
+                    corpus_year.subjects,
+                    batch,
+                    electives,
+                )
+            )
+        except Exception:
+            timetable = {}
+        timetables.append(timetable)
+    return timetables
+
+
+def _all_timetables(corpus_year: CorpusYear, cases: list[Case]) -> list[dict]:
+    by_electives: dict[tuple[str, ...], list[str]] = {}
+    for batch, electives in cases:
+        by_electives.setdefault(tuple(electives), []).append(batch)
+
+    results: dict[tuple[str, tuple[str, ...]], dict] = {}
+    for electives, batches in by_electives.items():
+        timetables = main.create_all_timetables(
+            corpus_year.campus,
+            corpus_year.year,
+            corpus_year.timetable,
+            corpus_year.subjects,
+            electives_by_batch={batch: list(electives) for batch in batches},
+            batches=batches,
+        )
+        for batch, timetable in timetables.items():
+            results[batch, electives] = timetable
+    return [results[batch, tuple(electives)] for batch, electives in cases]
+
+
+def _week_grid(corpus_year: CorpusYear, cases: list[Case]) -> list[dict]:
+    semester = compile_semester(
+        corpus_year.campus,
+        corpus_year.year,
+        corpus_year.timetable,
+        corpus_year.subjects,
+    )
+    table = ClassTable()
+    return [
+        semester.create_week_grid(batch, electives, table).to_dict()
+        for batch, electives in cases
+    ]
+
+
+def _by_handle(corpus_year: CorpusYear, cases: list[Case]) -> list[dict]:
+    key = f"verify:{corpus_year.name}"
+    main.load_semester(
+        key,
+        json.dumps(
+            {"timetable": corpus_year.timetable, "subjects": corpus_year.subjects}
+        ),
+        corpus_year.campus,
+        corpus_year.year,
+    )
+    try:
+        return [
+            json.loads(main.create_time_table_by_handle(key, batch, electives))
+            for batch, electives in cases
+        ]
+    finally:
+        main.unload_semester(key)
+
+
+FAST_PATHS: dict[str, FastPath] = {
+    "create_time_table": _create_time_table,
+    "compiled": _compiled,
+    "iter_classes": _iter_classes,
+    "create_all_timetables": _all_timetables,
+    "week_grid": _week_grid,
+    "by_handle": _by_handle,
+}
+"""Optimized entry points checked against the reference, by name"""
+
+
+class PathResult(NamedTuple):
+    """Outcome of one fast path over the corpus"""
+
+    name: str
+    """Key of the path in FAST_PATHS"""
+    cases: int
+    """Timetables compared"""
+    mismatches: int
+    """Timetables that differ from the reference"""
+    seconds: float
+    """Time spent in the path, including any per-year compilation"""
+    reference_seconds: float
+    """Time the reference took for the same cases"""
+    first_mismatch: str | None
+    """Description of the first diverging entry, if any"""
+
+    @property
+    def speedup(self) -> float | None:
+        """Reference time / path time; above 1 means the path is faster"""
+        return self.reference_seconds / self.seconds if self.seconds else None
+
+
+def elective_cases(corpus_year: CorpusYear) -> list[Case]:
+    """
+    List the batch/elective combinations checked for a campus/year.
+
+    Args:
+        corpus_year (CorpusYear): The campus/year timetable.
+
+    Returns:
+        list[Case]: Every batch, and the empty batch a blank form submits,
+            with no electives, with each subject code on its own, and with
+            every code at once.
+    """
+    codes = subject_codes(corpus_year.subjects)
+    elective_sets = [[], *([code] for code in codes), codes]
+    return [
+        (batch, electives)
+        for batch in [*corpus_year.batches, ""]
+        for electives in elective_sets
+    ]
+
+
+def first_difference(expected, actual, where: str = "") -> str | None:
+    """
+    Describe where two formatted timetables first differ.
+
+    Args:
+        expected: The reference value.
+        actual: The value to check.
+        where (str): Location of the values, for nested calls.
+
+    Returns:
+        str | None: e.g. "Monday / 09:00-09:50: {...} != {...}", or None if
+            both serialize to the same JSON.
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        if list(expected) != list(actual):
+            if set(expected) == set(actual):
+                return f"{where or 'top level'}: key order {list(expected)} != {list(actual)}"
+            missing = [key for key in expected if key not in actual]
+            extra = [key for key in actual if key not in expected]
+            return f"{where or 'top level'}: missing {missing}, unexpected {extra}"
+        for key in expected:
+            difference = first_difference(
+                expected[key], actual[key], f"{where} / {key}" if where else key
+            )
+            if difference is not None:
+                return difference
+        return None
+    expected_json = json.dumps(expected, ensure_ascii=False)
+    actual_json = json.dumps(actual, ensure_ascii=False)
+    if expected_json != actual_json:
+        return f"{where or 'top level'}: {expected_json} != {actual_json}"
+    return None
+
+
+def verify_corpus(
+    data_root: str | Path = DATA_ROOT,
+    paths: list[str] | None = None,
+) -> list[PathResult]:
+    """
+    Run each fast path next to the reference over the whole corpus.
+
+    Args:
+        data_root (str | Path): A `data/time-table` directory.
+        paths (list[str] | None): Names from FAST_PATHS; all of them if None.
+
+    Returns:
+        list[PathResult]: One result per path, in the order requested.
+    """
+    names = list(FAST_PATHS) if paths is None else paths
+    totals = {name: [0, 0, 0.0, 0.0, None] for name in names}
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        years = corpus_years(data_root)
+        for corpus_year in years:
+            cases = elective_cases(corpus_year)
+
+            start = time.perf_counter()
+            expected = _reference(corpus_year, cases)
+            reference_seconds = time.perf_counter() - start
+
+            for name in names:
+                start = time.perf_counter()
+                actual = FAST_PATHS[name](corpus_year, cases)
+                seconds = time.perf_counter() - start
+
+                total = totals[name]
+                total[0] += len(cases)
+                total[2] += seconds
+                total[3] += reference_seconds
+                for (batch, electives), want, got in zip(cases, expected, actual):
+                    if json.dumps(want, ensure_ascii=False) == json.dumps(
+                        got, ensure_ascii=False
+                    ):
+                        continue
+                    total[1] += 1
+                    if total[4] is None:
+                        total[4] = (
+                            f"{corpus_year.name} batch {batch} electives "
+                            f"{electives}: {first_difference(want, got)}"
+                        )
+
+    return [PathResult(name, *totals[name]) for name in names]
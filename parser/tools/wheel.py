@@ -0,0 +1,182 @@
+"""
+Slim, precompiled variant of the parser wheel for Pyodide.
+
+Pyodide has no persistent bytecode cache, so every visitor's browser compiles
+each imported module from source. `slim_wheel` rewrites a wheel built with
+`python -m build --wheel` so every module ships as optimized bytecode
+(`-OO`: docstrings and asserts stripped) in place of its source.
+
+Bytecode is specific to the Python minor version, so the slim wheel is
+tagged for the interpreter that builds it (e.g. `cp312-none-any`). Build it
+with the Python version of the Pyodide release the website loads.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import py_compile
+import statistics
+import subprocess
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+from .corpus import DATA_ROOT
+
+
+def _record_hash(content: bytes) -> str:
+    digest = hashlib.sha256(content).digest()
+    return "sha256=" + base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def _compile(source: bytes, arcname: str, optimize: int) -> bytes:
+    with tempfile.TemporaryDirectory() as tmp:
+        source_path = Path(tmp) / "module.py"
+        source_path.write_bytes(source)
+        compiled_path = Path(tmp) / "module.pyc"
+        py_compile.compile(
+            str(source_path),
+            cfile=str(compiled_path),
+            dfile=arcname,
+            doraise=True,
+            optimize=optimize,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+        return compiled_path.read_bytes()
+
+
+def slim_wheel(wheel: str | Path, out_dir: str | Path, optimize: int = 2) -> Path:
+    """
+    Write a sourceless copy of a pure-Python wheel.
+
+    Each `.py` file is replaced by a `.pyc` at the same path, compiled at
+    the given optimization level; the tag and RECORD are rewritten to match.
+
+    Args:
+        wheel (str | Path): A `*-py3-none-any.whl` file.
+        out_dir (str | Path): Directory to write the slim wheel to.
+        optimize (int): 1 strips asserts, 2 also strips docstrings.
+
+    Returns:
+        Path: The slim wheel, e.g. `<name>-<version>-cp312-none-any.whl`.
+    """
+    wheel = Path(wheel)
+    name, version, *_ = wheel.stem.split("-")
+    python_tag = f"cp{sys.version_info.major}{sys.version_info.minor}"
+    dist_info = f"{name}-{version}.dist-info"
+
+    files: dict[str, bytes] = {}
+    with zipfile.ZipFile(wheel) as source:
+        for info in source.infolist():
+            if info.is_dir() or info.filename == f"{dist_info}/RECORD":
+                continue
+            content = source.read(info)
+            arcname = info.filename
+            if arcname.endswith(".py"):
+                content = _compile(content, arcname, optimize)
+                arcname += "c"
+            elif arcname == f"{dist_info}/WHEEL":
+                content = (
+                    content.decode("utf-8")
+                    .replace("Tag: py3-none-any", f"Tag: {python_tag}-none-any")
+                    .encode("utf-8")
+                )
+            files[arcname] = content
+
+    record = io.StringIO()
+    for arcname, content in files.items():
+        record.write(f"{arcname},{_record_hash(content)},{len(content)}\n")
+    record.write(f"{dist_info}/RECORD,,\n")
+    files[f"{dist_info}/RECORD"] = record.getvalue().encode("utf-8")
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    target = out_dir / f"{name}-{version}-{python_tag}-none-any.whl"
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as out:
+        for arcname, content in files.items():
+            info = zipfile.ZipInfo(arcname, date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            out.writestr(info, content)
+    return target
+
+
+_TIMING_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+data = json.loads(open(sys.argv[2], encoding="utf-8").read())["3"] if sys.argv[2] else None
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+if data is not None:
+    main.create_time_table("62", "3", data["timetable"], data["subjects"], "B12", [])
+done = time.perf_counter()
+print(json.dumps({"import": imported - start, "first_timetable": done - start,
+    "modules": sorted(m for m in sys.modules if m.split(".")[0] in ("main", "models", "modules", "utils"))}))
+"""
+
+
+def _measure_imports(site_dir: Path, sample: Path | None, runs: int) -> dict:
+    """Median cold import and first-timetable times of the extracted wheel"""
+    samples = []
+    for _ in range(runs):
+        # -B: nothing is cached between runs, as in a fresh Pyodide session.
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-B",
+                "-I",
+                "-c",
+                _TIMING_SCRIPT,
+                str(site_dir),
+                str(sample or ""),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(json.loads(result.stdout))
+    return {
+        "import_ms": round(statistics.median(s["import"] for s in samples) * 1000, 2),
+        "first_timetable_ms": round(
+            statistics.median(s["first_timetable"] for s in samples) * 1000, 2
+        ),
+        "modules_after_import": len(samples[0]["modules"]),
+    }
+
+
+def wheel_report(wheel: str | Path, slim: str | Path, runs: int = 10) -> dict:
+    """
+    Compare the size and cold-start time of a wheel and its slim copy.
+
+    Each wheel is extracted to a temporary directory and imported in fresh
+    interpreters without a bytecode cache, which is what a Pyodide visitor
+    pays on every page load.
+
+    Args:
+        wheel (str | Path): The regular source wheel.
+        slim (str | Path): Its `slim_wheel` copy.
+        runs (int): Interpreter launches per wheel; the median is reported.
+
+    Returns:
+        dict: Per wheel: file size, uncompressed size, median `import main`
+            time, median time to the first Sector 62 timetable, and the
+            number of parser modules loaded by `import main`.
+    """
+    sample = DATA_ROOT / "2026" / "EVEN26" / "62.json"
+    report = {"python": sys.version.split()[0], "runs": runs}
+    for label, path in (("wheel", Path(wheel)), ("slim", Path(slim))):
+        with tempfile.TemporaryDirectory() as site_dir:
+            with zipfile.ZipFile(path) as archive:
+                archive.extractall(site_dir)
+                unpacked = sum(info.file_size for info in archive.infolist())
+            report[label] = {
+                "file": path.name,
+                "bytes": path.stat().st_size,
+                "unpacked_bytes": unpacked,
+                **_measure_imports(
+                    Path(site_dir), sample if sample.is_file() else None, runs
+                ),
+            }
+    return report
@@ -1,13 +1,24 @@
-from .batch import parse_batch_numbers, is_elective, is_batch_included, batch_extractor
+from .batch import (
+    parse_batch_numbers,
+    is_elective,
+    is_batch_included,
+    batch_extractor,
+    BatchSpec,
+    batch_spec,
+)
 from .subject import (
     subject_extractor,
     subject_name_extractor,
     is_enrolled_subject,
     do_you_have_subject,
     type_extractor,
+    SubjectIndex,
+    EnrolledSubjects,
 )
 from .location import location_extractor
-from .time import process_day, convert_time_format, process_timeslot
+from .time import process_day, convert_time_format, parse_timeslot, process_timeslot
+from .tokenizer import tokenize
+from .timetable import collect_timetable
 from .debug import pprint
 
 __all__ = [
@@ -15,14 +26,21 @@ __all__ = [
     "is_elective",
     "is_batch_included",
     "batch_extractor",
+    "BatchSpec",
+    "batch_spec",
     "subject_extractor",
     "subject_name_extractor",
     "is_enrolled_subject",
     "do_you_have_subject",
     "type_extractor",
+    "SubjectIndex",
+    "EnrolledSubjects",
     "location_extractor",
     "process_day",
     "convert_time_format",
+    "parse_timeslot",
     "process_timeslot",
+    "tokenize",
+    "collect_timetable",
     "pprint",
 ]
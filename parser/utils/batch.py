@@ -3,6 +3,11 @@ Batch parsing and matching utilities.
 """
 
 import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from models.parsed_entry import ParsedEntry
 
 
 def parse_batch_numbers(batch_input: str) -> list[str]:
@@ -79,7 +84,9 @@ def parse_batch_numbers(batch_input: str) -> list[str]:
                     if re.search(r"\d+", part)
                 ]
                 if numbers:
-                    result.extend(f"{prefix}{i}" for i in range(numbers[0], numbers[-1] + 1))
+                    result.extend(
+                        f"{prefix}{i}" for i in range(numbers[0], numbers[-1] + 1)
+                    )
             else:
                 result.append(r.strip())
 
@@ -105,7 +112,7 @@ def parse_batch_numbers(batch_input: str) -> list[str]:
 
 
 def is_elective(
-    extracted_batch: str, subject_code: str, extracted_batches: list[str]
+    extracted_batch: str, subject_code: str, extracted_batches: Sequence[str]
 ) -> bool:
     """
     Check if a subject entry represents an elective subject.
@@ -135,30 +142,102 @@ def is_elective(
     return False
 
 
-def is_batch_included(search_batch: str, extracted_batch_input: str) -> bool:
+def is_elective_entry(entry: ParsedEntry) -> bool:
     """
-    Check if a batch is included in the batch input string.
+    Check if a tokenized class string is an elective, by `is_elective`.
+
+    Args:
+        entry (ParsedEntry): The tokenized class string.
+
+    Returns:
+        bool: True if the subject is an elective, False otherwise.
+    """
+    return is_elective(entry.batch_raw, entry.code, entry.batches)
+
+
+@dataclass(frozen=True, slots=True)
+class BatchSpec:
+    """
+    Compiled batch membership for one batch specification string.
+
+    Attributes:
+        batches: Concrete batches listed by the specification.
+        letters: Single-letter wildcards; any batch starting with one matches.
+        match_all: True when the specification is empty and matches every batch.
+    """
+
+    batches: frozenset[str]
+    letters: frozenset[str]
+    match_all: bool = False
+
+    @classmethod
+    def from_batches(cls, batch_list: Iterable[str]) -> "BatchSpec":
+        """
+        Build a spec from parsed batches, splitting out single-letter wildcards.
+
+        Args:
+            batch_list: Batches as returned by a campus batch parser.
+
+        Returns:
+            BatchSpec: The compiled specification.
+        """
+        batches = frozenset(batch_list)
+        return cls(batches, frozenset(b for b in batches if len(b) == 1))
+
+    def includes(self, search_batch: str) -> bool:
+        """
+        Check if a batch is matched by this specification.
+
+        Args:
+            search_batch: Batch to search for (e.g., 'A6' or 'B').
+
+        Returns:
+            bool: True if batch is included, False otherwise.
+
+        Raises:
+            IndexError: If search_batch is empty and the specification has a
+                letter wildcard; timetable creators treat that as a failed
+                build, as they always have.
+        """
+        return (
+            self.match_all
+            or search_batch in self.batches
+            or bool(self.letters)
+            and search_batch[0] in self.letters
+        )
+
+
+MATCH_ALL = BatchSpec(frozenset(), frozenset(), match_all=True)
+
+
+@lru_cache(maxsize=8192)
+def batch_spec(extracted_batch_input: str) -> BatchSpec:
+    """
+    Compile a batch input string into a cached `BatchSpec`.
 
     Args:
-        search_batch: Batch to search for (e.g., 'A6' or 'B').
         extracted_batch_input: Input string containing batch specifications.
 
     Returns:
-        bool: True if batch is included, False otherwise.
+        BatchSpec: The compiled specification; empty input matches every batch.
     """
     if not extracted_batch_input:
-        return True
+        return MATCH_ALL
+    return BatchSpec.from_batches(parse_batch_numbers(extracted_batch_input.strip()))
 
-    batch_list = parse_batch_numbers(extracted_batch_input.strip())
 
-    if search_batch in batch_list:
-        return True
+def is_batch_included(search_batch: str, extracted_batch_input: str) -> bool:
+    """
+    Check if a batch is included in the batch input string.
 
-    for batch in batch_list:
-        if len(batch) == 1 and search_batch[0] == batch:
-            return True
+    Args:
+        search_batch: Batch to search for (e.g., 'A6' or 'B').
+        extracted_batch_input: Input string containing batch specifications.
 
-    return False
+    Returns:
+        bool: True if batch is included, False otherwise.
+    """
+    return batch_spec(extracted_batch_input).includes(search_batch)
 
 
 def batch_extractor(text: str) -> str:
@@ -0,0 +1,159 @@
+"""
+Opt-in stage timing for timetable generation.
+
+While a `Profile` is active, the hooked functions are swapped for timing
+wrappers on their module or class, and put back on exit. Nothing is wrapped
+otherwise, so generation pays no profiling cost unless a profile is running.
+"""
+
+import time
+from collections.abc import Callable, Iterable
+from typing import NamedTuple
+
+
+class Hook(NamedTuple):
+    """A function to time, looked up as `owner.<name>`"""
+
+    owner: object
+    """Module or class the function is called through"""
+    name: str
+    """Attribute name of the function on owner"""
+    stage: str
+    """Stage the function's time is reported under"""
+
+
+def module_hooks(module: object, stages: dict[str, str]) -> list[Hook]:
+    """
+    Build hooks for module-level functions.
+
+    Args:
+        module (object): The module the functions are called through.
+        stages (dict[str, str]): Function name -> stage name.
+
+    Returns:
+        list[Hook]: One hook per function present in the module.
+    """
+    return [
+        Hook(module, name, stage)
+        for name, stage in stages.items()
+        if callable(vars(module).get(name))
+    ]
+
+
+_active: "Profile | None" = None
+
+
+class Profile:
+    """
+    Per-stage wall time, call counts and cache statistics of the calls made
+    while the profile is active, used as a context manager.
+
+    Times are exclusive: a hooked call made inside another one (such as
+    process_timeslot inside _scheduled_class) only counts towards the inner
+    call's stage. Profiles do not nest and are not thread-safe.
+    """
+
+    def __init__(
+        self, hooks: Iterable[Hook], caches: dict[str, Callable] | None = None
+    ) -> None:
+        """
+        Args:
+            hooks (Iterable[Hook]): Functions to time.
+            caches (dict[str, Callable] | None): `functools.lru_cache` functions
+                whose hits and misses are reported, by name.
+        """
+        self.hooks = list(hooks)
+        self.caches = caches or {}
+        self.total_seconds = 0.0
+        self._calls: dict[str, list] = {}
+        self._cache_before: dict[str, tuple[int, int]] = {}
+        self._cache_after: dict[str, tuple[int, int]] = {}
+        self._originals: list[tuple[object, str, object]] = []
+        self._stack: list[float] = []
+        self._start = 0.0
+
+    def _timed(self, function: Callable, record: list) -> Callable:
+        stack = self._stack
+        perf_counter = time.perf_counter
+
+        def timed(*args, **kwargs):
+            stack.append(0.0)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                nested = stack.pop()
+                record[1] += 1
+                record[2] += elapsed - nested
+                if stack:
+                    stack[-1] += elapsed
+
+        return timed
+
+    def __enter__(self) -> "Profile":
+        global _active
+        if _active is not None:
+            raise RuntimeError("another Profile is already active")
+        _active = self
+
+        for name, cached in self.caches.items():
+            info = cached.cache_info()
+            self._cache_before[name] = (info.hits, info.misses)
+
+        for owner, name, stage in self.hooks:
+            original = vars(owner)[name]
+            key = f"{owner.__name__}.{name}" if isinstance(owner, type) else name
+            record = self._calls.setdefault(key, [stage, 0, 0.0])
+            self._originals.append((owner, name, original))
+            setattr(owner, name, self._timed(original, record))
+
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _active
+        self.total_seconds += time.perf_counter() - self._start
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals.clear()
+        self._stack.clear()
+
+        for name, cached in self.caches.items():
+            info = cached.cache_info()
+            self._cache_after[name] = (info.hits, info.misses)
+        _active = None
+
+    def as_dict(self) -> dict:
+        """
+        Summarize the profile.
+
+        Returns:
+            dict: `total_seconds`; `stages` and `functions` with exclusive
+                `seconds` and `calls`; `unhooked_seconds` spent outside any
+                hooked function; and `caches` with `hits` and `misses`.
+        """
+        stages: dict[str, dict] = {}
+        functions = {}
+        for name, (stage, calls, seconds) in self._calls.items():
+            functions[name] = {"stage": stage, "calls": calls, "seconds": seconds}
+            totals = stages.setdefault(stage, {"calls": 0, "seconds": 0.0})
+            totals["calls"] += calls
+            totals["seconds"] += seconds
+
+        caches = {}
+        for name, (hits, misses) in self._cache_after.items():
+            hits_before, misses_before = self._cache_before[name]
+            caches[name] = {
+                "hits": hits - hits_before,
+                "misses": misses - misses_before,
+            }
+
+        hooked = sum(stage["seconds"] for stage in stages.values())
+        return {
+            "total_seconds": self.total_seconds,
+            "stages": stages,
+            "functions": functions,
+            "unhooked_seconds": max(self.total_seconds - hooked, 0.0),
+            "caches": caches,
+        }
@@ -155,6 +155,157 @@ def is_enrolled_subject(
     return False, None
 
 
+class SubjectIndex:
+    """
+    Precomputed lookup tables over a subjects list.
+
+    Every code variant accepted by `subject_name_extractor` and
+    `is_enrolled_subject` is mapped to the position of the subject it belongs
+    to, so lookups are dictionary hits instead of a scan over all subjects.
+    Results match the scanning functions, including their first-match order.
+
+    Args:
+        subject_json (list[dict]): A list of `{Code, Full Code, Subject}` dicts.
+    """
+
+    __slots__ = ("subjects", "_exact_names", "_stripped_names", "_enrolment_variants")
+
+    def __init__(self, subject_json: list[dict]) -> None:
+        self.subjects: list[dict] = subject_json if isinstance(subject_json, list) else []
+        self._exact_names: dict[str, int] = {}
+        self._stripped_names: dict[str, int] = {}
+        self._enrolment_variants: dict[str, list[int]] = {}
+
+        for position, subject in enumerate(self.subjects):
+            if not isinstance(subject, dict) or not isinstance(subject.get("Code"), str):
+                continue
+            code = subject["Code"]
+            full_code = subject.get("Full Code")
+
+            self._exact_names.setdefault(code, position)
+            name_patterns = [code[1:]]
+            enrolment_patterns = [code[1:]]
+            if code.find("/") != -1:
+                enrolment_patterns.append(code.split("/")[0].strip())
+
+            if isinstance(full_code, str):
+                patterns = [
+                    full_code,
+                    full_code[:2] + code,
+                    full_code[3:],
+                    full_code[2:],
+                    full_code[:5] + code,
+                    full_code[2:5] + code,
+                    full_code[3:5] + code,
+                ]
+                name_patterns.extend(patterns)
+                enrolment_patterns.extend(patterns)
+
+            for pattern in name_patterns:
+                self._stripped_names.setdefault(pattern.strip(), position)
+            for pattern in dict.fromkeys(enrolment_patterns):
+                self._enrolment_variants.setdefault(pattern, []).append(position)
+
+    def subject_name(self, code: str) -> str:
+        """
+        Look up a subject name by its code; same result as `subject_name_extractor`.
+
+        Args:
+            code (str): The subject code to look up.
+
+        Returns:
+            str: The subject name if found, otherwise the provided code.
+        """
+        exact = self._exact_names.get(code)
+        stripped = self._stripped_names.get(code.strip())
+        if exact is None and stripped is None:
+            return code
+        if exact is None or (stripped is not None and stripped < exact):
+            exact = stripped
+        return self.subjects[exact].get("Subject", code)  # type: ignore
+
+    def resolve(self, code: str) -> tuple[str, tuple[dict, ...]]:
+        """
+        Return everything name and enrollment lookups of a code depend on.
+
+        Two indexes that resolve a code identically give the same results for
+        it in `subject_name` and in `EnrolledSubjects.check`, whatever the
+        enrolled codes are.
+
+        Args:
+            code (str): The subject code to resolve.
+
+        Returns:
+            tuple[str, tuple[dict, ...]]: The subject name and the subjects
+                whose code variants match the code, in lookup order.
+        """
+        return self.subject_name(code), tuple(
+            self.subjects[position] for position in self._enrolment_variants.get(code, ())
+        )
+
+    def enrolled(self, enrolled_subject_codes: list[str]) -> "EnrolledSubjects":
+        """
+        Bind this index to a student's enrolled subject codes.
+
+        Args:
+            enrolled_subject_codes (list[str]): Subject codes the user is enrolled in.
+
+        Returns:
+            EnrolledSubjects: A matcher answering `is_enrolled_subject` queries.
+        """
+        return EnrolledSubjects(self, enrolled_subject_codes)
+
+
+class EnrolledSubjects:
+    """
+    Enrollment matcher for one set of enrolled subject codes over a `SubjectIndex`.
+
+    The combined code set (raw codes plus their slash-stripped forms) is built
+    once, and answers are memoized per subject code.
+    """
+
+    __slots__ = ("index", "codes", "combined_codes", "_memo")
+
+    def __init__(self, index: SubjectIndex, enrolled_subject_codes: list[str]) -> None:
+        self.index = index
+        self.codes = frozenset(enrolled_subject_codes)
+        self.combined_codes = self.codes | {
+            sub.split("/")[0].strip() for sub in enrolled_subject_codes if sub.find("/") != -1
+        }
+        self._memo: dict[str, tuple[bool, dict | None]] = {}
+
+    def check(self, subject_code: str) -> tuple[bool, dict | None]:
+        """
+        Check if a subject code is enrolled; same result as `is_enrolled_subject`.
+
+        Args:
+            subject_code (str): The specific subject code to check.
+
+        Returns:
+            A tuple of (is_enrolled, subject_details_or_None).
+        """
+        result = self._memo.get(subject_code)
+        if result is not None:
+            return result
+
+        result = (False, None)
+        if subject_code in self.codes:
+            result = (True, None)
+        else:
+            subjects = self.index.subjects
+            for position in self.index._enrolment_variants.get(subject_code, ()):
+                subject = subjects[position]
+                if (
+                    subject["Code"] in self.combined_codes
+                    or subject.get("Full Code") in self.combined_codes
+                ):
+                    result = (True, subject)
+                    break
+
+        self._memo[subject_code] = result
+        return result
+
+
 def do_you_have_subject(subject_codes: list[str], subject_code: str) -> bool:
     """
     Check if a subject code exists in a list of subject codes.
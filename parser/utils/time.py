@@ -3,8 +3,14 @@ Time and day processing utilities.
 """
 
 from datetime import datetime
+from functools import lru_cache
 import re
 
+from models.time_slot import TimeSlot
+
+# The pattern datetime.strptime builds for "%I:%M %p".
+_CLOCK_12H = re.compile(r"(1[0-2]|0[1-9]|[1-9]):([0-5]\d|\d)\s+(am|pm)", re.IGNORECASE)
+
 
 def process_day(day_str: str) -> str:
     """
@@ -73,16 +79,49 @@ def convert_time_format(time_str: str) -> str:
         raise ValueError(f"Error parsing time string '{time_str}': {e}")
 
 
-def process_timeslot(timeslot: str, type: str = "L") -> tuple[str, str]:
+def _clock_minutes(time_str: str) -> int:
     """
-    Process a raw timeslot string into (start, end) times in 24-hour format.
+    Convert a 12-hour time string to minutes since midnight.
+
+    Accepts exactly the strings `convert_time_format` accepts.
+
+    Args:
+        time_str (str): The time string to convert (e.g., '9:00 AM').
+
+    Returns:
+        int: Minutes since midnight (e.g., 540).
+    """
+    time_str = time_str.strip().replace(" ", "")
+
+    if "AM" in time_str or "PM" in time_str:
+        if ":" not in time_str:
+            time_str = time_str.replace("AM", ":00 AM").replace("PM", ":00 PM")
+
+    time_str = time_str.replace("AM", " AM").replace("PM", " PM")
+
+    match = _CLOCK_12H.fullmatch(time_str)
+    if match is None:
+        raise ValueError(f"Error parsing time string '{time_str}'")
+    hour = int(match[1]) % 12
+    if match[3].upper() == "PM":
+        hour += 12
+    return hour * 60 + int(match[2])
+
+
+@lru_cache(maxsize=1024)
+def parse_timeslot(timeslot: str, type: str = "L") -> TimeSlot:
+    """
+    Parse a raw timeslot label into a TimeSlot.
+
+    A semester only uses a handful of distinct labels, so results are
+    memoized per (label, type).
 
     Args:
         timeslot (str): The timeslot string (e.g., '9-10.50', '12 NOON-1').
         type (str): Class type — 'P' adds one hour to the end time.
 
     Returns:
-        tuple[str, str]: (start_time, end_time) in HH:MM format.
+        TimeSlot: The parsed slot; 00:00-00:00 if the label cannot be parsed.
     """
     try:
         timeslot = timeslot.replace("12 NOON", "12:00 PM").replace("NOON", "12:00 PM")
@@ -113,29 +152,36 @@ def process_timeslot(timeslot: str, type: str = "L") -> tuple[str, str]:
             else:
                 end_time += " AM"
 
-        start_time_24 = convert_time_format(start_time)
-        end_time_24 = convert_time_format(end_time)
+        start = _clock_minutes(start_time)
+        end = _clock_minutes(end_time)
 
         if type == "P":
-            end_hour = int(end_time_24.split(":")[0])
-            end_min = end_time_24.split(":")[1]
-            end_hour = (end_hour + 1) % 24
-            end_time_24 = f"{end_hour:02d}:{end_min}"
+            end = (end + 60) % (24 * 60)
 
-        if start_time_24 == "00:00":
-            start_time_24 = "12:00"
+        if start == 0:
+            start = 12 * 60
 
-        if end_time_24[3:] == "50":
-            end_time_24 = f"{int(end_time_24[:2])+1}00"
+        # Slots ending at :50 are shown as ending on the hour
+        if end % 60 == 50:
+            end += 10
 
-        if end_time_24.find(":") == -1:
-            if len(end_time_24) == 3:
-                end_time_24 = f"0{end_time_24[0]}:{end_time_24[1:]}"
-            elif len(end_time_24) == 4:
-                end_time_24 = f"{end_time_24[:2]}:{end_time_24[2:]}"
-
-        return start_time_24, end_time_24
+        return TimeSlot(start, end)
 
     except Exception as e:
         print(f"Error processing timeslot '{timeslot}': {e}")
-        return "00:00", "00:00"
+        return TimeSlot(0, 0)
+
+
+def process_timeslot(timeslot: str, type: str = "L") -> tuple[str, str]:
+    """
+    Process a raw timeslot string into (start, end) times in 24-hour format.
+
+    Args:
+        timeslot (str): The timeslot string (e.g., '9-10.50', '12 NOON-1').
+        type (str): Class type — 'P' adds one hour to the end time.
+
+    Returns:
+        tuple[str, str]: (start_time, end_time) in HH:MM format.
+    """
+    slot = parse_timeslot(timeslot, type)
+    return slot.start_time, slot.end_time
@@ -0,0 +1,29 @@
+"""
+Assembly of formatted timetables from scheduled classes.
+"""
+
+from collections.abc import Iterable
+
+from models.scheduled_class import ScheduledClass
+
+
+def collect_timetable(classes: Iterable[ScheduledClass]) -> dict:
+    """
+    Build the formatted timetable dict from scheduled classes.
+
+    Days and slots keep their first-seen order; a later class in the same
+    day and slot replaces the earlier one.
+
+    Args:
+        classes (Iterable[ScheduledClass]): Classes in timetable order.
+
+    Returns:
+        dict: Day -> 'start-end' slot -> {subject_name, type, location}.
+    """
+    formatted_timetable = {}
+    for scheduled in classes:
+        day_slots = formatted_timetable.get(scheduled.day)
+        if day_slots is None:
+            day_slots = formatted_timetable[scheduled.day] = {}
+        day_slots[scheduled.slot] = scheduled.info()
+    return formatted_timetable
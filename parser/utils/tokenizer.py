@@ -0,0 +1,56 @@
+"""
+Single-pass tokenizer for Sector 62 style class strings.
+"""
+
+from functools import lru_cache
+
+from models.parsed_entry import ParsedEntry
+
+from .batch import batch_extractor, parse_batch_numbers
+from .subject import subject_extractor
+
+
+@lru_cache(maxsize=16384)
+def tokenize(text: str) -> ParsedEntry:
+    """
+    Parse a class string such as 'LB3,B4(CI121)-CR325/ANP' into its fields.
+
+    The common `<type><batches>(<code>)-<location>/<faculty>` shape is split
+    with a single scan; other shapes fall back to `batch_extractor` and
+    `subject_extractor`, so every field matches the individual extractors.
+    Results are memoized per string.
+
+    Args:
+        text (str): The raw class string from the timetable.
+
+    Returns:
+        ParsedEntry: The parsed fields of the class string.
+    """
+    stripped = text.strip()
+
+    open_idx = stripped.find("(")
+    close_idx = stripped.find(")", open_idx) if open_idx != -1 else -1
+    if close_idx != -1:
+        batch_raw = stripped[1:open_idx].strip()
+        code = stripped[open_idx + 1 : close_idx]
+    else:
+        batch_raw = batch_extractor(stripped)
+        code = subject_extractor(stripped)
+
+    dash_idx = stripped.rfind("-")
+    if dash_idx == -1:
+        location = stripped
+        faculty = ""
+    else:
+        location, _, faculty = stripped[dash_idx + 1 :].partition("/")
+        location = location.strip()
+        faculty = faculty.strip()
+
+    return ParsedEntry(
+        type=stripped[:1],
+        batch_raw=batch_raw,
+        batches=tuple(parse_batch_numbers(batch_raw)),
+        code=code,
+        location=location,
+        faculty=faculty,
+    )
@@ -569,21 +569,45 @@ export default function CompareTimetables() {
 		return (mapping as Record<string, any>)?.[year]?.subjects || [];
 	};
 
-	// Calculate stats
-	const freeSlotCount = useMemo(() => {
+	// Calculate stats. Slots are merged "HH:MM-HH:MM" ranges of any length,
+	// so the totals are in hours rather than a count of slots.
+	const slotMinutes = (slot: string) => {
+		const [start, end] = slot.split("-").map((time) => {
+			const [hours, minutes] = time.split(":").map(Number);
+			return hours * 60 + (minutes || 0);
+		});
+		return Number.isFinite(end - start) ? Math.max(end - start, 0) : 0;
+	};
+
+	const formatHours = (minutes: number) =>
+		`${Number((minutes / 60).toFixed(2))}h`;
+
+	const freeMinutes = useMemo(() => {
 		if (!compareResult?.common_free_slots) return 0;
 		return Object.values(compareResult.common_free_slots).reduce(
 			(acc: number, slots: any) =>
-				acc + (Array.isArray(slots) ? slots.length : 0),
+				acc +
+				(Array.isArray(slots)
+					? slots.reduce(
+							(sum: number, slot: string) => sum + slotMinutes(slot),
+							0
+					  )
+					: 0),
 			0
 		);
 	}, [compareResult]);
 
-	const classesTogetherCount = useMemo(() => {
+	const classesTogetherMinutes = useMemo(() => {
 		if (!compareResult?.classes_together) return 0;
 		return Object.values(compareResult.classes_together).reduce(
 			(acc: number, slots: any) =>
-				acc + (typeof slots === "object" ? Object.keys(slots).length : 0),
+				acc +
+				(typeof slots === "object"
+					? Object.keys(slots).reduce(
+							(sum: number, slot: string) => sum + slotMinutes(slot),
+							0
+					  )
+					: 0),
 			0
 		);
 	}, [compareResult]);
@@ -763,7 +787,7 @@ export default function CompareTimetables() {
 										<h3 className="text-xl font-bold text-white tracking-tight">
 											Common Free Slots{" "}
 											<span className="text-[#F0BB78]/60 ml-2 text-lg">
-												({freeSlotCount})
+												({formatHours(freeMinutes)})
 											</span>
 										</h3>
 									</div>
@@ -801,7 +825,12 @@ export default function CompareTimetables() {
 																	{day}
 																</h4>
 																<span className="text-[10px] font-medium text-slate-400 px-2 py-0.5 rounded-md border border-white/10">
-																	{slots.length} slots
+																	{formatHours(
+																		slots.reduce(
+																			(sum, slot) => sum + slotMinutes(slot),
+																			0
+																		)
+																	)}
 																</span>
 															</div>
 															<div className="p-4 flex-1">
@@ -835,7 +864,7 @@ export default function CompareTimetables() {
 										<h3 className="text-xl font-bold text-white tracking-tight">
 											Classes Together{" "}
 											<span className="text-[#F0BB78]/60 ml-2 text-lg">
-												({classesTogetherCount})
+												({formatHours(classesTogetherMinutes)})
 											</span>
 										</h3>
 									</div>
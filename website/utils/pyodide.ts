@@ -59,9 +59,11 @@ export async function initializePyodide() {
     const wheelURL = `${window.location.origin}${wheelPath}`;
     await micropip.install(wheelURL);
     
-    // Import the main module to make functions available
+    // Import the main module to make functions available. compare_timetables
+    // is left out: main loads it (and the campus parsers) on first use.
     await pyodideInstance.runPython(`
-from main import create_time_table, compare_timetables, create_and_compare_timetable
+from main import create_time_table, create_and_compare_timetable
+from main import load_semester, unload_semester, create_time_table_by_handle
     `);
     
     pyodideLoaded = true;
@@ -108,9 +110,60 @@ interface TimetableArgs {
   electives_subject_codes: string[]
 }
 
+// Semesters loaded into Python, per timetable object and campus/year. The
+// timetable JSON is serialized and compiled once; later calls only pass the
+// handle, batch and electives across the FFI.
+interface ResidentSemester {
+  subjects: Subject[];
+  key: string;
+}
+const residentSemesters = new WeakMap<object, Map<string, ResidentSemester>>();
+let nextSemesterKey = 0;
+const semesterFinalizer = new FinalizationRegistry<string>((key) => {
+  const unloadFn = pyodideInstance?.globals.get('unload_semester');
+  if (unloadFn) unloadFn(key);
+});
+
+function residentSemesterKey(
+  pyodide: PyodideInterface,
+  campus: string,
+  year: string,
+  args: TimetableArgs
+): string {
+  let byCampusYear = residentSemesters.get(args.time_table_json);
+  if (!byCampusYear) {
+    byCampusYear = new Map();
+    residentSemesters.set(args.time_table_json, byCampusYear);
+  }
+  const slot = `${campus}:${year}`;
+  const resident = byCampusYear.get(slot);
+  if (resident && resident.subjects === args.subject_json) {
+    return resident.key;
+  }
+
+  const loadFn = pyodide.globals.get('load_semester');
+  if (!loadFn || typeof loadFn !== 'function') {
+    throw new Error('load_semester function not available');
+  }
+  const key = `${slot}:${nextSemesterKey++}`;
+  loadFn(
+    key,
+    JSON.stringify({ timetable: args.time_table_json, subjects: args.subject_json }),
+    campus,
+    year
+  );
+  if (resident) {
+    pyodide.globals.get('unload_semester')(resident.key);
+  }
+  byCampusYear.set(slot, { subjects: args.subject_json, key });
+  semesterFinalizer.register(args.time_table_json, key);
+  return key;
+}
+
 /**
  * Create a personalized timetable using the unified create_time_table function.
- * This replaces the old function selector logic.
+ * The semester is kept resident in Python, so switching batches or electives
+ * only sends the handle, batch and electives across and returns a JSON string.
  */
 export async function callTimeTableCreator(
   campus: string,
@@ -120,30 +173,22 @@ export async function callTimeTableCreator(
   console.log('callTimeTableCreator called with:', { campus, year, batch: args.batch, electives: args.electives_subject_codes });
   const pyodide = (await initializePyodide()) as PyodideInterface;
   try {
-    console.log('Pyodide initialized, getting create_time_table function...');
-    const createFn = pyodide.globals.get('create_time_table');
+    const createFn = pyodide.globals.get('create_time_table_by_handle');
     if (!createFn || typeof createFn !== 'function') {
-      console.error('create_time_table function not available');
-      console.log('Available globals:', Object.keys(pyodide.globals.toJs()));
-      throw new Error('create_time_table function not available');
+      console.error('create_time_table_by_handle function not available');
+      throw new Error('create_time_table_by_handle function not available');
     }
-    
-    console.log('Converting arguments to Python...');
-    const pyCampus = pyodide.toPy(campus);
-    const pyYear = pyodide.toPy(year);
-    const pyTimeTable = pyodide.toPy(args.time_table_json);
-    const pySubjects = pyodide.toPy(args.subject_json);
-    const pyBatch = pyodide.toPy(args.batch);
+
+    const key = residentSemesterKey(pyodide, campus, year, args);
     const pyElectives = pyodide.toPy(args.electives_subject_codes);
-    
-    console.log('Calling create_time_table...');
-    const result = createFn(pyCampus, pyYear, pyTimeTable, pySubjects, pyBatch, pyElectives);
-    console.log('create_time_table returned, converting to JS...');
-    const jsResult = result.toJs();
-    console.log('Result:', jsResult);
-    return jsResult;
+    try {
+      const result: string = createFn(key, args.batch, pyElectives);
+      return JSON.parse(result);
+    } finally {
+      pyElectives.destroy();
+    }
   } catch (error) {
-    console.error('Error calling create_time_table:', error);
+    console.error('Error calling create_time_table_by_handle:', error);
     throw error;
   }
 }
@@ -189,7 +234,7 @@ export async function callCompareTimetables(
 ): Promise<any> {
   const pyodide = (await initializePyodide()) as PyodideInterface;
   try {
-    const compareFn = pyodide.globals.get('compare_timetables');
+    const compareFn = pyodide.pyimport('main').compare_timetables;
     if (!compareFn || typeof compareFn !== 'function') {
       throw new Error('compare_timetables function not available');
     }